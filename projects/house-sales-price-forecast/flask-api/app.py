@@ -1,50 +1,303 @@
-from flask import Flask, request, jsonify
+import json
+import tempfile
+from functools import partial
+import shutil
+import time
+from flask import Flask, Response, g, request, jsonify, stream_with_context
+from werkzeug.exceptions import HTTPException
 import pandas as pd
-from models.model_handler import ModelHandler
+from models.model_handler import ModelHandler, ModelNotReadyError
+from models.batcher import MicroBatcher
+from models.batch_scoring import infer_file_format, read_chunks, read_json_chunks, score_chunks, score_records_ndjson
+from models.metrics import PredictionMetrics
+from models.schema import predict_valid_columns, predict_valid_records
+from models.wire_formats import COLUMNAR_CONTENT_TYPES, decode_columns, encode_response, negotiate_response_type
 from config import Config
+from request_args import parse_positive_int, parse_top_k
+from request_logging import setup_logging, sample_payload
 import logging
 
-# Configurar logs
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configurar logs (estruturados em JSON e escritos fora da thread da requisição)
+setup_logging(level=Config.LOG_LEVEL, json_format=Config.LOG_JSON, use_queue=Config.LOG_QUEUE_ENABLED)
 logger = logging.getLogger(__name__)
 
 # Inicializar o Flask
 app = Flask(__name__)
 
+# Métricas de latência e vazão (Prometheus), expostas em /metrics
+metrics = PredictionMetrics(enabled=Config.METRICS_ENABLED)
+
 # Inicializar o manipulador do modelo
-model_handler = ModelHandler(model_path=Config.MODEL_PATH)
+model_handler = ModelHandler(model_path=Config.MODEL_PATH, fast_path=Config.FAST_PATH_ENABLED,
+                             cache_size=Config.CACHE_SIZE, cache_ttl_seconds=Config.CACHE_TTL_SECONDS,
+                             metrics=metrics, background_loading=Config.MODEL_BACKGROUND_LOADING,
+                             warmup_rows=Config.MODEL_WARMUP_ROWS,
+                             reload_interval_seconds=Config.MODEL_RELOAD_INTERVAL_SECONDS,
+                             strict_categories=Config.SCHEMA_STRICT_CATEGORIES,
+                             inference_engine=Config.INFERENCE_ENGINE,
+                             compiled_thresholds=Config.COMPILED_THRESHOLDS,
+                             outlier_capping_path=Config.OUTLIER_CAPPING_PATH)
+
+# Agrupa requisições concorrentes em lotes, se habilitado
+if Config.BATCHING_ENABLED:
+    predictor = MicroBatcher(model_handler, max_batch_size=Config.BATCH_MAX_SIZE, max_wait_ms=Config.BATCH_MAX_WAIT_MS,
+                             result_timeout_seconds=Config.BATCH_RESULT_TIMEOUT_SECONDS)
+else:
+    predictor = model_handler
 
-# Logs antes e depois de cada requisição
+# Um registro de log por requisição, com o corpo incluído apenas em uma amostra das requisições
 @app.before_request
-def log_request_info():
-    logger.info(f"Incoming request: {request.method} {request.url}")
-    logger.info(f"Request data: {request.get_json()}")
+def start_request_timer():
+    g.request_start = time.perf_counter()
 
 @app.after_request
-def log_response_info(response):
-    logger.info(f"Response status: {response.status_code}")
+def log_request(response):
+    if logger.isEnabledFor(logging.INFO):
+        extra = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round((time.perf_counter() - g.request_start) * 1000, 3),
+            'content_length': request.content_length,
+        }
+        # Apenas corpos JSON já lidos pela rota; os arquivos do /predict/batch e o /predict?stream=true
+        # são lidos em streaming, durante o envio da resposta
+        if request.is_json and not response.is_streamed:
+            extra.update(sample_payload(request.get_data(cache=True), sample_rate=Config.LOG_PAYLOAD_SAMPLE_RATE,
+                                        max_bytes=Config.LOG_PAYLOAD_MAX_BYTES))
+        logger.info("Request completed", extra=extra)
     return response
 
+# Resposta enquanto o modelo ainda está carregando, com a sugestão de quando tentar novamente
+def model_not_ready_response():
+    response = jsonify({"error": "Service Unavailable", "message": "Model is still loading"})
+    response.headers['Retry-After'] = str(Config.MODEL_NOT_READY_RETRY_AFTER_SECONDS)
+    return response, 503
+
+# Rota de prontidão: 200 apenas depois que o modelo foi carregado e aquecido
+@app.route('/ready', methods=['GET'])
+def ready():
+    if not model_handler.is_ready:
+        return jsonify({"ready": False}), 503
+    return jsonify({"ready": True, "model_version": model_handler.loaded.version})
+
 # Rota para predições
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
-        input_data = request.get_json()
+        if request.args.get('stream', 'false').lower() == 'true':
+            return predict_stream()
+        if request.mimetype in COLUMNAR_CONTENT_TYPES:
+            return predict_columnar()
+
+        with metrics.time_stage('parse'):
+            input_data = request.get_json()
         if not input_data:
             logger.warning("No input data provided.")
+            metrics.count_error('/predict', 'no_input')
             return jsonify({"error": "No input data provided"}), 400
         
-        df = pd.DataFrame(input_data)
+        # Explicações opcionais: contribuição de cada variável para a predição
+        explain = request.args.get('explain', 'false').lower() == 'true'
+        top_k = parse_top_k(request.args.get('top_k'))
+
+        errors = []
+        explanations = None
+        if isinstance(input_data, list):
+            # Registros inválidos são rejeitados individualmente, antes do modelo; os demais são preditos
+            errors = model_handler.validate_records(records= input_data)
+            n_invalid = len({error['row'] for error in errors})
+            if n_invalid:
+                logger.warning(f"{n_invalid} invalid records rejected.")
+                metrics.count_error('/predict', 'validation')
+            if n_invalid == len(input_data):
+                return jsonify({"error": "Validation Error", "message": "No valid records", "errors": errors}), 400
 
-        predictions = model_handler.predict(df= df)
+            # Caminho rápido: registros codificados direto para o modelo, sem DataFrame
+            predictions = predict_valid_records(predictor.predict_records, records= input_data, errors= errors)
+            if explain:
+                explanations = predict_valid_records(partial(model_handler.explain_records, top_k= top_k),
+                                                     records= input_data, errors= errors)
+        else:
+            with metrics.time_stage('frame_build'):
+                df = pd.DataFrame(input_data)
+            predictions = model_handler.predict(df= df)
+            if explain:
+                explanations = model_handler.explain(df= df, top_k= top_k)
         logger.info("Prediction completed successfully.")
-        return jsonify({'predictions': predictions})
+
+        # Com registros rejeitados, a predição deles é null e os erros são listados por linha
+        response = {'predictions': predictions}
+        if explanations is not None:
+            response['explanations'] = explanations
+        if errors:
+            response['errors'] = errors
+        with metrics.time_stage('serialize'):
+            return jsonify(response)
+    except ModelNotReadyError:
+        logger.warning("Prediction requested while the model is loading.")
+        metrics.count_error('/predict', 'not_ready')
+        return model_not_ready_response()
     except ValueError as ve:
         logger.error(f"Value error during prediction: {str(ve)}")
+        metrics.count_error('/predict', 'value_error')
         return jsonify({"error": "Value Error", "message": str(ve)}), 400
+    except HTTPException as he:
+        # Erros do próprio Flask na leitura do corpo (JSON malformado, tipo de conteúdo não suportado) mantêm o status
+        logger.warning(f"Bad request during prediction: {he.description}")
+        metrics.count_error('/predict', 'bad_request')
+        return jsonify({"error": he.name, "message": he.description}), he.code
     except Exception as e:
         logger.error(f"Unexpected error during prediction: {str(e)}")
+        metrics.count_error('/predict', 'internal')
+        return jsonify({"error": "Internal Server Error", "message": str(e)}), 500
+
+def predict_columnar():
+    # Lote colunar (MessagePack ou Arrow IPC): validado e codificado coluna a coluna, sem registros intermediários
+    # As explicações só têm formato definido em JSON; nos formatos colunares, o parâmetro é rejeitado
+    if request.args.get('explain', 'false').lower() == 'true':
+        raise ValueError("explain=true is only supported for JSON requests")
+    with metrics.time_stage('parse'):
+        columns, n_rows = decode_columns(request.get_data(), request.mimetype)
+    if not n_rows:
+        logger.warning("No input data provided.")
+        metrics.count_error('/predict', 'no_input')
+        return jsonify({"error": "No input data provided"}), 400
+
+    errors = model_handler.validate_columns(columns= columns, n_rows= n_rows)
+    n_invalid = len({error['row'] for error in errors})
+    if n_invalid:
+        logger.warning(f"{n_invalid} invalid records rejected.")
+        metrics.count_error('/predict', 'validation')
+    if n_invalid == n_rows:
+        return jsonify({"error": "Validation Error", "message": "No valid records", "errors": errors}), 400
+
+    predictions = predict_valid_columns(model_handler.predict_columns, columns= columns, n_rows= n_rows, errors= errors)
+    logger.info("Prediction completed successfully.")
+
+    response = {'predictions': predictions}
+    if errors:
+        response['errors'] = errors
+    content_type = negotiate_response_type(request.mimetype, request.accept_mimetypes)
+    with metrics.time_stage('serialize'):
+        return Response(encode_response(response, content_type), mimetype= content_type)
+
+def predict_stream():
+    # Streaming: o array JSON (ou NDJSON) é lido e predito em blocos, e o NDJSON é enviado conforme é calculado
+    chunk_size = parse_positive_int(request.args.get('chunk_size'), 'chunk_size', default=Config.SCORING_CHUNK_SIZE)
+    record_chunks = read_json_chunks(request.stream, chunk_size= chunk_size)
+    ndjson_chunks = score_records_ndjson(model_handler, record_chunks)
+
+    # Prediz o primeiro bloco antes de iniciar a resposta, para que erros de entrada retornem 400
+    first_ndjson_chunk = next(ndjson_chunks, None)
+    if first_ndjson_chunk is None:
+        logger.warning("No input data provided.")
+        metrics.count_error('/predict', 'no_input')
+        return jsonify({"error": "No input data provided"}), 400
+
+    def generate():
+        yield first_ndjson_chunk
+        try:
+            yield from ndjson_chunks
+        except ValueError as ve:
+            # O status 200 já foi enviado: o erro de entrada é informado na última linha do NDJSON
+            logger.error(f"Value error while streaming predictions: {str(ve)}")
+            metrics.count_error('/predict', 'value_error')
+            yield json.dumps({"error": "Value Error", "message": str(ve)}) + '\n'
+            return
+        except Exception as e:
+            logger.error(f"Error while streaming predictions: {str(e)}")
+            metrics.count_error('/predict', 'internal')
+            raise
+        logger.info("Streaming prediction completed successfully.")
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+# Rota com os contadores do cache de predições
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    if model_handler.cache_size == 0:
+        return jsonify({"enabled": False})
+    if model_handler.cache is None:
+        return jsonify({"enabled": True, "ready": False})
+    return jsonify({"enabled": True, **model_handler.cache.stats()})
+
+# Rota com as métricas no formato de texto do Prometheus
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    if not metrics.enabled:
+        return jsonify({"error": "Metrics are disabled"}), 404
+    content, content_type = metrics.render()
+    return Response(content, content_type=content_type)
+
+# Rota para predições em lote a partir de arquivos CSV ou Parquet
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    try:
+        chunk_size = request.args.get('chunk_size', Config.SCORING_CHUNK_SIZE, type=int)
+        id_column = request.args.get('id_column', 'Id')
+        prepare = request.args.get('prepare', 'true').lower() == 'true'
+
+        # Aceita o arquivo como upload multipart (campo 'file') ou diretamente no corpo da requisição
+        if request.mimetype == 'multipart/form-data':
+            if 'file' not in request.files:
+                logger.warning("No input file provided.")
+                metrics.count_error('/predict/batch', 'no_input')
+                return jsonify({"error": "No input file provided"}), 400
+            upload = request.files['file']
+            source, filename, content_type = upload.stream, upload.filename, upload.mimetype
+        else:
+            source, filename, content_type = request.stream, None, request.mimetype
+
+        file_format = request.args.get('format') or infer_file_format(filename=filename, content_type=content_type)
+
+        # Parquet exige leitura do rodapé do arquivo, então o corpo é copiado para um arquivo temporário
+        if file_format == 'parquet' and source is request.stream:
+            source = tempfile.TemporaryFile()
+            shutil.copyfileobj(request.stream, source)
+            source.seek(0)
+
+        chunks = read_chunks(source, file_format=file_format, chunk_size=chunk_size)
+        csv_chunks = score_chunks(model_handler, chunks, id_column=id_column, prepare=prepare)
+
+        # Prediz o primeiro bloco antes de iniciar a resposta, para que erros de entrada retornem 400
+        first_csv_chunk = next(csv_chunks, None)
+        if first_csv_chunk is None:
+            logger.warning("No input data provided.")
+            metrics.count_error('/predict/batch', 'no_input')
+            return jsonify({"error": "No input data provided"}), 400
+    except ModelNotReadyError:
+        logger.warning("Batch prediction requested while the model is loading.")
+        metrics.count_error('/predict/batch', 'not_ready')
+        return model_not_ready_response()
+    except KeyError as ke:
+        logger.error(f"Missing column during batch prediction: {str(ke)}")
+        metrics.count_error('/predict/batch', 'value_error')
+        return jsonify({"error": "Value Error", "message": f"Missing column: {ke.args[0]}"}), 400
+    except ValueError as ve:
+        logger.error(f"Value error during batch prediction: {str(ve)}")
+        metrics.count_error('/predict/batch', 'value_error')
+        return jsonify({"error": "Value Error", "message": str(ve)}), 400
+    except HTTPException as he:
+        logger.warning(f"Bad request during batch prediction: {he.description}")
+        metrics.count_error('/predict/batch', 'bad_request')
+        return jsonify({"error": he.name, "message": he.description}), he.code
+    except Exception as e:
+        logger.error(f"Unexpected error during batch prediction: {str(e)}")
+        metrics.count_error('/predict/batch', 'internal')
         return jsonify({"error": "Internal Server Error", "message": str(e)}), 500
 
+    def generate():
+        yield first_csv_chunk
+        try:
+            yield from csv_chunks
+        except Exception as e:
+            logger.error(f"Error while streaming batch predictions: {str(e)}")
+            metrics.count_error('/predict/batch', 'internal')
+            raise
+        logger.info("Batch prediction completed successfully.")
+
+    return Response(stream_with_context(generate()), mimetype='text/csv')
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
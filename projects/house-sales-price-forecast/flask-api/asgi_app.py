@@ -0,0 +1,340 @@
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qs
+import pandas as pd
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_options_header
+from models.model_handler import ModelHandler, ModelNotReadyError
+from models.batcher import MicroBatcher
+from models.batch_scoring import read_json_chunks, score_records_ndjson
+from models.metrics import PredictionMetrics
+from models.schema import predict_valid_columns, predict_valid_records
+from models.wire_formats import COLUMNAR_CONTENT_TYPES, decode_columns, encode_response, negotiate_response_type
+from config import Config
+from request_args import parse_positive_int, parse_top_k
+from request_logging import setup_logging, sample_payload
+
+# Entrada ASGI alternativa ao app.py, com o mesmo contrato do /predict
+# Execução (a partir do diretório flask-api):
+#     uvicorn asgi_app:app --port 8000
+
+# Configurar logs
+setup_logging(level=Config.LOG_LEVEL, json_format=Config.LOG_JSON, use_queue=Config.LOG_QUEUE_ENABLED)
+logger = logging.getLogger(__name__)
+
+# Métricas de latência e vazão (Prometheus), expostas em /metrics
+metrics = PredictionMetrics(enabled=Config.METRICS_ENABLED)
+
+# Inicializar o manipulador do modelo
+model_handler = ModelHandler(model_path=Config.MODEL_PATH, fast_path=Config.FAST_PATH_ENABLED,
+                             cache_size=Config.CACHE_SIZE, cache_ttl_seconds=Config.CACHE_TTL_SECONDS,
+                             metrics=metrics, background_loading=Config.MODEL_BACKGROUND_LOADING,
+                             warmup_rows=Config.MODEL_WARMUP_ROWS,
+                             reload_interval_seconds=Config.MODEL_RELOAD_INTERVAL_SECONDS,
+                             strict_categories=Config.SCHEMA_STRICT_CATEGORIES,
+                             inference_engine=Config.INFERENCE_ENGINE,
+                             compiled_thresholds=Config.COMPILED_THRESHOLDS,
+                             outlier_capping_path=Config.OUTLIER_CAPPING_PATH)
+
+# Agrupa requisições concorrentes em lotes, se habilitado
+if Config.BATCHING_ENABLED:
+    predictor = MicroBatcher(model_handler, max_batch_size=Config.BATCH_MAX_SIZE, max_wait_ms=Config.BATCH_MAX_WAIT_MS,
+                             result_timeout_seconds=Config.BATCH_RESULT_TIMEOUT_SECONDS)
+else:
+    predictor = model_handler
+
+# As predições (CPU) rodam em um pool limitado de threads, fora do event loop
+executor = ThreadPoolExecutor(max_workers=Config.ASGI_WORKER_THREADS, thread_name_prefix='predict')
+
+# Número de predições em execução ou aguardando uma thread livre
+pending_predictions = 0
+
+
+def _predict(input_data, explain: bool = False, top_k: int = None) -> tuple:
+    # Retorna o status HTTP e o corpo da resposta, com as mesmas regras de validação do app.py
+    if not isinstance(input_data, list):
+        with metrics.time_stage('frame_build'):
+            df = pd.DataFrame(input_data)
+        response = {'predictions': model_handler.predict(df=df)}
+        if explain:
+            response['explanations'] = model_handler.explain(df=df, top_k=top_k)
+        return 200, response
+
+    errors = model_handler.validate_records(records=input_data)
+    n_invalid = len({error['row'] for error in errors})
+    if n_invalid:
+        logger.warning(f"{n_invalid} invalid records rejected.")
+        metrics.count_error('/predict', 'validation')
+    if n_invalid == len(input_data):
+        return 400, {"error": "Validation Error", "message": "No valid records", "errors": errors}
+
+    response = {'predictions': predict_valid_records(predictor.predict_records, records=input_data, errors=errors)}
+    if explain:
+        response['explanations'] = predict_valid_records(partial(model_handler.explain_records, top_k=top_k),
+                                                         records=input_data, errors=errors)
+    if errors:
+        response['errors'] = errors
+    return 200, response
+
+
+def _predict_columns(body: bytes, content_type: str) -> tuple:
+    # Mesmas regras de _predict para um lote colunar (MessagePack ou Arrow IPC)
+    with metrics.time_stage('parse'):
+        columns, n_rows = decode_columns(body, content_type)
+    if not n_rows:
+        return 400, {"error": "No input data provided"}
+
+    errors = model_handler.validate_columns(columns=columns, n_rows=n_rows)
+    n_invalid = len({error['row'] for error in errors})
+    if n_invalid:
+        logger.warning(f"{n_invalid} invalid records rejected.")
+        metrics.count_error('/predict', 'validation')
+    if n_invalid == n_rows:
+        return 400, {"error": "Validation Error", "message": "No valid records", "errors": errors}
+
+    response = {'predictions': predict_valid_columns(model_handler.predict_columns, columns=columns, n_rows=n_rows,
+                                                     errors=errors)}
+    if errors:
+        response['errors'] = errors
+    return 200, response
+
+
+class _ReceiveStream:
+    def __init__(self, receive, loop: asyncio.AbstractEventLoop):
+        """
+        Corpo da requisição ASGI como um arquivo binário síncrono, lido de uma thread do pool enquanto
+        o event loop recebe os trechos seguintes.
+
+        Args:
+            receive: Canal `receive` da requisição ASGI.
+            loop (asyncio.AbstractEventLoop): Event loop que atende a requisição.
+        """
+        self._receive = receive
+        self._loop = loop
+        self._buffer = b''
+        self._more_body = True
+
+    def read(self, size: int = -1) -> bytes:
+        while self._more_body and (size < 0 or len(self._buffer) < size):
+            message = asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+            self._buffer += message.get('body', b'')
+            self._more_body = message.get('more_body', False)
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def _read_body(receive) -> bytes:
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    return body
+
+
+async def _send(send, status: int, body: bytes, content_type: str, headers: list = None):
+    response_headers = [(b'content-type', content_type.encode()), (b'content-length', str(len(body)).encode())]
+    await send({'type': 'http.response.start', 'status': status, 'headers': response_headers + (headers or [])})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_json(send, status: int, payload: dict, headers: list = None):
+    await _send(send, status, json.dumps(payload).encode(), 'application/json', headers=headers)
+
+
+async def _predict_stream(receive, send, query: dict):
+    # Streaming, com o mesmo contrato do app.py: o corpo é lido e predito em blocos em uma thread do pool,
+    # e cada bloco de NDJSON é enviado assim que é calculado
+    chunk_size = parse_positive_int(query['chunk_size'][0] if 'chunk_size' in query else None, 'chunk_size',
+                                    default=Config.SCORING_CHUNK_SIZE)
+    loop = asyncio.get_running_loop()
+    record_chunks = read_json_chunks(_ReceiveStream(receive, loop), chunk_size=chunk_size)
+    ndjson_chunks = score_records_ndjson(model_handler, record_chunks)
+
+    # Prediz o primeiro bloco antes de iniciar a resposta, para que erros de entrada retornem 400
+    ndjson_chunk = await loop.run_in_executor(executor, next, ndjson_chunks, None)
+    if ndjson_chunk is None:
+        logger.warning("No input data provided.")
+        metrics.count_error('/predict', 'no_input')
+        await _send_json(send, 400, {"error": "No input data provided"})
+        return
+
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/x-ndjson')]})
+    try:
+        while ndjson_chunk is not None:
+            await send({'type': 'http.response.body', 'body': ndjson_chunk.encode(), 'more_body': True})
+            ndjson_chunk = await loop.run_in_executor(executor, next, ndjson_chunks, None)
+        logger.info("Streaming prediction completed successfully.")
+    except ValueError as ve:
+        # O status 200 já foi enviado: o erro de entrada é informado na última linha do NDJSON
+        logger.error(f"Value error while streaming predictions: {str(ve)}")
+        metrics.count_error('/predict', 'value_error')
+        error_line = json.dumps({"error": "Value Error", "message": str(ve)}) + '\n'
+        await send({'type': 'http.response.body', 'body': error_line.encode(), 'more_body': True})
+    except Exception as e:
+        logger.error(f"Error while streaming predictions: {str(e)}")
+        metrics.count_error('/predict', 'internal')
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def predict(receive, send, headers: dict, query: dict):
+    global pending_predictions
+
+    # Backpressure: com a fila cheia, rejeita a requisição em vez de acumular latência
+    if pending_predictions >= Config.ASGI_MAX_PENDING:
+        logger.warning("Prediction queue is full.")
+        metrics.count_error('/predict', 'overloaded')
+        await _send_json(send, 503, {"error": "Service Unavailable", "message": "Prediction queue is full"},
+                         headers=[(b'retry-after', str(Config.ASGI_RETRY_AFTER_SECONDS).encode())])
+        return
+
+    pending_predictions += 1
+    try:
+        if query.get('stream', ['false'])[0].lower() == 'true':
+            await _predict_stream(receive, send, query)
+            return
+
+        body = await _read_body(receive)
+        content_type = parse_options_header(headers.get(b'content-type', b'').decode('latin-1'))[0]
+        if content_type in COLUMNAR_CONTENT_TYPES:
+            # As explicações só têm formato definido em JSON; nos formatos colunares, o parâmetro é rejeitado
+            if query.get('explain', ['false'])[0].lower() == 'true':
+                raise ValueError("explain=true is only supported for JSON requests")
+            loop = asyncio.get_running_loop()
+            status, response = await loop.run_in_executor(executor, _predict_columns, body, content_type)
+            if status != 200:
+                await _send_json(send, status, response)
+                return
+            logger.info("Prediction completed successfully.")
+            accept = parse_accept_header(headers.get(b'accept', b'').decode('latin-1'), MIMEAccept)
+            response_type = negotiate_response_type(content_type, accept)
+            with metrics.time_stage('serialize'):
+                body = encode_response(response, response_type)
+            await _send(send, status, body, response_type)
+            return
+
+        with metrics.time_stage('parse'):
+            input_data = json.loads(body) if body else None
+        if not input_data:
+            logger.warning("No input data provided.")
+            metrics.count_error('/predict', 'no_input')
+            await _send_json(send, 400, {"error": "No input data provided"})
+            return
+
+        # Explicações opcionais, com os mesmos parâmetros do app.py (?explain=true&top_k=5)
+        explain = query.get('explain', ['false'])[0].lower() == 'true'
+        top_k = parse_top_k(query['top_k'][0] if 'top_k' in query else None)
+
+        loop = asyncio.get_running_loop()
+        status, response = await loop.run_in_executor(executor, _predict, input_data, explain, top_k)
+        if status == 200:
+            logger.info("Prediction completed successfully.")
+        with metrics.time_stage('serialize'):
+            body = json.dumps(response).encode()
+        await _send(send, status, body, 'application/json')
+    except ModelNotReadyError:
+        logger.warning("Prediction requested while the model is loading.")
+        metrics.count_error('/predict', 'not_ready')
+        await _send_json(send, 503, {"error": "Service Unavailable", "message": "Model is still loading"},
+                         headers=[(b'retry-after', str(Config.MODEL_NOT_READY_RETRY_AFTER_SECONDS).encode())])
+    except ValueError as ve:
+        logger.error(f"Value error during prediction: {str(ve)}")
+        metrics.count_error('/predict', 'value_error')
+        await _send_json(send, 400, {"error": "Value Error", "message": str(ve)})
+    except Exception as e:
+        logger.error(f"Unexpected error during prediction: {str(e)}")
+        metrics.count_error('/predict', 'internal')
+        await _send_json(send, 500, {"error": "Internal Server Error", "message": str(e)})
+    finally:
+        pending_predictions -= 1
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            # Aguarda as predições em andamento em outra thread, sem bloquear o event loop
+            await asyncio.get_running_loop().run_in_executor(None, partial(executor.shutdown, wait=True))
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def _route(scope, receive, send, headers: dict, query: dict):
+    if scope['path'] == '/metrics' and metrics.enabled:
+        content, content_type = metrics.render()
+        await _send(send, 200, content, content_type)
+    elif scope['path'] == '/cache/stats':
+        if model_handler.cache_size == 0:
+            await _send_json(send, 200, {"enabled": False})
+        elif model_handler.cache is None:
+            await _send_json(send, 200, {"enabled": True, "ready": False})
+        else:
+            await _send_json(send, 200, {"enabled": True, **model_handler.cache.stats()})
+    elif scope['path'] == '/ready':
+        if model_handler.is_ready:
+            await _send_json(send, 200, {"ready": True, "model_version": model_handler.loaded.version})
+        else:
+            await _send_json(send, 503, {"ready": False})
+    elif scope['path'] != '/predict':
+        await _send_json(send, 404, {"error": "Not Found"})
+    elif scope['method'] != 'POST':
+        await _send_json(send, 405, {"error": "Method Not Allowed"}, headers=[(b'allow', b'POST')])
+    else:
+        await predict(receive, send, headers=headers, query=query)
+
+
+def _log_request(scope: dict, headers: dict, status: int, start: float, body: bytes):
+    # Um registro de log por requisição, com os mesmos campos do after_request do app.py
+    content_length = headers.get(b'content-length')
+    extra = {
+        'method': scope['method'],
+        'path': scope['path'],
+        'status': status,
+        'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+        'content_length': int(content_length) if content_length else None,
+    }
+    extra.update(sample_payload(body, sample_rate=Config.LOG_PAYLOAD_SAMPLE_RATE, max_bytes=Config.LOG_PAYLOAD_MAX_BYTES))
+    logger.info("Request completed", extra=extra)
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+
+    start = time.perf_counter()
+    headers = dict(scope['headers'])
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    log_enabled = logger.isEnabledFor(logging.INFO)
+    # O corpo só é guardado para o log se for JSON, se a amostragem estiver habilitada e se não for lido em
+    # streaming (como no app.py)
+    keep_body = (log_enabled and Config.LOG_PAYLOAD_SAMPLE_RATE > 0
+                 and query.get('stream', ['false'])[0].lower() != 'true'
+                 and parse_options_header(headers.get(b'content-type', b'').decode('latin-1'))[0] == 'application/json')
+    access = {'status': None, 'body': b''}
+
+    async def receive_and_keep():
+        message = await receive()
+        if keep_body:
+            access['body'] += message.get('body', b'')
+        return message
+
+    async def send_and_record(message):
+        if message['type'] == 'http.response.start':
+            access['status'] = message['status']
+        await send(message)
+
+    try:
+        await _route(scope, receive_and_keep, send_and_record, headers, query)
+    finally:
+        if log_enabled:
+            _log_request(scope, headers, access['status'], start, access['body'])
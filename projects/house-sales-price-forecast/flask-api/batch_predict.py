@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from config import Config
+from models.batch_scoring import infer_file_format, read_chunks, score_chunks
+from models.model_handler import ModelHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Predição em lote de arquivos CSV ou Parquet")
+    parser.add_argument('input', help="Caminho do arquivo de entrada (.csv ou .parquet)")
+    parser.add_argument('-o', '--output', help="Caminho do CSV de saída (padrão: saída padrão)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="Formato do arquivo de entrada (padrão: pela extensão)")
+    parser.add_argument('--chunk-size', type=int, default=Config.SCORING_CHUNK_SIZE, help="Linhas processadas por bloco")
+    parser.add_argument('--id-column', default='Id', help="Coluna de identificação copiada para a saída")
+    parser.add_argument('--no-prepare', action='store_true',
+                        help="Não aplica a preparação dos dados brutos (arquivo já contém as features do modelo)")
+    args = parser.parse_args()
+
+    file_format = args.format or infer_file_format(filename=args.input)
+    model_handler = ModelHandler(model_path=Config.MODEL_PATH, outlier_capping_path=Config.OUTLIER_CAPPING_PATH)
+
+    chunks = read_chunks(args.input, file_format=file_format, chunk_size=args.chunk_size)
+    output = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        for csv_chunk in score_chunks(model_handler, chunks, id_column=args.id_column, prepare=not args.no_prepare):
+            output.write(csv_chunk)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Comparação da entrada ASGI (uvicorn + asgi_app.py) com o servidor do Flask sob concorrência crescente.
+
+Para cada nível de concorrência, mede a vazão (req/s), as latências p50/p99 das respostas
+bem-sucedidas e a taxa de erro (inclui as respostas 503 do backpressure da entrada ASGI).
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_asgi --concurrency 1 8 32 128 --requests 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import requests
+
+from benchmarks.http_load import run_closed_loop
+from tester import test_data
+
+SERVERS = {
+    'flask': ['-m', 'flask', '--app', 'app', 'run', '--with-threads', '--port'],
+    'asgi': ['-m', 'uvicorn', 'asgi_app:app', '--log-level', 'warning', '--port'],
+}
+
+
+def _start_server(name, port, env):
+    process = subprocess.Popen([sys.executable, *SERVERS[name], str(port)], env=dict(os.environ, **env),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f"http://127.0.0.1:{port}/predict"
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            requests.post(url, json=test_data, timeout=5).raise_for_status()
+            return process, url
+        except requests.RequestException:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("O servidor não ficou pronto a tempo")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comparação da entrada ASGI com o servidor do Flask")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--asgi-threads', type=int, default=4)
+    parser.add_argument('--asgi-max-pending', type=int, default=64)
+    parser.add_argument('--port', type=int, default=8056)
+    args = parser.parse_args()
+
+    env = {'ASGI_WORKER_THREADS': str(args.asgi_threads), 'ASGI_MAX_PENDING': str(args.asgi_max_pending)}
+
+    print(f"{'servidor':>9}{'concorrência':>14}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'erros':>8}")
+    for name in SERVERS:
+        process, url = _start_server(name, args.port, env)
+        try:
+            run_closed_loop(url, test_data, n_requests=200, concurrency=8)
+            for concurrency in args.concurrency:
+                result = run_closed_loop(url, test_data, n_requests=args.requests, concurrency=concurrency)
+                print(f"{name:>9}{concurrency:>14}{result['throughput']:>10.1f}{result['p50_ms']:>10.2f}"
+                      f"{result['p99_ms']:>10.2f}{result['error_rate']:>8.1%}")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Partida a frio da API: tempo até a primeira predição bem-sucedida.
+
+Sobe o servidor do Flask em um subprocesso e mede, a partir do início do processo, quando ele
+passa a aceitar conexões, quando a primeira predição retorna 200 e a latência dessa primeira
+predição. Compara a carga síncrona sem aquecimento (comportamento anterior) com a carga em
+segundo plano seguida do aquecimento em um lote sintético.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_cold_start --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import requests
+
+from tester import test_data
+
+MODES = {
+    'síncrona, sem aquecimento': {'MODEL_BACKGROUND_LOADING': 'false', 'MODEL_WARMUP_ROWS': '0'},
+    'segundo plano + aquecimento': {'MODEL_BACKGROUND_LOADING': 'true', 'MODEL_WARMUP_ROWS': '64'},
+}
+
+
+def _cold_start(env, port):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-m', 'flask', '--app', 'app', 'run', '--port', str(port)],
+                               env=dict(os.environ, LOG_LEVEL='WARNING', **env),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        # Primeiro instante em que o servidor responde (prontidão pode ainda ser negativa)
+        while True:
+            try:
+                requests.get(f"{url}/ready", timeout=5)
+                break
+            except requests.ConnectionError:
+                time.sleep(0.01)
+        accepting = time.perf_counter() - start
+
+        # Com a carga em segundo plano, um balanceador aguardaria a prontidão antes de enviar tráfego
+        while requests.get(f"{url}/ready", timeout=5).status_code != 200:
+            time.sleep(0.01)
+
+        request_start = time.perf_counter()
+        requests.post(f"{url}/predict", json=test_data, timeout=30).raise_for_status()
+        first_prediction = time.perf_counter() - start
+        first_latency = time.perf_counter() - request_start
+    finally:
+        process.terminate()
+        process.wait()
+    return accepting, first_prediction, first_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partida a frio da API")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--port', type=int, default=8057)
+    args = parser.parse_args()
+
+    print(f"{'carga do modelo':<30}{'aceita conexões (s)':>21}{'1ª predição (s)':>17}{'latência da 1ª (ms)':>21}")
+    for mode, env in MODES.items():
+        results = np.array([_cold_start(env, args.port) for _ in range(args.runs)])
+        accepting, first_prediction, first_latency = np.median(results, axis=0)
+        print(f"{mode:<30}{accepting:>21.2f}{first_prediction:>17.2f}{first_latency * 1000:>21.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Motor de inferência compilado (árvores em arrays NumPy percorridas com numba) contra o XGBoost.
+
+Compila o booster do `xgboost_model.pkl` com limiares float32 e quantizados, verifica que as
+predições ficam dentro da tolerância das do XGBoost em todo o `test.csv` e compara a latência
+por linha do modelo (sobre a matriz de features já codificada) e dos registros até a predição,
+para lotes de diferentes tamanhos.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_compiled_trees --tolerance 1e-6
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.feature_engineering import prepare_raw_features
+from models.model_handler import ModelHandler
+
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+BATCH_SIZES = (1, 10, 100, 1000)
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Motor de inferência compilado contra o XGBoost")
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--tolerance', type=float, default=1e-6, help="Tolerância relativa das predições")
+    args = parser.parse_args()
+
+    engines = {'xgboost': {'inference_engine': 'xgboost'},
+               'compilado float32': {'inference_engine': 'compiled', 'compiled_thresholds': 'float32'},
+               'compilado quantizado': {'inference_engine': 'compiled', 'compiled_thresholds': 'quantized'}}
+
+    handlers = {}
+    for name, options in engines.items():
+        start = time.perf_counter()
+        handlers[name] = ModelHandler(model_path=Config.MODEL_PATH, warmup_rows=1, **options)
+        print(f"Carga com aquecimento ({name}): {time.perf_counter() - start:.2f}s")
+
+    records = prepare_raw_features(pd.read_csv(TEST_CSV_PATH)).to_dict(orient='records')
+    X = handlers['xgboost'].encoder.encode(records)
+
+    # Paridade no test.csv completo
+    reference = handlers['xgboost'].loaded.predict_features(X)
+    for name, handler in handlers.items():
+        predictions = handler.loaded.predict_features(X)
+        relative_error = np.max(np.abs(predictions.astype(np.float64) / reference - 1))
+        identical = np.mean(predictions == reference)
+        print(f"Paridade com o XGBoost ({name}, {len(records)} linhas): erro relativo máximo {relative_error:.2e}, "
+              f"predições idênticas {identical:.1%}")
+        if relative_error > args.tolerance:
+            raise SystemExit(f"As predições do motor {name} excedem a tolerância de {args.tolerance:g}")
+
+    print(f"\n{'motor':<22}{'casas':>7}{'modelo (µs/linha)':>19}{'registros (µs/linha)':>22}")
+    for name, handler in handlers.items():
+        for batch_size in BATCH_SIZES:
+            batch, X_batch = records[:batch_size], X[:batch_size]
+            repeats = max(5, args.repeats * 100 // (100 + batch_size))
+            model_us = _median_ms(lambda: handler.loaded.predict_features(X_batch), repeats) * 1000 / batch_size
+            records_us = _median_ms(lambda: handler.predict_records(records=batch), repeats) * 1000 / batch_size
+            print(f"{name:<22}{batch_size:>7}{model_us:>19.1f}{records_us:>22.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Paridade e latência do codificador colunar (caminho rápido) contra o caminho via pandas.
+
+Verifica que as predições são idênticas bit a bit no payload do `tester.py` e em todo o
+`test.csv`, e compara a latência de predição para lotes de diferentes tamanhos.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_encoder
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.feature_engineering import prepare_raw_features
+from models.model_handler import ModelHandler
+from tester import test_data
+
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+
+
+def _mean_latency_ms(func, n_repeats):
+    func()  # Aquecimento
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        func()
+    return (time.perf_counter() - start) / n_repeats * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridade e latência do codificador colunar")
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    model_handler = ModelHandler(model_path=Config.MODEL_PATH)
+    if model_handler.encoder is None:
+        raise SystemExit("O pipeline do modelo não é suportado pelo codificador colunar")
+
+    test_df = prepare_raw_features(pd.read_csv(TEST_CSV_PATH))
+    test_records = test_df.to_dict('records')
+
+    # Paridade bit a bit
+    for name, records in [('tester.py', test_data), ('test.csv', test_records)]:
+        pandas_predictions = np.array(model_handler.predict(df=pd.DataFrame(records)))
+        fast_predictions = np.array(model_handler.predict_records(records=records))
+        identical = np.array_equal(pandas_predictions.view(np.uint64), fast_predictions.view(np.uint64))
+        print(f"Paridade ({name}, {len(records)} linhas): {'OK' if identical else 'FALHOU'}")
+        if not identical:
+            raise SystemExit(1)
+
+    # Latência por chamada
+    print(f"\n{'linhas':>8}{'pandas (ms)':>14}{'rápido (ms)':>14}{'ganho':>8}")
+    for batch_size in [1, 100, len(test_records)]:
+        records = test_records[:batch_size]
+        repeats = args.repeats if batch_size == 1 else max(10, args.repeats // 10)
+        pandas_ms = _mean_latency_ms(lambda: model_handler.predict(df=pd.DataFrame(records)), repeats)
+        fast_ms = _mean_latency_ms(lambda: model_handler.predict_records(records=records), repeats)
+        print(f"{batch_size:>8}{pandas_ms:>14.3f}{fast_ms:>14.3f}{pandas_ms / fast_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Latência adicional das explicações (`explain=true`) no /predict.
+
+Para lotes de 1 e 1.000 casas do `test.csv`, compara a predição com a predição seguida das
+explicações (contribuições do TreeSHAP do XGBoost, agregadas por variável de entrada), com todas as
+variáveis e truncadas em `top_k`, no ModelHandler e ponta a ponta pelo /predict (cliente de teste
+do Flask). Verifica também que o valor base somado às contribuições reproduz a predição.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_explanations
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from models.feature_engineering import prepare_raw_features
+
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+BATCH_SIZES = (1, 1000)
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência adicional das explicações no /predict")
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--top-k', type=int, default=5)
+    args = parser.parse_args()
+
+    import app as app_module
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+    client = app_module.app.test_client()
+    model_handler = app_module.model_handler
+    while not model_handler.is_ready:  # Carga do modelo em segundo plano
+        time.sleep(0.05)
+
+    records = prepare_raw_features(pd.read_csv(TEST_CSV_PATH)).to_dict(orient='records')
+    invalid_rows = {error['row'] for error in model_handler.validate_records(records=records)}
+    records = [record for i, record in enumerate(records) if i not in invalid_rows]
+
+    # Aditividade: valor base + contribuições (+ restante truncado) = predição
+    predictions = np.array(model_handler.predict_records(records=records))
+    explanations = model_handler.explain_records(records=records, top_k=args.top_k)
+    totals = np.array([explanation['base_value'] + sum(explanation['contributions'].values()) + explanation['other']
+                       for explanation in explanations])
+    print(f"Maior diferença entre a soma das contribuições e a predição ({len(records)} casas): "
+          f"{np.max(np.abs(totals - predictions)):.4f} (precisão float32 do XGBoost)\n")
+
+    print(f"{'casas':>7}{'cenário':>24}{'handler (ms)':>14}{'/predict (ms)':>15}{'resposta (KB)':>15}")
+    for batch_size in BATCH_SIZES:
+        batch = records[:batch_size]
+        repeats = max(5, args.repeats * 100 // (100 + batch_size))
+        scenarios = {
+            'predição': (lambda: model_handler.predict_records(records=batch), ''),
+            'explicação completa': (lambda: (model_handler.predict_records(records=batch),
+                                             model_handler.explain_records(records=batch)), '?explain=true'),
+            f"explicação top {args.top_k}": (lambda: (model_handler.predict_records(records=batch),
+                                                     model_handler.explain_records(records=batch, top_k=args.top_k)),
+                                            f"?explain=true&top_k={args.top_k}"),
+        }
+        for name, (handler_call, query) in scenarios.items():
+            handler_ms = _median_ms(handler_call, repeats)
+            post = lambda: client.post(f"/predict{query}", json=batch)
+            end_to_end_ms = _median_ms(post, repeats)
+            print(f"{batch_size:>7}{name:>24}{handler_ms:>14.3f}{end_to_end_ms:>15.3f}"
+                  f"{len(post().data) / 1024:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Custo dos logs por requisição no endpoint /predict.
+
+Compara a latência do /predict (cliente de teste do Flask, sem rede) com os logs desligados,
+com o log anterior (corpo completo formatado na thread da requisição, escrita síncrona) e com
+os logs estruturados escritos por uma thread separada, com e sem amostragem do corpo.
+Os logs são escritos em um arquivo temporário em disco.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_logging --batch-sizes 1 500 --requests 300
+"""
+import argparse
+import logging
+import tempfile
+import time
+
+import numpy as np
+from flask import request
+
+import app as app_module
+from config import Config
+from request_logging import setup_logging
+from tester import test_data
+
+# Cenários: (nível, JSON, fila, amostragem do corpo, log anterior)
+SCENARIOS = {
+    'desligado': ('WARNING', True, True, 0.0, False),
+    'anterior': ('INFO', False, False, 0.0, True),
+    'estruturado (fila)': ('INFO', True, True, 0.0, False),
+    'estruturado, 1% do corpo': ('INFO', True, True, 0.01, False),
+    'estruturado, 100% do corpo': ('INFO', True, True, 1.0, False),
+}
+
+legacy_logging = {'enabled': False}
+
+
+@app_module.app.before_request
+def _legacy_log_request_info():
+    # Reproduz o log anterior: corpo da requisição desserializado e formatado a cada requisição
+    if legacy_logging['enabled']:
+        app_module.logger.info(f"Incoming request: {request.method} {request.url}")
+        if request.is_json:
+            app_module.logger.info(f"Request data: {request.get_json()}")
+
+
+def _latencies_ms(client, payload, n_requests):
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        response = client.post('/predict', json=payload)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_data(as_text=True)
+    return np.array(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo dos logs por requisição no /predict")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 500])
+    parser.add_argument('--requests', type=int, default=300)
+    args = parser.parse_args()
+
+    client = app_module.app.test_client()
+
+    print(f"{'cenário':<28}{'casas':>7}{'média (ms)':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for batch_size in args.batch_sizes:
+        payload = test_data * batch_size
+        for scenario, (level, json_format, use_queue, sample_rate, legacy) in SCENARIOS.items():
+            with tempfile.TemporaryFile('w') as log_file:
+                setup_logging(level=level, json_format=json_format, use_queue=use_queue, stream=log_file)
+                Config.LOG_PAYLOAD_SAMPLE_RATE = sample_rate
+                legacy_logging['enabled'] = legacy
+
+                _latencies_ms(client, payload, n_requests=10)  # Aquecimento
+                latencies = _latencies_ms(client, payload, n_requests=args.requests)
+                logging.getLogger().handlers[0].close()
+
+            print(f"{scenario:<28}{batch_size:>7}{latencies.mean():>12.2f}{np.percentile(latencies, 50):>10.2f}"
+                  f"{np.percentile(latencies, 99):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Custo das métricas do Prometheus e distribuição do tempo do /predict por etapa.
+
+Compara a latência do /predict (cliente de teste do Flask, sem rede) com as métricas
+habilitadas e desabilitadas e, com elas habilitadas, mostra o tempo médio de cada etapa
+(parse, frame build, preprocess, model, serialize) para os caminhos rápido (lista de
+registros) e via pandas (dicionário de colunas).
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_metrics --batch-sizes 1 100 --requests 300
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+
+import app as app_module
+from models.metrics import PredictionMetrics, STAGES
+from tester import test_data
+
+
+def _latencies_ms(client, payload, n_requests):
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        response = client.post('/predict', json=payload)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_data(as_text=True)
+    return np.array(latencies) * 1000
+
+
+def _use_metrics(metrics):
+    app_module.metrics = metrics
+    app_module.model_handler.metrics = metrics
+
+
+def _mean_stage_ms(metrics):
+    means = {}
+    for stage in STAGES:
+        count = metrics.registry.get_sample_value('prediction_stage_seconds_count', {'stage': stage}) or 0
+        total = metrics.registry.get_sample_value('prediction_stage_seconds_sum', {'stage': stage}) or 0
+        means[stage] = total / count * 1000 if count else float('nan')
+    return means
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo das métricas e tempo por etapa do /predict")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100])
+    parser.add_argument('--requests', type=int, default=300)
+    args = parser.parse_args()
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+
+    client = app_module.app.test_client()
+
+    print(f"{'caminho':<9}{'casas':>7}{'métricas':>10}{'média (ms)':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    stage_means = {}
+    for batch_size in args.batch_sizes:
+        records = test_data * batch_size
+        payloads = {
+            'rápido': records,
+            'pandas': {column: [record[column] for record in records] for column in records[0]},
+        }
+        for path, payload in payloads.items():
+            for enabled in (False, True):
+                metrics = PredictionMetrics(enabled=enabled)
+                _use_metrics(metrics)
+                _latencies_ms(client, payload, n_requests=10)  # Aquecimento
+                latencies = _latencies_ms(client, payload, n_requests=args.requests)
+                if enabled:
+                    stage_means[(path, batch_size)] = _mean_stage_ms(metrics)
+
+                print(f"{path:<9}{batch_size:>7}{'sim' if enabled else 'não':>10}{latencies.mean():>12.2f}"
+                      f"{np.percentile(latencies, 50):>10.2f}{np.percentile(latencies, 99):>10.2f}")
+
+    print(f"\nTempo médio por etapa (ms)\n{'caminho':<9}{'casas':>7}" + ''.join(f"{stage:>13}" for stage in STAGES))
+    for (path, batch_size), means in stage_means.items():
+        print(f"{path:<9}{batch_size:>7}" + ''.join(f"{means[stage]:>13.3f}" for stage in STAGES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Formato nativo do modelo (especificação + booster do XGBoost) contra o pickle do pipeline.
+
+Exporta o modelo para um diretório temporário, verifica que as predições do formato nativo são
+idênticas bit a bit às do pickle em todo o `test.csv` (pelos caminhos de DataFrame e de registros)
+e compara o tempo de carga e a latência por linha para lotes de diferentes tamanhos.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_native_model
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.feature_engineering import prepare_raw_features
+from models.model_handler import ModelHandler
+from models.native_model import export_native_model
+
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Formato nativo do modelo contra o pickle do pipeline")
+    parser.add_argument('--load-repeats', type=int, default=10)
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    pipeline = joblib.load(Config.MODEL_PATH)
+    features_df = prepare_raw_features(pd.read_csv(TEST_CSV_PATH))
+    records = features_df.to_dict(orient='records')
+
+    with tempfile.TemporaryDirectory() as directory:
+        model_paths = {'pickle': Config.MODEL_PATH}
+        for booster_format in ('ubj', 'json'):
+            model_paths[f"nativo ({booster_format})"] = os.path.join(directory, f"model_{booster_format}.json")
+            export_native_model(pipeline, spec_path=model_paths[f"nativo ({booster_format})"],
+                                booster_format=booster_format)
+
+        handlers = {name: ModelHandler(model_path=path) for name, path in model_paths.items()}
+
+        # Paridade no test.csv completo
+        reference = np.array(handlers['pickle'].predict(df=features_df))
+        for name, handler in handlers.items():
+            frame_parity = np.array_equal(reference, np.array(handler.predict(df=features_df)))
+            records_parity = np.array_equal(reference, np.array(handler.predict_records(records=records)))
+            print(f"Paridade com o pickle ({name}, {len(records)} linhas): "
+                  f"DataFrame={frame_parity}, registros={records_parity}")
+            if not (frame_parity and records_parity):
+                raise SystemExit("As predições do formato nativo divergem do pickle")
+
+        print(f"\n{'formato':<16}{'carga (ms)':>12}" + ''.join(f"{f'{n} casa(s) (µs/linha)':>24}"
+                                                          for n in (1, 100, len(records))))
+        for name, path in model_paths.items():
+            load_ms = _median_ms(lambda: ModelHandler(model_path=path), args.load_repeats)
+            handler = handlers[name]
+            row_latencies = []
+            for batch_size in (1, 100, len(records)):
+                batch = records[:batch_size]
+                repeats = max(5, args.repeats * 100 // (100 + batch_size))
+                row_latencies.append(_median_ms(lambda: handler.predict_records(records=batch), repeats)
+                                     * 1000 / batch_size)
+            print(f"{name:<16}{load_ms:>12.1f}" + ''.join(f"{latency:>24.1f}" for latency in row_latencies))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Custo do capping percentual dos outliers na predição.
+
+Ajusta o `PercentileCapper` do módulo `utils` nas variáveis contínuas do `train.csv`, salva os limites em JSON e
+compara o ModelHandler com e sem capping: paridade entre o caminho rápido, o pipeline via pandas e o `transform`
+do próprio `PercentileCapper`, e latência adicional para lotes de 1 e 1.000 casas. A comparação do capping com a
+versão anterior em DataFrames sintéticos fica em `utils/benchmarks/benchmark_percentile_capping.py`.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_outlier_capping --repeats 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.feature_engineering import prepare_raw_features
+from models.model_handler import ModelHandler
+from models.outlier_capping import PROJECTS_DIR
+
+# Módulo utils dos notebooks (projects/utils)
+sys.path.append(PROJECTS_DIR)
+import utils  # noqa: E402
+
+TRAIN_CSV_PATH = "../data/extracted_data/train.csv"
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+CONTINUOUS_VARS = ['BsmtFinSF1', 'BsmtUnfSF', 'TotalBsmtSF', '1stFlrSF', '2ndFlrSF', 'GrLivArea', 'GarageArea',
+                   'WoodDeckSF', 'LotFrontage', 'MasVnrArea', 'LotArea', 'OpenPorchSF', 'EnclosedPorch', 'ScreenPorch',
+                   'TotalPorchSF']
+BATCH_SIZES = (1, 1000)
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def benchmark_serving(repeats):
+    train_df = prepare_raw_features(pd.read_csv(TRAIN_CSV_PATH))
+    capper = utils.PercentileCapper(percentile_inf_value=0.5, percentile_sup_value=99.5).fit(train_df, CONTINUOUS_VARS)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        capping_path = os.path.join(tmp_dir, 'outlier_capping.json')
+        capper.save(capping_path)
+
+        handlers = {
+            'sem capping': ModelHandler(model_path=Config.MODEL_PATH),
+            'com capping': ModelHandler(model_path=Config.MODEL_PATH, outlier_capping_path=capping_path),
+            'com capping (pandas)': ModelHandler(model_path=Config.MODEL_PATH, fast_path=False,
+                                                 outlier_capping_path=capping_path),
+        }
+
+    test_df = prepare_raw_features(pd.read_csv(TEST_CSV_PATH))
+    records = test_df.to_dict(orient='records')
+    invalid_rows = {error['row'] for error in handlers['sem capping'].validate_records(records=records)}
+    records = [record for i, record in enumerate(records) if i not in invalid_rows]
+
+    # O caminho rápido trata as entradas como o PercentileCapper e o pipeline via pandas
+    reference = handlers['sem capping'].predict_records(records=records)
+    fast = handlers['com capping'].predict_records(records=records)
+    frame = handlers['com capping (pandas)'].predict(pd.DataFrame(records))
+    expected = handlers['sem capping'].predict(capper.transform(pd.DataFrame(records)))
+    if not (fast == frame == expected):
+        raise SystemExit("As predições com capping divergem entre os caminhos de predição")
+    changed = np.mean(np.array(reference) != np.array(fast))
+    print(f"\nCasas do test.csv com a predição alterada pelo capping: {changed:.1%} de {len(records)}\n")
+
+    print(f"{'cenário':<22}{'casas':>7}{'registros (ms)':>16}")
+    for name, handler in handlers.items():
+        for batch_size in BATCH_SIZES:
+            batch = records[:batch_size]
+            n_repeats = max(5, repeats * 100 // (100 + batch_size))
+            print(f"{name:<22}{batch_size:>7}{_median_ms(lambda: handler.predict_records(records=batch), n_repeats):>16.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo do capping percentual dos outliers na predição")
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    benchmark_serving(args.repeats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Memória e tempo até o primeiro byte do /predict com e sem streaming.
+
+Envia ao /predict um array JSON sintético gerado sob demanda (casas do `train.csv` e do `test.csv`
+repetidas até o número de linhas pedido, sem materializar o corpo) e mede, para cada cenário, o
+tempo até o primeiro byte da resposta, o tempo total e o pico de memória (RSS) do processo acima
+da memória com o modelo já carregado. Cada cenário roda em um processo novo, para que o pico de
+um não afete o seguinte.
+
+Com `stream=true`, o pico de memória depende do tamanho do bloco e não do tamanho do lote; sem
+streaming, o corpo, os registros e a resposta inteiros ficam em memória (por isso o modo sem
+streaming é limitado a lotes menores por padrão).
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_streaming --stream-rows 10000 100000 1000000 --buffered-rows 10000 100000
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import threading
+import time
+
+import psutil
+
+from benchmarks.http_load import sample_payloads
+
+
+class SyntheticJsonBody:
+    # Corpo da requisição (array JSON) gerado sob demanda a partir de um conjunto de registros de base
+
+    def __init__(self, records, n_rows):
+        self.pieces = [json.dumps(record).encode() for record in records]
+        self.n_rows = n_rows
+        self.content_length = (2 + max(n_rows - 1, 0)
+                               + sum(len(self.pieces[i % len(self.pieces)]) for i in range(n_rows)))
+        self._rows_written = 0
+        self._buffer = b'['
+
+    def read(self, size=-1):
+        while (size < 0 or len(self._buffer) < size) and self._rows_written <= self.n_rows:
+            if self._rows_written == self.n_rows:
+                self._buffer += b']'
+            else:
+                separator = b',' if self._rows_written else b''
+                self._buffer += separator + self.pieces[self._rows_written % len(self.pieces)]
+            self._rows_written += 1
+        data, self._buffer = (self._buffer, b'') if size < 0 else (self._buffer[:size], self._buffer[size:])
+        return data
+
+
+class PeakRssSampler:
+    # Amostra o RSS do processo em segundo plano e guarda o maior valor observado
+
+    def __init__(self, interval=0.005):
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak = self.process.memory_info().rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def _run_scenario(stream, n_rows, chunk_size, base_records):
+    import app as app_module
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+    client = app_module.app.test_client()
+    while not app_module.model_handler.is_ready:  # Carga do modelo em segundo plano
+        time.sleep(0.05)
+    client.post('/predict', json=base_records[:100])  # Aquecimento
+
+    body = SyntheticJsonBody(base_records, n_rows)
+    query = f"?stream=true&chunk_size={chunk_size}" if stream else ''
+    baseline_rss = psutil.Process().memory_info().rss
+
+    with PeakRssSampler() as sampler:
+        start = time.perf_counter()
+        response = client.post(f"/predict{query}", content_type='application/json', buffered=False,
+                               environ_overrides={'wsgi.input': body, 'CONTENT_LENGTH': str(body.content_length)})
+        chunks = iter(response.response)
+        first_chunk = next(chunks)
+        time_to_first_byte = time.perf_counter() - start
+        n_bytes = len(first_chunk) + sum(len(chunk) for chunk in chunks)
+        total_time = time.perf_counter() - start
+        response.close()
+
+    if response.status_code != 200:
+        raise SystemExit(f"O /predict retornou {response.status_code}")
+    return {'ttfb_ms': time_to_first_byte * 1000, 'total_s': total_time,
+            'peak_rss_mb': (sampler.peak - baseline_rss) / 2 ** 20, 'response_mb': n_bytes / 2 ** 20}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória e tempo até o primeiro byte do /predict com e sem streaming")
+    parser.add_argument('--stream-rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--buffered-rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    # Casas de base, repetidas até o número de linhas de cada cenário
+    base_records = sample_payloads(1, 2000, seed=0)[0]
+
+    scenarios = [(True, n_rows) for n_rows in args.stream_rows] + [(False, n_rows) for n_rows in args.buffered_rows]
+    print(f"{'modo':<12}{'linhas':>10}{'1º byte (ms)':>14}{'total (s)':>11}{'pico RSS (MB)':>15}{'resposta (MB)':>15}")
+    for stream, n_rows in scenarios:
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            result = pool.apply(_run_scenario, (stream, n_rows, args.chunk_size, base_records))
+        mode = 'streaming' if stream else 'sem stream'
+        print(f"{mode:<12}{n_rows:>10}{result['ttfb_ms']:>14.1f}{result['total_s']:>11.2f}"
+              f"{result['peak_rss_mb']:>15.1f}{result['response_mb']:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Custo da validação do esquema de entrada por 1.000 registros.
+
+Valida lotes de 1.000 registros do `test.csv` com diferentes frações de registros inválidos
+(campo obrigatório ausente, texto em campo numérico e categoria desconhecida) e compara com o
+custo da predição do mesmo lote.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_validation
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.feature_engineering import prepare_raw_features
+from models.model_handler import ModelHandler
+
+TEST_CSV_PATH = "../data/extracted_data/test.csv"
+BATCH_SIZE = 1000
+
+
+def _corrupt(record, kind):
+    record = dict(record)
+    if kind == 0:
+        del record['GrLivArea']
+    elif kind == 1:
+        record['LotArea'] = "14267"
+    else:
+        record['Neighborhood'] = "Atlantis"
+    return record
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo da validação do esquema de entrada")
+    parser.add_argument('--repeats', type=int, default=50)
+    args = parser.parse_args()
+
+    model_handler = ModelHandler(model_path=Config.MODEL_PATH)
+    records = prepare_raw_features(pd.read_csv(TEST_CSV_PATH)).to_dict(orient='records')[:BATCH_SIZE]
+
+    # Registros do test.csv já rejeitados pelo esquema (ex.: categoria não vista no treino)
+    n_rejected = len({error['row'] for error in model_handler.validate_records(records=records)})
+    print(f"Registros do test.csv rejeitados pelo esquema: {n_rejected} de {len(records)}\n")
+
+    print(f"{'inválidos':>10}{'validação (ms/1k)':>19}{'erros':>8}")
+    rng = random.Random(0)
+    for invalid_fraction in (0.0, 0.01, 0.1, 1.0):
+        batch = [_corrupt(record, rng.randrange(3)) if rng.random() < invalid_fraction else record
+                 for record in records]
+        validation_ms = _median_ms(lambda: model_handler.validate_records(records=batch), args.repeats)
+        n_errors = len(model_handler.validate_records(records=batch))
+        print(f"{invalid_fraction:>10.0%}{validation_ms:>19.3f}{n_errors:>8}")
+
+    prediction_ms = _median_ms(lambda: model_handler.predict_records(records=records), args.repeats // 5 or 1)
+    print(f"\nPredição do mesmo lote (ms/1k): {prediction_ms:.3f}")
+
+
+if __name__ == '__main__':
+    main()
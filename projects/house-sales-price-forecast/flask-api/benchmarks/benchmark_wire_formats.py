@@ -0,0 +1,106 @@
+"""
+Formatos de transporte do /predict: JSON por registros, MessagePack colunar e Arrow IPC.
+
+Para lotes de 1, 100 e 10.000 casas sorteadas do `train.csv` e do `test.csv`, compara o tamanho
+do corpo da requisição, o custo no servidor de decodificar o corpo e montar a matriz de features
+do modelo e a latência ponta a ponta do /predict (cliente de teste do Flask, sem rede). Verifica
+também que os três formatos produzem as mesmas predições.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_wire_formats
+"""
+import argparse
+import json
+import logging
+import time
+
+import msgpack
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.http_load import sample_payloads
+from models.wire_formats import ARROW_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, decode_columns
+
+BATCH_SIZES = (1, 100, 10000)
+
+
+def _to_msgpack(records):
+    columns = {column: [record[column] for record in records] for column in records[0]}
+    return msgpack.packb(columns)
+
+
+def _to_arrow(records):
+    table = pa.Table.from_pandas(pd.DataFrame(records), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _median_ms(func, n_repeats):
+    func()  # Aquecimento
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+
+def _predictions(response):
+    # Predições de uma resposta em qualquer um dos formatos, como array float32
+    if response.mimetype == MSGPACK_CONTENT_TYPE:
+        return np.frombuffer(msgpack.unpackb(response.data)['predictions'], dtype='<f4')
+    if response.mimetype == ARROW_CONTENT_TYPE:
+        table = pa.ipc.open_stream(response.data).read_all()
+        return table.column('prediction').to_numpy(zero_copy_only=False).astype(np.float32)
+    return np.array(response.get_json()['predictions'], dtype=np.float64).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Formatos de transporte do /predict")
+    parser.add_argument('--repeats', type=int, default=50)
+    args = parser.parse_args()
+
+    import app as app_module
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+    client = app_module.app.test_client()
+    while not app_module.model_handler.is_ready:  # Carga do modelo em segundo plano
+        time.sleep(0.05)
+    encoder = app_module.model_handler.encoder
+
+    print(f"{'casas':>7}{'formato':>10}{'corpo (KB)':>12}{'decodificação (ms)':>20}{'ponta a ponta (ms)':>20}")
+    for batch_size in BATCH_SIZES:
+        # Apenas casas aceitas pelo esquema, para que a matriz de features seja montada para o lote inteiro
+        records = sample_payloads(1, batch_size, seed=0)[0]
+        invalid_rows = {error['row'] for error in app_module.model_handler.validate_records(records=records)}
+        records = [record for i, record in enumerate(records) if i not in invalid_rows]
+        repeats = max(5, args.repeats * 100 // (100 + batch_size))
+        bodies = {
+            'json': (json.dumps(records).encode(), 'application/json',
+                     lambda body: encoder.encode(json.loads(body))),
+            'msgpack': (_to_msgpack(records), MSGPACK_CONTENT_TYPE,
+                        lambda body: encoder.encode_columns(*decode_columns(body, MSGPACK_CONTENT_TYPE))),
+            'arrow': (_to_arrow(records), ARROW_CONTENT_TYPE,
+                      lambda body: encoder.encode_columns(*decode_columns(body, ARROW_CONTENT_TYPE))),
+        }
+
+        reference = None
+        for name, (body, content_type, decode) in bodies.items():
+            post = lambda: client.post('/predict', data=body, content_type=content_type)
+            predictions = _predictions(post())
+            if reference is None:
+                reference = predictions
+            elif not np.array_equal(reference, predictions, equal_nan=True):
+                raise SystemExit(f"As predições em {name} divergem das predições em JSON")
+
+            decode_ms = _median_ms(lambda: decode(body), repeats)
+            end_to_end_ms = _median_ms(post, repeats)
+            print(f"{len(records):>7}{name:>10}{len(body) / 1024:>12.1f}{decode_ms:>20.3f}{end_to_end_ms:>20.3f}")
+
+
+if __name__ == '__main__':
+    main()
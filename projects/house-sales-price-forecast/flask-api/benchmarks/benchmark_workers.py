@@ -0,0 +1,83 @@
+"""
+Escalabilidade do servidor de produção (gunicorn) com o número de workers.
+
+Para cada quantidade de workers, sobe o gunicorn com e sem preload do modelo, mede a vazão
+(req/s) sob carga e a memória de cada worker: RSS (residente total) e USS (memória exclusiva
+do worker, que não é compartilhada com o processo mestre).
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.benchmark_workers --workers 1 2 4 --requests 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+import requests
+
+from benchmarks.http_load import run_closed_loop
+from tester import test_data
+
+
+def _start_server(n_workers, preload, xgboost_threads, port):
+    env = dict(os.environ,
+               SERVER_BIND=f"127.0.0.1:{port}",
+               SERVER_WORKERS=str(n_workers),
+               SERVER_PRELOAD=str(preload).lower(),
+               XGBOOST_THREADS_PER_WORKER=str(xgboost_threads))
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--log-level', 'warning',
+                                'app:app'], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # Aguarda todos os workers estarem prontos para responder
+    url = f"http://127.0.0.1:{port}/predict"
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            requests.post(url, json=test_data, timeout=5).raise_for_status()
+            workers = psutil.Process(process.pid).children()
+            if len(workers) == n_workers:
+                return process, url
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("O servidor não ficou pronto a tempo")
+
+
+def _workers_memory_mb(process):
+    memory = [worker.memory_full_info() for worker in psutil.Process(process.pid).children()]
+    rss = sum(info.rss for info in memory) / len(memory) / 2**20
+    uss = sum(info.uss for info in memory) / len(memory) / 2**20
+    return rss, uss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalabilidade do gunicorn com o número de workers")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--xgboost-threads', type=int, default=1)
+    parser.add_argument('--port', type=int, default=8055)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'preload':>9}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+          f"{'RSS/worker (MB)':>17}{'USS/worker (MB)':>17}")
+    for n_workers in args.workers:
+        for preload in (True, False):
+            process, url = _start_server(n_workers, preload, args.xgboost_threads, args.port)
+            try:
+                run_closed_loop(url, test_data, n_requests=min(200, args.requests), concurrency=args.concurrency)
+                result = run_closed_loop(url, test_data, n_requests=args.requests, concurrency=args.concurrency)
+                rss, uss = _workers_memory_mb(process)
+            finally:
+                process.terminate()
+                process.wait()
+
+            print(f"{n_workers:>8}{'sim' if preload else 'não':>9}{result['throughput']:>10.1f}"
+                  f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{rss:>17.1f}{uss:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
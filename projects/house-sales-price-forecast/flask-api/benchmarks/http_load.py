@@ -0,0 +1,201 @@
+"""
+Funções auxiliares compartilhadas pelos testes de carga da API.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import requests
+
+from models.feature_engineering import prepare_raw_features
+
+DATA_PATHS = ("../data/extracted_data/train.csv", "../data/extracted_data/test.csv")
+
+
+def sample_payloads(n_payloads, batch_size, seed=0, data_paths=DATA_PATHS):
+    """
+    Gera payloads realistas sorteando casas dos dados do Kaggle, já preparadas para o modelo.
+
+    Parâmetros:
+    -----------
+    n_payloads : int
+        Número de payloads distintos.
+    batch_size : int
+        Número de casas por payload.
+    seed : int
+        Semente do sorteio, para que os mesmos payloads sejam gerados em execuções diferentes.
+    data_paths : tuple
+        Arquivos CSV brutos usados como fonte das casas.
+
+    Retorno:
+    --------
+    list
+        Lista de payloads, cada um uma lista de registros (dicionários).
+    """
+    frames = [prepare_raw_features(pd.read_csv(path)).drop(columns=['SalePrice'], errors='ignore')
+              for path in data_paths]
+    records = pd.concat(frames, ignore_index=True).to_dict(orient='records')
+
+    rng = np.random.default_rng(seed)
+    return [[records[i] for i in rng.integers(0, len(records), size=batch_size)] for _ in range(n_payloads)]
+
+
+def _post(session, url, payload):
+    try:
+        response = session.post(url, json=payload)
+        return response.status_code
+    except requests.RequestException:
+        return None
+
+
+def closed_loop(url, payloads, n_requests, concurrency):
+    """
+    Carga em malha fechada: `concurrency` clientes simultâneos, cada um enviando a próxima
+    requisição assim que recebe a resposta da anterior. Os payloads são usados em rodízio.
+
+    Parâmetros:
+    -----------
+    url : str
+        URL do endpoint.
+    payloads : list
+        Corpos JSON das requisições.
+    n_requests : int
+        Número total de requisições.
+    concurrency : int
+        Número de clientes simultâneos.
+
+    Retorno:
+    --------
+    dict
+        Latências (s), status HTTP de cada requisição (None em falhas de conexão) e duração total (s).
+    """
+    session_local = threading.local()
+
+    def send(i):
+        session = getattr(session_local, 'session', None)
+        if session is None:
+            session = session_local.session = requests.Session()
+        start = time.perf_counter()
+        status = _post(session, url, payloads[i % len(payloads)])
+        return time.perf_counter() - start, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, range(n_requests)))
+    total_time = time.perf_counter() - start
+
+    return {'latencies': [latency for latency, _ in results], 'statuses': [status for _, status in results],
+            'duration': total_time}
+
+
+def open_loop(url, payloads, n_requests, rate, max_in_flight=256, seed=0):
+    """
+    Carga em malha aberta: as requisições chegam em instantes sorteados (processo de Poisson com
+    taxa `rate`), independentemente das respostas anteriores.
+
+    A latência é medida a partir do instante programado de envio, e não do envio efetivo, para que
+    a espera por um cliente livre quando o servidor satura também seja contabilizada.
+
+    Parâmetros:
+    -----------
+    url : str
+        URL do endpoint.
+    payloads : list
+        Corpos JSON das requisições.
+    n_requests : int
+        Número total de requisições.
+    rate : float
+        Taxa média de chegada, em requisições por segundo.
+    max_in_flight : int
+        Número máximo de requisições em andamento no cliente.
+    seed : int
+        Semente dos instantes de chegada.
+
+    Retorno:
+    --------
+    dict
+        Latências (s), status HTTP de cada requisição (None em falhas de conexão) e duração total (s).
+    """
+    session_local = threading.local()
+    arrivals = np.cumsum(np.random.default_rng(seed).exponential(1 / rate, size=n_requests))
+
+    def send(i, scheduled):
+        session = getattr(session_local, 'session', None)
+        if session is None:
+            session = session_local.session = requests.Session()
+        status = _post(session, url, payloads[i % len(payloads)])
+        return time.perf_counter() - scheduled, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        futures = []
+        for i, arrival in enumerate(arrivals):
+            delay = start + arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(send, i, start + arrival))
+        results = [future.result() for future in futures]
+    total_time = time.perf_counter() - start
+
+    return {'latencies': [latency for latency, _ in results], 'statuses': [status for _, status in results],
+            'duration': total_time}
+
+
+def summarize(results):
+    """
+    Resume os resultados de uma carga.
+
+    Parâmetros:
+    -----------
+    results : dict
+        Resultado de `closed_loop` ou `open_loop`.
+
+    Retorno:
+    --------
+    dict
+        Requisições, vazão de respostas bem-sucedidas (req/s), latências média, p50, p95 e p99 em
+        milissegundos das respostas bem-sucedidas e taxa de erro.
+    """
+    statuses = results['statuses']
+    latencies_ms = np.array([latency for latency, status in zip(results['latencies'], statuses)
+                             if status == 200]) * 1000
+    n_errors = sum(status != 200 for status in statuses)
+
+    def percentile(q):
+        return float(np.percentile(latencies_ms, q)) if len(latencies_ms) else float('nan')
+
+    return {
+        'requests': len(statuses),
+        'throughput': (len(statuses) - n_errors) / results['duration'],
+        'mean_ms': float(latencies_ms.mean()) if len(latencies_ms) else float('nan'),
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'error_rate': n_errors / len(statuses),
+    }
+
+
+def run_closed_loop(url, payload, n_requests, concurrency):
+    """
+    Dispara `n_requests` requisições POST com `concurrency` clientes simultâneos, cada um enviando
+    a próxima requisição assim que recebe a resposta da anterior.
+
+    Parâmetros:
+    -----------
+    url : str
+        URL do endpoint.
+    payload : list | dict
+        Corpo JSON enviado em todas as requisições.
+    n_requests : int
+        Número total de requisições.
+    concurrency : int
+        Número de clientes simultâneos.
+
+    Retorno:
+    --------
+    dict
+        Resumo da carga (ver `summarize`).
+    """
+    return summarize(closed_loop(url, [payload], n_requests=n_requests, concurrency=concurrency))
@@ -0,0 +1,154 @@
+"""
+Teste de carga reprodutível do endpoint /predict.
+
+Gera payloads sorteando casas do `train.csv` e do `test.csv` (com semente fixa) e aplica carga
+em malha fechada (número fixo de clientes simultâneos) e/ou em malha aberta (taxa de chegada
+fixa), para cada tamanho de lote. Para cada cenário, reporta vazão, latências média, p50, p95 e
+p99 e taxa de erro, e grava os resultados em JSON para comparação entre commits.
+
+Por padrão, a API é servida em processo (servidor do werkzeug com threads); com `--url`, a carga
+é aplicada a um servidor já em execução (ex.: gunicorn ou uvicorn em localhost).
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.load_test --mode closed open --concurrency 1 8 32 --rates 50 100 \\
+        --batch-sizes 1 100 --output results.json
+    python -m benchmarks.load_test --baseline results_anterior.json --output results.json
+"""
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import threading
+from datetime import datetime, timezone
+
+from benchmarks.http_load import closed_loop, open_loop, sample_payloads, summarize
+
+# Métricas comparadas com a linha de base (variação relativa)
+COMPARED_METRICS = ('throughput', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate')
+
+
+def _start_in_process_server(port):
+    from werkzeug.serving import make_server
+
+    import app as app_module
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    server = make_server('127.0.0.1', port, app_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{port}/predict"
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _scenarios(args):
+    for batch_size in args.batch_sizes:
+        if 'closed' in args.mode:
+            for concurrency in args.concurrency:
+                yield {'mode': 'closed', 'batch_size': batch_size, 'concurrency': concurrency}
+        if 'open' in args.mode:
+            for rate in args.rates:
+                yield {'mode': 'open', 'batch_size': batch_size, 'rate': rate}
+
+
+def _scenario_key(scenario):
+    load = f"c={scenario['concurrency']}" if scenario['mode'] == 'closed' else f"r={scenario['rate']:g}/s"
+    return f"{scenario['mode']} b={scenario['batch_size']} {load}"
+
+
+def _print_results(results, baseline):
+    baseline_by_key = {_scenario_key(result['scenario']): result['summary']
+                       for result in (baseline or {}).get('results', [])}
+
+    print(f"{'cenário':<26}{'req/s':>9}{'média':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'erros':>8}   (latências em ms)")
+    for result in results:
+        key, summary = _scenario_key(result['scenario']), result['summary']
+        print(f"{key:<26}{summary['throughput']:>9.1f}{summary['mean_ms']:>9.2f}{summary['p50_ms']:>9.2f}"
+              f"{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}{summary['error_rate']:>8.1%}")
+
+        previous = baseline_by_key.get(key)
+        if previous is not None:
+            changes = []
+            for metric in COMPARED_METRICS:
+                if metric == 'error_rate':
+                    changes.append(f"{metric} {summary[metric] - previous[metric]:+.1%}")
+                elif previous[metric]:
+                    changes.append(f"{metric} {summary[metric] / previous[metric] - 1:+.1%}")
+            print(f"{'':<26}vs. linha de base: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga reprodutível do /predict")
+    parser.add_argument('--url', help="URL do /predict de um servidor em execução (padrão: servidor em processo)")
+    parser.add_argument('--port', type=int, default=5056, help="Porta do servidor em processo")
+    parser.add_argument('--mode', nargs='+', choices=['closed', 'open'], default=['closed'])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32],
+                        help="Clientes simultâneos na malha fechada")
+    parser.add_argument('--rates', type=float, nargs='+', default=[50.0],
+                        help="Taxas de chegada (req/s) na malha aberta")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100])
+    parser.add_argument('--requests', type=int, default=1000, help="Requisições por cenário")
+    parser.add_argument('--warmup', type=int, default=50, help="Requisições de aquecimento por cenário")
+    parser.add_argument('--payloads', type=int, default=200, help="Payloads distintos sorteados por tamanho de lote")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Arquivo JSON com os resultados")
+    parser.add_argument('--baseline', help="Arquivo JSON de uma execução anterior, para comparação")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server, url = _start_in_process_server(args.port)
+
+    payloads = {batch_size: sample_payloads(args.payloads, batch_size, seed=args.seed)
+                for batch_size in args.batch_sizes}
+
+    results = []
+    try:
+        for scenario in _scenarios(args):
+            scenario_payloads = payloads[scenario['batch_size']]
+            closed_loop(url, scenario_payloads, n_requests=args.warmup, concurrency=8)  # Aquecimento
+            if scenario['mode'] == 'closed':
+                raw = closed_loop(url, scenario_payloads, n_requests=args.requests,
+                                  concurrency=scenario['concurrency'])
+            else:
+                raw = open_loop(url, scenario_payloads, n_requests=args.requests, rate=scenario['rate'],
+                                seed=args.seed)
+            results.append({'scenario': scenario, 'summary': summarize(raw)})
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'machine': {'python': platform.python_version(), 'platform': platform.platform()},
+        'target': 'in-process' if args.url is None else args.url,
+        'parameters': {'requests': args.requests, 'warmup': args.warmup, 'payloads': args.payloads,
+                       'seed': args.seed},
+        'results': results,
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResultados gravados em {args.output}")
+
+
+if __name__ == '__main__':
+    main()
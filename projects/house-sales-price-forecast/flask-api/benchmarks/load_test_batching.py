@@ -0,0 +1,61 @@
+"""
+Teste de carga do micro-batching do endpoint /predict.
+
+Sobe a API em processo, dispara requisições concorrentes de uma casa cada, com e sem o
+MicroBatcher, e compara vazão (req/s) e latências p50/p99.
+
+Execução (a partir do diretório flask-api):
+    python -m benchmarks.load_test_batching --requests 2000 --concurrency 32
+"""
+import argparse
+import logging
+import threading
+
+from werkzeug.serving import make_server
+
+import app as app_module
+from benchmarks.http_load import run_closed_loop
+from models.batcher import MicroBatcher
+from tester import test_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do micro-batching do /predict")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    # Silencia os logs por requisição para não distorcer a medição
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    server = make_server('127.0.0.1', args.port, app_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{args.port}/predict"
+
+    modes = {
+        'sem batching': app_module.model_handler,
+        'com batching': MicroBatcher(app_module.model_handler, max_batch_size=args.max_batch_size,
+                                     max_wait_ms=args.max_wait_ms),
+    }
+
+    results = {}
+    for mode, predictor in modes.items():
+        app_module.predictor = predictor
+        run_closed_loop(url, test_data, n_requests=min(100, args.requests), concurrency=args.concurrency)  # Aquecimento
+        results[mode] = run_closed_loop(url, test_data, n_requests=args.requests, concurrency=args.concurrency)
+
+    server.shutdown()
+
+    print(f"{'modo':<14}{'req/s':>10}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for mode, result in results.items():
+        print(f"{mode:<14}{result['throughput']:>10.1f}{result['p50_ms']:>12.2f}{result['p99_ms']:>12.2f}")
+    speedup = results['com batching']['throughput'] / results['sem batching']['throughput']
+    print(f"Ganho de vazão com batching: {speedup:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
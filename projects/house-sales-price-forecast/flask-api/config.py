@@ -1,2 +1,64 @@
+import os
+
+
 class Config:
-    MODEL_PATH = "./data/xgboost_model.pkl"
\ No newline at end of file
+    # Pipeline serializado (.pkl) ou especificação do formato nativo (.json, gerada pelo export_model.py)
+    MODEL_PATH = os.getenv("MODEL_PATH", "./data/xgboost_model.pkl")
+    NATIVE_MODEL_PATH = "./data/native/xgboost_model.json"
+
+    # Carga do modelo em segundo plano, aquecimento e troca a quente quando o arquivo muda (a carga em segundo
+    # plano e a troca são opcionais: por padrão, o modelo é carregado antes da primeira requisição e não é trocado)
+    MODEL_BACKGROUND_LOADING = os.getenv("MODEL_BACKGROUND_LOADING", "false").lower() == "true"
+    MODEL_WARMUP_ROWS = int(os.getenv("MODEL_WARMUP_ROWS", "64"))
+    MODEL_RELOAD_INTERVAL_SECONDS = float(os.getenv("MODEL_RELOAD_INTERVAL_SECONDS", "0"))
+    MODEL_NOT_READY_RETRY_AFTER_SECONDS = int(os.getenv("MODEL_NOT_READY_RETRY_AFTER_SECONDS", "1"))
+
+    # Validação dos registros: rejeita categorias desconhecidas também nas variáveis one-hot
+    SCHEMA_STRICT_CATEGORIES = os.getenv("SCHEMA_STRICT_CATEGORIES", "true").lower() == "true"
+
+    # Codificação dos registros direto para NumPy, sem DataFrame
+    FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() == "true"
+
+    # Motor de inferência: 'xgboost' (preditor do XGBoost) ou 'compiled' (árvores compiladas em arrays NumPy,
+    # percorridas com numba), com limiares 'float32' ou 'quantized'
+    INFERENCE_ENGINE = os.getenv("INFERENCE_ENGINE", "xgboost").lower()
+    COMPILED_THRESHOLDS = os.getenv("COMPILED_THRESHOLDS", "float32").lower()
+
+    # Capping percentual dos outliers com os limites ajustados no treino (JSON salvo pelo PercentileCapper
+    # do módulo utils); vazio desabilita o capping
+    OUTLIER_CAPPING_PATH = os.getenv("OUTLIER_CAPPING_PATH", "") or None
+
+    # Cache de predições por registro (0 desabilita o cache)
+    CACHE_SIZE = int(os.getenv("CACHE_SIZE", "0"))
+    CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+
+    # Micro-batching das requisições de predição
+    BATCHING_ENABLED = os.getenv("BATCHING_ENABLED", "false").lower() == "true"
+    BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "64"))
+    BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "5"))
+    BATCH_RESULT_TIMEOUT_SECONDS = float(os.getenv("BATCH_RESULT_TIMEOUT_SECONDS", "30"))
+
+    # Predição em lote de arquivos (CSV/Parquet)
+    SCORING_CHUNK_SIZE = int(os.getenv("SCORING_CHUNK_SIZE", "10000"))
+
+    # Servidor de produção (gunicorn com workers pré-forkados)
+    SERVER_BIND = os.getenv("SERVER_BIND", "127.0.0.1:8000")
+    SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "2"))
+    SERVER_THREADS = int(os.getenv("SERVER_THREADS", "4"))
+    SERVER_PRELOAD = os.getenv("SERVER_PRELOAD", "true").lower() == "true"
+    XGBOOST_THREADS_PER_WORKER = int(os.getenv("XGBOOST_THREADS_PER_WORKER", "1"))
+
+    # Entrada ASGI (asgi_app.py)
+    ASGI_WORKER_THREADS = int(os.getenv("ASGI_WORKER_THREADS", "4"))
+    ASGI_MAX_PENDING = int(os.getenv("ASGI_MAX_PENDING", "64"))
+    ASGI_RETRY_AFTER_SECONDS = int(os.getenv("ASGI_RETRY_AFTER_SECONDS", "1"))
+
+    # Logs da API
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_JSON = os.getenv("LOG_JSON", "true").lower() == "true"
+    LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() == "true"
+    LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0"))
+    LOG_PAYLOAD_MAX_BYTES = int(os.getenv("LOG_PAYLOAD_MAX_BYTES", "2048"))
+
+    # Métricas no formato do Prometheus (rota /metrics)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
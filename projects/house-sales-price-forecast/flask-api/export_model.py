@@ -0,0 +1,23 @@
+import argparse
+
+import joblib
+
+from config import Config
+from models.native_model import export_native_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta o modelo para o formato nativo (especificação + booster do XGBoost)")
+    parser.add_argument('input', nargs='?', default=Config.MODEL_PATH, help="Caminho do modelo serializado (.pkl)")
+    parser.add_argument('-o', '--output', default=Config.NATIVE_MODEL_PATH,
+                        help="Caminho da especificação exportada (.json); o booster é gravado ao lado")
+    parser.add_argument('--booster-format', choices=['ubj', 'json'], default='ubj', help="Formato do booster")
+    args = parser.parse_args()
+
+    pipeline = joblib.load(args.input)
+    booster_path = export_native_model(pipeline, spec_path=args.output, booster_format=args.booster_format)
+    print(f"Especificação: {args.output}\nBooster: {booster_path}")
+
+
+if __name__ == '__main__':
+    main()
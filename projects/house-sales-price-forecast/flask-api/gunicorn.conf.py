@@ -0,0 +1,36 @@
+# Configuração do servidor de produção
+# Execução (a partir do diretório flask-api):
+#     gunicorn -c gunicorn.conf.py app:app
+import gc
+import os
+
+from config import Config
+
+bind = Config.SERVER_BIND
+workers = Config.SERVER_WORKERS
+threads = Config.SERVER_THREADS
+worker_class = 'gthread'
+
+# Com preload, o modelo é carregado uma única vez no processo mestre e compartilhado
+# com os workers por copy-on-write, em vez de ser desserializado em cada worker
+preload_app = Config.SERVER_PRELOAD
+
+# A carga em segundo plano terminaria depois do fork e cada worker carregaria sua própria cópia; sem preload,
+# cada worker carrega o modelo em segundo plano e responde 503 até terminar, salvo configuração explícita
+if preload_app:
+    Config.MODEL_BACKGROUND_LOADING = False
+elif "MODEL_BACKGROUND_LOADING" not in os.environ:
+    Config.MODEL_BACKGROUND_LOADING = True
+
+
+def when_ready(server):
+    # Move os objetos já carregados (modelo incluso) para a geração permanente do coletor de lixo,
+    # evitando que as varreduras do GC nos workers modifiquem e dupliquem as páginas compartilhadas
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    # Limita as threads do XGBoost por worker para não sobrecarregar os núcleos da máquina
+    from app import model_handler
+
+    model_handler.set_n_threads(Config.XGBOOST_THREADS_PER_WORKER)
@@ -0,0 +1,214 @@
+import codecs
+import json
+
+import numpy as np
+import pandas as pd
+from models.feature_engineering import prepare_raw_features
+from models.schema import predict_valid_records
+
+SUPPORTED_FORMATS = ('csv', 'parquet')
+
+
+def infer_file_format(filename: str = None, content_type: str = None) -> str:
+    """
+    Identifica o formato do arquivo a partir da extensão ou do content type.
+
+    Args:
+        filename (str): Nome do arquivo enviado.
+        content_type (str): Content type da requisição.
+
+    Returns:
+        str: 'csv' ou 'parquet'.
+
+    Raises:
+        ValueError: Se o formato não puder ser identificado.
+    """
+    if filename:
+        extension = filename.rsplit('.', 1)[-1].lower()
+        if extension in SUPPORTED_FORMATS:
+            return extension
+    if content_type:
+        if 'parquet' in content_type:
+            return 'parquet'
+        if 'csv' in content_type:
+            return 'csv'
+    raise ValueError("Could not infer file format, use 'csv' or 'parquet'")
+
+
+def read_chunks(source, file_format: str, chunk_size: int):
+    """
+    Lê o arquivo em blocos de tamanho fixo, mantendo a memória constante independentemente do tamanho do arquivo.
+
+    Args:
+        source (str | file-like): Caminho ou objeto de arquivo. Para Parquet, o objeto deve permitir `seek`.
+        file_format (str): 'csv' ou 'parquet'.
+        chunk_size (int): Número de linhas por bloco.
+
+    Yields:
+        pandas.DataFrame: Bloco de linhas do arquivo.
+    """
+    if file_format == 'csv':
+        yield from pd.read_csv(source, chunksize=chunk_size)
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        for record_batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield record_batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format: '{file_format}'")
+
+
+def score_chunks(model_handler, chunks, id_column: str = 'Id', prediction_column: str = 'SalePrice',
+                 prepare: bool = True):
+    """
+    Prediz cada bloco com o ModelHandler e gera o resultado em CSV, bloco a bloco.
+
+    Args:
+        model_handler (ModelHandler): Manipulador do modelo usado para as predições.
+        chunks (iterable): Blocos de dados (pandas.DataFrame).
+        id_column (str): Coluna de identificação copiada para a saída, se existir nos dados.
+        prediction_column (str): Nome da coluna de predições na saída.
+        prepare (bool): Se True, aplica a preparação dos dados brutos do Kaggle antes da predição.
+
+    Yields:
+        str: Trecho de CSV com as predições do bloco (o primeiro trecho inclui o cabeçalho).
+    """
+    header = True
+    for chunk in chunks:
+        features_df = prepare_raw_features(chunk) if prepare else chunk
+
+        # O modelo prediz em float32; mantém o tipo para a mesma formatação da submissão
+        predictions = np.asarray(model_handler.predict(df=features_df), dtype=np.float32)
+
+        output_df = pd.DataFrame({prediction_column: predictions})
+        if id_column in chunk.columns:
+            output_df.insert(0, id_column, chunk[id_column].to_numpy())
+
+        yield output_df.to_csv(index=False, header=header)
+        header = False
+
+
+def read_json_chunks(stream, chunk_size: int, read_size: int = 65536):
+    """
+    Lê um lote JSON de forma incremental, em blocos de registros, sem carregar o corpo inteiro na memória.
+
+    Aceita um array JSON de objetos (`[{...}, {...}]`) ou NDJSON (um objeto por linha). Apenas um
+    trecho de `read_size` bytes e o bloco de registros atual ficam em memória.
+
+    Args:
+        stream (file-like): Corpo da requisição (ou arquivo) aberto em modo binário.
+        chunk_size (int): Número de registros por bloco.
+        read_size (int): Número de bytes lidos do stream por vez.
+
+    Yields:
+        list: Bloco de registros (dicionários), com no máximo `chunk_size` itens.
+
+    Raises:
+        ValueError: Se o corpo não for um array JSON nem NDJSON válido, ou se `chunk_size` não for positivo.
+    """
+    # Com um bloco vazio ou negativo, o corpo inteiro seria acumulado em um único bloco
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer, position, eof = '', 0, False
+
+    def read_more():
+        # Descarta o trecho já consumido e acrescenta os próximos bytes do stream
+        nonlocal buffer, position, eof
+        data = stream.read(read_size)
+        eof = not data
+        buffer = buffer[position:] + utf8_decoder.decode(data, final=eof)
+        position = 0
+
+    in_array, expect_separator = None, False
+    chunk = []
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n':
+            position += 1
+        if position == len(buffer):
+            if eof:
+                break
+            read_more()
+            continue
+
+        if in_array is None:
+            in_array = buffer[position] == '['
+            position += in_array
+            continue
+        if in_array and buffer[position] == ']' and expect_separator is not None:
+            position += 1
+            while not buffer[position:].strip() and not eof:
+                read_more()
+            if buffer[position:].strip():
+                raise ValueError("Unexpected data after the end of the JSON array")
+            in_array = False
+            break
+        if in_array and expect_separator:
+            if buffer[position] != ',':
+                raise ValueError(f"Expected ',' or ']' in the JSON array, got {buffer[position]!r}")
+            position += 1
+            expect_separator = None  # Depois da vírgula, um valor é obrigatório
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            # Registro incompleto no fim do trecho: lê mais bytes e tenta novamente
+            if eof:
+                raise ValueError(f"Invalid JSON batch: {str(e)}")
+            read_more()
+            continue
+        if end == len(buffer) and not eof:
+            # Um número no fim do trecho pode continuar no próximo: só aceita o valor com o delimitador lido
+            read_more()
+            continue
+
+        chunk.append(record)
+        position = end
+        expect_separator = True
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if in_array:
+        raise ValueError("Invalid JSON batch: unterminated array")
+    if chunk:
+        yield chunk
+
+
+def score_records_ndjson(model_handler, record_chunks):
+    """
+    Valida e prediz cada bloco de registros com o ModelHandler e gera o resultado em NDJSON, bloco a bloco.
+
+    Cada linha de saída corresponde a um registro de entrada, na mesma ordem: `{"row", "prediction"}`,
+    com `"prediction": null` e a lista `"errors"` nos registros rejeitados pela validação.
+
+    Args:
+        model_handler (ModelHandler): Manipulador do modelo usado para a validação e as predições.
+        record_chunks (iterable): Blocos de registros (listas de dicionários), ex.: de `read_json_chunks`.
+
+    Yields:
+        str: Trecho de NDJSON com as predições do bloco.
+    """
+    offset = 0
+    for records in record_chunks:
+        errors = model_handler.validate_records(records=records)
+        predictions = predict_valid_records(model_handler.predict_records, records=records, errors=errors)
+
+        errors_by_row = {}
+        for error in errors:
+            errors_by_row.setdefault(error['row'], []).append(
+                {'field': error['field'], 'message': error['message']})
+
+        lines = []
+        for i, prediction in enumerate(predictions):
+            line = {'row': offset + i, 'prediction': prediction}
+            if i in errors_by_row:
+                line['errors'] = errors_by_row[i]
+            lines.append(json.dumps(line))
+        lines.append('')
+
+        offset += len(records)
+        yield '\n'.join(lines)
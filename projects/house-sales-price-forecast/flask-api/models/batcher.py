@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from queue import Queue, Empty
+
+
+class MicroBatcher:
+    def __init__(self, model_handler, max_batch_size: int = 64, max_wait_ms: float = 5.0,
+                 result_timeout_seconds: float = 30.0):
+        """
+        Inicializa a camada de micro-batching na frente do manipulador do modelo.
+
+        Requisições concorrentes são agrupadas em uma janela de até `max_wait_ms` milissegundos
+        ou até somarem `max_batch_size` linhas, e são preditas em uma única chamada vetorizada.
+
+        Args:
+            model_handler (ModelHandler): Manipulador do modelo usado para as predições.
+            max_batch_size (int): Número máximo de linhas agrupadas em um lote.
+            max_wait_ms (float): Tempo máximo, em milissegundos, que um lote aguarda novas requisições.
+            result_timeout_seconds (float): Tempo máximo, em segundos, que uma requisição aguarda suas predições.
+        """
+        self.model_handler = model_handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.result_timeout = result_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+
+    def _ensure_worker(self):
+        # A thread de agrupamento é criada sob demanda em cada processo, pois threads não
+        # sobrevivem ao fork dos workers do servidor de produção
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = Queue()
+                threading.Thread(target=self._run, args=(self._queue,), name="micro-batcher", daemon=True).start()
+                self._pid = os.getpid()
+
+    def predict_records(self, records: list) -> list:
+        """
+        Enfileira os registros e aguarda as predições do lote em que eles foram incluídos.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+
+        Returns:
+            list: Lista de predições, na mesma ordem de `records`.
+
+        Raises:
+            TimeoutError: Se as predições não ficarem prontas em `result_timeout_seconds`.
+        """
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((records, future))
+        try:
+            return future.result(timeout=self.result_timeout)
+        except FuturesTimeoutError:
+            raise TimeoutError(f"Batched prediction did not complete within {self.result_timeout}s") from None
+
+    def _run(self, queue: Queue):
+        while True:
+            batch = self._collect_batch(queue)
+
+            # Agrupa apenas requisições com as mesmas colunas, para que um payload
+            # incompleto não tenha as colunas faltantes completadas por outras requisições
+            groups = {}
+            for records, future in batch:
+                # Um registro que não é um dicionário falha apenas a sua requisição, sem encerrar a thread
+                try:
+                    columns = frozenset().union(*records)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                groups.setdefault(columns, []).append((records, future))
+
+            for pending in groups.values():
+                self._predict_group(pending)
+
+    def _collect_batch(self, queue: Queue) -> list:
+        # Bloqueia até a primeira requisição e abre a janela de espera a partir dela
+        batch = [queue.get()]
+        n_rows = len(batch[0][0])
+        deadline = time.monotonic() + self.max_wait
+
+        while n_rows < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = queue.get(timeout=remaining)
+            except Empty:
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+
+        return batch
+
+    def _predict_group(self, pending: list):
+        if len(pending) == 1:
+            records, future = pending[0]
+            self._predict_single(records, future)
+            return
+
+        try:
+            combined_records = [record for records, _ in pending for record in records]
+            predictions = self.model_handler.predict_records(records=combined_records)
+        except Exception:
+            # Em caso de erro no lote, prediz cada requisição separadamente para que
+            # apenas a requisição inválida receba o erro
+            for records, future in pending:
+                self._predict_single(records, future)
+            return
+
+        # Distribui as predições de volta para cada requisição
+        offset = 0
+        for records, future in pending:
+            future.set_result(predictions[offset:offset + len(records)])
+            offset += len(records)
+
+    def _predict_single(self, records: list, future: Future):
+        try:
+            future.set_result(self.model_handler.predict_records(records=records))
+        except Exception as e:
+            future.set_exception(e)
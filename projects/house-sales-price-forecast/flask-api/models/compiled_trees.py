@@ -0,0 +1,245 @@
+import json
+
+import numpy as np
+
+# Formatos dos limiares de divisão das árvores compiladas
+THRESHOLD_FORMATS = ('float32', 'quantized')
+
+
+class CompiledTreeEnsemble:
+    def __init__(self, booster, iteration_range: tuple = (0, 0), missing: float = np.nan,
+                 thresholds: str = 'float32'):
+        """
+        Compila um booster de árvores do XGBoost (gbtree, regressão) em arrays NumPy planos e prediz
+        percorrendo as árvores com um laço compilado pelo numba, sem o preditor genérico do XGBoost.
+
+        Todas as árvores ficam concatenadas nos mesmos arrays (variável, limiar, filhos, direção dos
+        valores faltantes e valor das folhas), com a raiz de cada árvore em `roots`. Como o XGBoost,
+        as features são comparadas em float32 (`x < limiar` vai para a esquerda).
+
+        Com `thresholds='quantized'`, os limiares de cada variável são substituídos pela sua posição
+        entre os limiares distintos da variável (uint16), e cada lote é discretizado uma única vez
+        antes do percurso. As decisões são as mesmas do float32, com arrays de nós menores.
+
+        Args:
+            booster (xgboost.Booster): Booster treinado.
+            iteration_range (tuple): Intervalo de iterações usado na predição ((0, 0) para todas).
+            missing (float): Valor tratado como faltante, além de NaN.
+            thresholds (str): 'float32' ou 'quantized'.
+
+        Raises:
+            NotImplementedError: Se o booster não for um gbtree de regressão com uma saída, ou tiver
+                divisões categóricas.
+            ValueError: Se o formato dos limiares não for suportado.
+        """
+        if thresholds not in THRESHOLD_FORMATS:
+            raise ValueError(f"Unsupported threshold format: '{thresholds}'")
+
+        learner = json.loads(booster.save_raw('json'))['learner']
+        if learner['gradient_booster']['name'] != 'gbtree':
+            raise NotImplementedError(f"Unsupported booster: {learner['gradient_booster']['name']}")
+        if learner['objective']['name'] not in ('reg:squarederror', 'reg:absoluteerror', 'reg:pseudohubererror'):
+            raise NotImplementedError(f"Unsupported objective: {learner['objective']['name']}")
+        if int(learner['learner_model_param'].get('num_target', '1')) != 1:
+            raise NotImplementedError("Only single-target models are supported")
+
+        model = learner['gradient_booster']['model']
+        num_parallel_tree = int(model['gbtree_model_param']['num_parallel_tree'])
+        trees = model['trees']
+        start, end = iteration_range
+        if end > 0:
+            trees = trees[start * num_parallel_tree:end * num_parallel_tree]
+        if any(tree['categories_nodes'] for tree in trees):
+            raise NotImplementedError("Categorical splits are not supported")
+
+        self.thresholds = thresholds
+        self.n_features = int(learner['learner_model_param']['num_feature'])
+        self.base_score = float(learner['learner_model_param']['base_score'])
+        self.missing = missing
+
+        # Concatenação das árvores, com os índices dos filhos deslocados para a posição global
+        roots, features, split_values, left, right, default_left, values = [], [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            left_children = np.array(tree['left_children'], dtype=np.int32)
+            is_leaf = left_children == -1
+            roots.append(offset)
+            features.append(np.where(is_leaf, -1, np.array(tree['split_indices'], dtype=np.int32)))
+            split_values.append(np.array(tree['split_conditions'], dtype=np.float32))
+            left.append(np.where(is_leaf, -1, left_children + offset))
+            right.append(np.where(is_leaf, -1, np.array(tree['right_children'], dtype=np.int32) + offset))
+            default_left.append(np.array(tree['default_left'], dtype=np.bool_))
+            # Nas folhas, split_conditions guarda o valor da folha
+            values.append(np.where(is_leaf, np.array(tree['split_conditions'], dtype=np.float32), 0.0))
+            offset += len(left_children)
+
+        self.roots = np.array(roots, dtype=np.int32)
+        self.features = np.concatenate(features).astype(np.int32)
+        self.left = np.concatenate(left).astype(np.int32)
+        self.right = np.concatenate(right).astype(np.int32)
+        self.default_left = np.concatenate(default_left)
+        self.values = np.concatenate(values).astype(np.float32)
+        split_values = np.concatenate(split_values)
+
+        if thresholds == 'float32':
+            self.split_values = np.where(self.features >= 0, split_values, 0.0).astype(np.float32)
+            self.bin_edges = None
+        else:
+            # Limiares distintos de cada variável; o nó guarda a posição do seu limiar entre eles
+            self.bin_edges = [np.unique(split_values[self.features == feature]) for feature in range(self.n_features)]
+            if max(len(edges) for edges in self.bin_edges) >= MISSING_CODE:
+                raise NotImplementedError("Too many distinct thresholds for 16-bit quantization")
+            codes = np.zeros(len(self.features), dtype=np.uint16)
+            for feature, edges in enumerate(self.bin_edges):
+                nodes = self.features == feature
+                codes[nodes] = np.searchsorted(edges, split_values[nodes])
+            self.split_values = codes
+            self._edge_offsets = np.concatenate([[0], np.cumsum([len(edges) for edges in self.bin_edges])]
+                                                ).astype(np.int64)
+            self._edge_values = (np.concatenate(self.bin_edges) if self.bin_edges else np.empty(0)
+                                 ).astype(np.float32)
+
+        self._quantize, self._traverse = _load_kernels()
+
+    @classmethod
+    def from_model(cls, loaded_model, thresholds: str = 'float32') -> 'CompiledTreeEnsemble':
+        """
+        Compila o booster de um modelo carregado (pipeline do scikit-learn ou formato nativo).
+
+        Args:
+            loaded_model (LoadedModel): Versão do modelo carregada pelo ModelHandler.
+            thresholds (str): 'float32' ou 'quantized'.
+
+        Returns:
+            CompiledTreeEnsemble: Ensemble compilado com o mesmo intervalo de iterações e valor faltante.
+        """
+        if loaded_model.native is not None:
+            native = loaded_model.native
+            return cls(native.booster, iteration_range=native.iteration_range, missing=native.missing,
+                       thresholds=thresholds)
+        regressor = loaded_model.model[-1]
+        iteration_range = (0, regressor.best_iteration + 1) if hasattr(regressor, 'best_iteration') else (0, 0)
+        return cls(regressor.get_booster(), iteration_range=iteration_range, missing=regressor.missing,
+                   thresholds=thresholds)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Prediz percorrendo as árvores compiladas.
+
+        Args:
+            X (numpy.ndarray): Matriz de features de formato (n_linhas, n_features).
+
+        Returns:
+            numpy.ndarray: Predições em float32, como as do XGBoost.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if not np.isnan(self.missing):
+            X = np.where(X == np.float32(self.missing), np.float32(np.nan), X)
+
+        quantized = self.bin_edges is not None
+        if quantized:
+            # Discretização do lote: posição de cada valor entre os limiares da variável
+            X = self._quantize(X, self._edge_values, self._edge_offsets)
+
+        return self._traverse(X, self.roots, self.features, self.split_values, self.left, self.right,
+                              self.default_left, self.values, np.float32(self.base_score), quantized)
+
+
+def _quantize_numpy(X, edge_values, edge_offsets):
+    # x < limiar[j] equivale a (número de limiares <= x) <= j; valores faltantes recebem MISSING_CODE
+    codes = np.zeros(X.shape, dtype=np.uint16)
+    for feature in range(X.shape[1]):
+        edges = edge_values[edge_offsets[feature]:edge_offsets[feature + 1]]
+        if len(edges):
+            codes[:, feature] = np.searchsorted(edges, X[:, feature], side='right')
+    codes[np.isnan(X)] = MISSING_CODE
+    return codes
+
+
+def _traverse_numpy(X, roots, features, split_values, left, right, default_left, values, base_score, quantized):
+    # Percurso vetorizado: todas as linhas de todas as árvores descem um nível por iteração
+    rows = np.arange(X.shape[0])[:, None]
+    nodes = np.broadcast_to(roots, (X.shape[0], len(roots))).copy()
+    while True:
+        node_features = features[nodes]
+        active = node_features >= 0
+        if not active.any():
+            break
+        x = X[rows, np.where(active, node_features, 0)]
+        if quantized:
+            go_left = np.where(x == MISSING_CODE, default_left[nodes], x <= split_values[nodes])
+        else:
+            go_left = np.where(np.isnan(x), default_left[nodes], x < split_values[nodes])
+        nodes = np.where(active, np.where(go_left, left[nodes], right[nodes]), nodes)
+
+    # Soma das folhas em float32, árvore a árvore a partir do valor base, na mesma ordem do XGBoost
+    leaf_values = values[nodes]
+    totals = np.full(X.shape[0], base_score, dtype=np.float32)
+    for tree in range(len(roots)):
+        totals += leaf_values[:, tree]
+    return totals
+
+
+# Código dos valores faltantes na matriz quantizada
+MISSING_CODE = np.iinfo(np.uint16).max
+
+# Linhas percorridas juntas em cada árvore, para que os nós da árvore permaneçam no cache
+ROW_BLOCK_SIZE = 64
+
+# Funções compiladas pelo numba, criadas uma única vez por processo
+_numba_kernels = None
+
+
+def _load_kernels():
+    # O numba é opcional: sem ele, a predição usa as versões vetorizadas em NumPy
+    global _numba_kernels
+    if _numba_kernels is not None:
+        return _numba_kernels
+    try:
+        import numba
+    except ImportError:
+        return _quantize_numpy, _traverse_numpy
+
+    @numba.njit(nogil=True)
+    def quantize(X, edge_values, edge_offsets):
+        codes = np.empty(X.shape, dtype=np.uint16)
+        for i in range(X.shape[0]):
+            for feature in range(X.shape[1]):
+                x = X[i, feature]
+                if np.isnan(x):
+                    codes[i, feature] = MISSING_CODE
+                    continue
+                # Busca binária do número de limiares <= x
+                low, high = edge_offsets[feature], edge_offsets[feature + 1]
+                start = low
+                while low < high:
+                    middle = (low + high) // 2
+                    if edge_values[middle] <= x:
+                        low = middle + 1
+                    else:
+                        high = middle
+                codes[i, feature] = low - start
+        return codes
+
+    @numba.njit(nogil=True)
+    def traverse(X, roots, features, split_values, left, right, default_left, values, base_score, quantized):
+        totals = np.full(X.shape[0], base_score, dtype=np.float32)
+        # Blocos de linhas percorrem cada árvore em sequência; cada linha soma as folhas em float32,
+        # árvore a árvore a partir do valor base, na mesma ordem do XGBoost
+        for block_start in range(0, X.shape[0], ROW_BLOCK_SIZE):
+            block_end = min(block_start + ROW_BLOCK_SIZE, X.shape[0])
+            for root in roots:
+                for i in range(block_start, block_end):
+                    node = root
+                    while features[node] >= 0:
+                        x = X[i, features[node]]
+                        if quantized:
+                            go_left = default_left[node] if x == MISSING_CODE else x <= split_values[node]
+                        else:
+                            go_left = default_left[node] if np.isnan(x) else x < split_values[node]
+                        node = left[node] if go_left else right[node]
+                    totals[i] += values[node]
+        return totals
+
+    _numba_kernels = (quantize, traverse)
+    return _numba_kernels
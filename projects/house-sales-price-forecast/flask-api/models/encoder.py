@@ -0,0 +1,264 @@
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import FunctionTransformer, MinMaxScaler, OneHotEncoder, OrdinalEncoder, RobustScaler
+
+
+class ColumnarEncoder:
+    def __init__(self, preprocessor: ColumnTransformer):
+        """
+        Compila o esquema de entrada de um ColumnTransformer já treinado para codificar registros
+        (lista de dicionários) diretamente em um array NumPy, sem construir um DataFrame.
+
+        O resultado é idêntico, bit a bit, ao `preprocessor.transform` aplicado ao DataFrame
+        equivalente, pois as mesmas operações em float64 são aplicadas na mesma ordem.
+
+        Args:
+            preprocessor (ColumnTransformer): Etapa de pré-processamento do pipeline treinado.
+
+        Raises:
+            NotImplementedError: Se o pipeline possuir alguma transformação não suportada.
+        """
+        if not isinstance(preprocessor, ColumnTransformer):
+            raise NotImplementedError(f"Unsupported preprocessor: {type(preprocessor).__name__}")
+
+        self.input_columns = list(preprocessor.feature_names_in_)
+        self._steps = []
+        # Capping das variáveis numéricas aplicado antes das transformações (`PercentileCapper` do módulo utils)
+        self.capping = None
+
+        offset = 0
+        for _, transformer, columns in preprocessor.transformers_:
+            if transformer == 'drop':
+                continue
+            columns = [self.input_columns[c] if isinstance(c, (int, np.integer)) else c for c in columns]
+            step, n_outputs = self._compile_step(transformer, columns, offset)
+            self._steps.append(step)
+            offset += n_outputs
+
+        self.n_features_out = offset
+
+    @staticmethod
+    def _compile_step(transformer, columns, offset):
+        # Cada etapa compilada é uma tupla (tipo, colunas, posição inicial na saída, parâmetros)
+        if isinstance(transformer, MinMaxScaler):
+            if transformer.clip:
+                raise NotImplementedError("MinMaxScaler(clip=True) is not supported")
+            return ('minmax', columns, offset, (transformer.scale_, transformer.min_)), len(columns)
+
+        if isinstance(transformer, RobustScaler):
+            center = transformer.center_ if transformer.with_centering else None
+            scale = transformer.scale_ if transformer.with_scaling else None
+            return ('robust', columns, offset, (center, scale)), len(columns)
+
+        if transformer == 'passthrough' or (isinstance(transformer, FunctionTransformer) and transformer.func is None):
+            return ('passthrough', columns, offset, None), len(columns)
+
+        if isinstance(transformer, OneHotEncoder):
+            if transformer.drop is not None or transformer.handle_unknown != 'ignore':
+                raise NotImplementedError("Only OneHotEncoder(drop=None, handle_unknown='ignore') is supported")
+            vocabularies = [{category: code for code, category in enumerate(categories)}
+                            for categories in transformer.categories_]
+            n_outputs = sum(len(categories) for categories in transformer.categories_)
+            return ('onehot', columns, offset, vocabularies), n_outputs
+
+        if isinstance(transformer, OrdinalEncoder):
+            if transformer.handle_unknown != 'error':
+                raise NotImplementedError("Only OrdinalEncoder(handle_unknown='error') is supported")
+            vocabularies = [{category: code for code, category in enumerate(categories)}
+                            for categories in transformer.categories_]
+            return ('ordinal', columns, offset, vocabularies), len(columns)
+
+        raise NotImplementedError(f"Unsupported transformer: {type(transformer).__name__}")
+
+    def to_spec(self) -> dict:
+        """
+        Exporta o esquema compilado em uma especificação serializável em JSON, que pode ser
+        recarregada com `ColumnarEncoder.from_spec` sem o scikit-learn.
+
+        Returns:
+            dict: Colunas de entrada, número de features e etapas do pré-processamento.
+        """
+        steps = []
+        for kind, columns, offset, params in self._steps:
+            if kind == 'minmax':
+                scale, minimum = params
+                params = {'scale': scale.tolist(), 'min': minimum.tolist()}
+            elif kind == 'robust':
+                center, scale = params
+                params = {'center': center.tolist() if center is not None else None,
+                          'scale': scale.tolist() if scale is not None else None}
+            elif kind in ('onehot', 'ordinal'):
+                # A ordem das categorias define os códigos
+                params = {'categories': [[_to_builtin(category) for category in vocabulary] for vocabulary in params]}
+            steps.append({'kind': kind, 'columns': list(columns), 'offset': offset, 'params': params})
+        return {'input_columns': self.input_columns, 'n_features_out': self.n_features_out, 'steps': steps}
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> 'ColumnarEncoder':
+        """
+        Reconstrói o codificador a partir da especificação gerada por `to_spec`.
+
+        Args:
+            spec (dict): Especificação do pré-processamento.
+
+        Returns:
+            ColumnarEncoder: Codificador com o mesmo resultado, bit a bit, do original.
+        """
+        encoder = cls.__new__(cls)
+        encoder.input_columns = list(spec['input_columns'])
+        encoder.n_features_out = spec['n_features_out']
+        encoder._steps = []
+        encoder.capping = None
+        for step in spec['steps']:
+            kind, params = step['kind'], step['params']
+            if kind == 'minmax':
+                params = (np.array(params['scale'], dtype=np.float64), np.array(params['min'], dtype=np.float64))
+            elif kind == 'robust':
+                params = tuple(np.array(params[key], dtype=np.float64) if params[key] is not None else None
+                               for key in ('center', 'scale'))
+            elif kind in ('onehot', 'ordinal'):
+                params = [{category: code for code, category in enumerate(categories)}
+                          for categories in params['categories']]
+            encoder._steps.append((kind, step['columns'], step['offset'], params))
+        return encoder
+
+    def numeric_input_columns(self) -> list:
+        """
+        Lista as variáveis de entrada das etapas numéricas (minmax, robust e passthrough), as únicas em que o
+        capping dos outliers é aplicado.
+
+        Returns:
+            list: Nome das variáveis numéricas, na ordem das etapas.
+        """
+        return [column for kind, columns, _, _ in self._steps if kind in ('minmax', 'robust', 'passthrough')
+                for column in columns]
+
+    def feature_input_columns(self) -> list:
+        """
+        Identifica a variável de entrada que originou cada coluna da matriz de features, na ordem da saída
+        (as colunas one-hot de uma variável apontam todas para ela).
+
+        Returns:
+            list: Nome da variável de entrada de cada uma das `n_features_out` colunas.
+        """
+        feature_columns = []
+        for kind, columns, offset, params in self._steps:
+            if kind == 'onehot':
+                for column, vocabulary in zip(columns, params):
+                    feature_columns.extend([column] * len(vocabulary))
+            else:
+                feature_columns.extend(columns)
+        return feature_columns
+
+    def encode(self, records: list) -> np.ndarray:
+        """
+        Codifica os registros na matriz de features esperada pelo modelo.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+
+        Returns:
+            numpy.ndarray: Matriz float64 de formato (n_registros, n_features).
+
+        Raises:
+            ValueError: Se faltarem colunas, houver valores não numéricos em variáveis numéricas
+                ou categorias desconhecidas em variáveis ordinais.
+        """
+        return self._encode(
+            n_rows=len(records),
+            present_columns=set().union(*records),
+            get_values=lambda column: [record.get(column) for record in records],
+            get_block=lambda columns: np.array([[record.get(column) for column in columns] for record in records],
+                                               dtype=np.float64),
+        )
+
+    def encode_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Codifica um DataFrame na matriz de features esperada pelo modelo.
+
+        Args:
+            df (pandas.DataFrame): Dataframe dos dados.
+
+        Returns:
+            numpy.ndarray: Matriz float64 de formato (n_linhas, n_features).
+
+        Raises:
+            ValueError: Nas mesmas situações de `encode`.
+        """
+        return self._encode(
+            n_rows=len(df),
+            present_columns=set(df.columns),
+            get_values=lambda column: df[column].tolist(),
+            get_block=lambda columns: df[columns].to_numpy(dtype=np.float64, copy=True),
+        )
+
+    def encode_columns(self, columns: dict, n_rows: int) -> np.ndarray:
+        """
+        Codifica um lote colunar (mapa de nome da coluna para os valores de todas as linhas).
+
+        Args:
+            columns (dict): Valores de cada coluna, em listas ou arrays NumPy do mesmo tamanho.
+            n_rows (int): Número de linhas do lote.
+
+        Returns:
+            numpy.ndarray: Matriz float64 de formato (n_linhas, n_features).
+
+        Raises:
+            ValueError: Nas mesmas situações de `encode`.
+        """
+        return self._encode(
+            n_rows=n_rows,
+            present_columns=set(columns),
+            get_values=lambda column: columns[column],
+            get_block=lambda block_columns: np.column_stack(
+                [np.asarray(columns[column], dtype=np.float64) for column in block_columns]).reshape(n_rows, -1),
+        )
+
+    def _encode(self, n_rows, present_columns, get_values, get_block) -> np.ndarray:
+        missing_columns = set(self.input_columns) - present_columns
+        if missing_columns:
+            raise ValueError(f"columns are missing: {missing_columns}")
+
+        X = np.zeros((n_rows, self.n_features_out), dtype=np.float64)
+        rows = np.arange(n_rows)
+
+        for kind, columns, offset, params in self._steps:
+            if kind in ('minmax', 'robust', 'passthrough'):
+                block = get_block(columns)
+                if self.capping is not None:
+                    self.capping.cap_array(block, columns)
+                if kind == 'minmax':
+                    scale, minimum = params
+                    block *= scale
+                    block += minimum
+                elif kind == 'robust':
+                    center, scale = params
+                    if center is not None:
+                        block -= center
+                    if scale is not None:
+                        block /= scale
+                X[:, offset:offset + len(columns)] = block
+
+            elif kind == 'onehot':
+                for column, vocabulary in zip(columns, params):
+                    codes = np.array([vocabulary.get(value, -1) for value in get_values(column)], dtype=np.int64)
+                    known = codes >= 0
+                    X[rows[known], offset + codes[known]] = 1.0
+                    offset += len(vocabulary)
+
+            elif kind == 'ordinal':
+                for i, (column, vocabulary) in enumerate(zip(columns, params)):
+                    values = get_values(column)
+                    codes = [vocabulary.get(value, -1) for value in values]
+                    unknown = sorted({str(value) for value, code in zip(values, codes) if code < 0})
+                    if unknown:
+                        raise ValueError(f"Found unknown categories {unknown} in column '{column}' during transform")
+                    X[:, offset + i] = codes
+
+        return X
+
+
+def _to_builtin(value):
+    # Converte escalares NumPy nos tipos nativos equivalentes, para a serialização em JSON
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# Valores de imputação definidos no notebook do projeto
+LOT_FRONTAGE_IMPUTATION_VALUE = 67.0
+MODE_IMPUTATION_VALUES = {
+    'MSZoning': 'RL',
+    'Exterior1st': 'VinylSd',
+    'Exterior2nd': 'VinylSd',
+    'SaleType': 'WD',
+    'KitchenQual': 'TA',
+    'Functional': 'Typ',
+}
+ZERO_IMPUTATION_VARS = ['MasVnrArea', 'GarageYrBlt', 'BsmtFinSF1', 'BsmtFinSF2', 'BsmtUnfSF', 'TotalBsmtSF',
+                        'BsmtFullBath', 'BsmtHalfBath', 'GarageCars', 'GarageArea']
+PORCH_VARS = ['OpenPorchSF', 'EnclosedPorch', '3SsnPorch', 'ScreenPorch']
+QUALITATIVE_VARS = ['MSZoning', 'Street', 'Alley', 'LotShape', 'LandContour', 'Utilities', 'LotConfig', 'LandSlope',
+                    'Neighborhood', 'Condition1', 'Condition2', 'BldgType', 'HouseStyle', 'RoofStyle', 'RoofMatl',
+                    'Exterior1st', 'Exterior2nd', 'MasVnrType', 'ExterQual', 'ExterCond', 'Foundation', 'BsmtQual',
+                    'BsmtCond', 'BsmtExposure', 'BsmtFinType1', 'BsmtFinType2', 'Heating', 'HeatingQC', 'Electrical',
+                    'KitchenQual', 'Functional', 'FireplaceQu', 'GarageType', 'GarageFinish', 'GarageQual',
+                    'GarageCond', 'PavedDrive', 'PoolQC', 'Fence', 'MiscFeature', 'SaleType', 'SaleCondition']
+
+
+def prepare_raw_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aplica aos dados brutos do Kaggle (ex.: `test.csv`) as regras de imputação e criação de variáveis
+    do notebook, gerando as colunas esperadas pelo pipeline do modelo.
+
+    As regras são aplicadas linha a linha, com valores de imputação fixos, de modo que o resultado
+    de um bloco de linhas não depende das demais linhas do arquivo.
+
+    Args:
+        df (pandas.DataFrame): Dataframe com as colunas originais do conjunto de dados.
+
+    Returns:
+        pandas.DataFrame: Cópia do dataframe com os valores imputados e as variáveis criadas.
+    """
+    df = df.copy()
+
+    # Garante o tipo das variáveis qualitativas mesmo em blocos em que uma coluna está toda ausente
+    qualitative_vars = [var for var in QUALITATIVE_VARS if var in df.columns]
+    df[qualitative_vars] = df[qualitative_vars].astype(object)
+
+    df['LotFrontage'] = df['LotFrontage'].fillna(LOT_FRONTAGE_IMPUTATION_VALUE)
+
+    # Inconsistências entre tipo e área de revestimento de alvenaria
+    df.loc[df['MasVnrType'].isna() & (df['MasVnrArea'] > 0), 'MasVnrType'] = 'BrkFace'
+    df.loc[df['MasVnrType'].notna() & (df['MasVnrArea'] == 0), 'MasVnrType'] = np.nan
+
+    # Inconsistências entre qualidade e condição do porão
+    df.loc[df['BsmtCond'].isna() & df['BsmtQual'].notna(), 'BsmtCond'] = 'TA'
+    df.loc[df['BsmtQual'].isna() & df['BsmtCond'].notna(), 'BsmtQual'] = 'TA'
+
+    # Ano de construção da garagem posterior à coleta dos dados
+    invalid_garage_year = df['GarageYrBlt'] > 2010
+    df.loc[invalid_garage_year, 'GarageYrBlt'] = df.loc[invalid_garage_year, 'YearRemodAdd']
+
+    # Garagens com tipo informado, mas sem as demais características
+    incomplete_garage = df['GarageType'].notna() & df['GarageFinish'].isna()
+    df.loc[incomplete_garage & df['GarageArea'].isna(), 'GarageType'] = np.nan
+    garage_with_area = incomplete_garage & df['GarageArea'].notna()
+    df.loc[garage_with_area, ['GarageFinish', 'GarageQual', 'GarageCond']] = ['Unf', 'TA', 'TA']
+
+    df[ZERO_IMPUTATION_VARS] = df[ZERO_IMPUTATION_VARS].fillna(0)
+    df = df.fillna(MODE_IMPUTATION_VALUES)
+
+    # Valores ausentes nas variáveis qualitativas indicam ausência da característica
+    df[qualitative_vars] = df[qualitative_vars].fillna('None')
+
+    df['CentralAir'] = (df['CentralAir'] == 'Y').astype(int)
+
+    # Variáveis criadas a partir das áreas de varanda
+    df['TotalPorchSF'] = df[PORCH_VARS].sum(axis=1)
+    df['HasPorch'] = (df['TotalPorchSF'] > 0).astype(int)
+    df['CountPorch'] = (df[PORCH_VARS] > 0).sum(axis=1)
+
+    return df
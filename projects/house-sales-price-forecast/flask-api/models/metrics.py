@@ -0,0 +1,91 @@
+import os
+from contextlib import nullcontext
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import multiprocess
+
+# Etapas de uma predição, na ordem em que acontecem
+STAGES = ('parse', 'validate', 'frame_build', 'preprocess', 'model', 'explain', 'serialize')
+
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000)
+
+# Contexto vazio compartilhado, usado quando as métricas estão desabilitadas
+_NO_TIMER = nullcontext()
+
+
+class PredictionMetrics:
+    def __init__(self, enabled: bool = True):
+        """
+        Inicializa as métricas de latência e vazão das predições, no formato do Prometheus.
+
+        Com as métricas desabilitadas, todas as chamadas retornam imediatamente.
+
+        Args:
+            enabled (bool): Se False, nenhuma métrica é registrada.
+        """
+        self.enabled = enabled
+        if not enabled:
+            return
+
+        self.registry = CollectorRegistry()
+        stage_seconds = Histogram('prediction_stage_seconds', "Time spent in each prediction stage",
+                                  ['stage'], buckets=STAGE_BUCKETS, registry=self.registry)
+        self.batch_size = Histogram('prediction_batch_size', "Rows sent to the model per call",
+                                    buckets=BATCH_SIZE_BUCKETS, registry=self.registry)
+        self.errors = Counter('prediction_errors', "Errors in the prediction routes", ['endpoint', 'error_type'],
+                              registry=self.registry)
+
+        # Séries de cada etapa criadas antecipadamente, evitando a busca por rótulo a cada predição
+        self._stage_seconds = {stage: stage_seconds.labels(stage=stage) for stage in STAGES}
+
+    def time_stage(self, stage: str):
+        """
+        Mede o tempo de uma etapa da predição.
+
+        Args:
+            stage (str): Nome da etapa (ver `STAGES`).
+
+        Returns:
+            Gerenciador de contexto que registra a duração do bloco no histograma da etapa.
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return self._stage_seconds[stage].time()
+
+    def observe_batch_size(self, n_rows: int):
+        """
+        Registra o número de linhas de uma chamada ao modelo.
+
+        Args:
+            n_rows (int): Número de linhas da chamada.
+        """
+        if self.enabled:
+            self.batch_size.observe(n_rows)
+
+    def count_error(self, endpoint: str, error_type: str):
+        """
+        Incrementa o contador de erros.
+
+        Args:
+            endpoint (str): Rota em que o erro aconteceu (ex.: '/predict').
+            error_type (str): Tipo do erro (ex.: 'value_error', 'internal').
+        """
+        if self.enabled:
+            self.errors.labels(endpoint=endpoint, error_type=error_type).inc()
+
+    def render(self) -> tuple:
+        """
+        Gera as métricas no formato de texto do Prometheus.
+
+        Com gunicorn e vários workers, definir PROMETHEUS_MULTIPROC_DIR agrega as métricas de todos
+        os processos.
+
+        Returns:
+            tuple: Conteúdo (bytes) e content type da resposta.
+        """
+        registry = self.registry
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,15 +1,522 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+import numpy as np
 import pandas as pd
 import joblib
+import xgboost as xgb
+from models.compiled_trees import CompiledTreeEnsemble
+from models.encoder import ColumnarEncoder
+from models.metrics import PredictionMetrics
+from models.native_model import NativeModel
+from models.outlier_capping import load_outlier_capping
+from models.prediction_cache import PredictionCache
+from models.schema import InputSchema
+
+logger = logging.getLogger(__name__)
+
+
+class ModelNotReadyError(RuntimeError):
+    """Erro lançado quando uma predição é solicitada antes de o modelo terminar de carregar."""
+
+
+class LoadedModel:
+    def __init__(self, model_path: str, fast_path: bool, cache_size: int, cache_ttl_seconds: float,
+                 strict_categories: bool = True, inference_engine: str = 'xgboost',
+                 compiled_thresholds: str = 'float32', outlier_capping_path: str = None):
+        """
+        Carrega uma versão do modelo a partir do disco, com o codificador e o cache dessa versão.
+
+        Uma versão carregada nunca é modificada: a troca de modelo substitui o objeto inteiro, de modo
+        que as predições em andamento terminam na versão com que começaram.
+
+        Aceita o pipeline serializado com joblib (.pkl) ou o formato nativo gerado pelo `export_model.py`
+        (.json), que dispensa o scikit-learn e prediz com o booster do XGBoost diretamente.
+
+        Args:
+            model_path (str): Caminho para o arquivo do modelo salvo (.pkl ou especificação .json).
+            fast_path (bool): Se True, compila o esquema de entrada do pipeline no codificador colunar.
+                O formato nativo sempre usa o codificador colunar.
+            cache_size (int): Número máximo de predições mantidas em cache. Se 0, o cache é desabilitado.
+            cache_ttl_seconds (float): Tempo de validade de cada predição em cache, em segundos.
+            strict_categories (bool): Se True, o esquema de entrada rejeita categorias desconhecidas
+                também nas variáveis one-hot.
+            inference_engine (str): 'xgboost' (preditor do XGBoost) ou 'compiled' (árvores compiladas
+                em arrays NumPy, ver `CompiledTreeEnsemble`).
+            compiled_thresholds (str): Formato dos limiares das árvores compiladas ('float32' ou 'quantized').
+            outlier_capping_path (str): Limites do capping percentual (JSON salvo por `PercentileCapper.save`)
+                aplicados às variáveis numéricas antes do pré-processamento. Se None, desabilitado.
+
+        Raises:
+            ValueError: Se o motor de inferência não for suportado ou o capping tiver variáveis que não são
+                entradas numéricas do modelo.
+        """
+        # A identificação do arquivo é lida antes da desserialização, para que uma escrita
+        # concorrente seja detectada novamente na verificação seguinte
+        self.fingerprint = get_model_file_fingerprint(model_path)
+        self.version = datetime.fromtimestamp(self.fingerprint[0] / 1e9).isoformat()
+
+        self.model = None
+        self.native = None
+        self.encoder = None
+
+        if model_path.endswith('.json'):
+            self.native = NativeModel(model_path)
+            self.encoder = self.native.encoder
+        else:
+            self.model = joblib.load(model_path)
+
+        # O caminho rápido cobre pipelines no formato (pré-processador, regressor)
+        if self.model is not None and fast_path and len(self.model.steps) == 2:
+            try:
+                self.encoder = ColumnarEncoder(self.model[0])
+            except NotImplementedError:
+                # Pipeline com transformações não suportadas usa sempre o caminho via pandas
+                self.encoder = None
+
+        # Layout das etapas do pré-processamento, também no caminho via pandas (quando o pipeline é compilável)
+        layout_encoder = self.encoder
+        if layout_encoder is None and self.model is not None and len(self.model.steps) == 2:
+            try:
+                layout_encoder = ColumnarEncoder(self.model[0])
+            except NotImplementedError:
+                layout_encoder = None
+
+        # Capping dos outliers com os limites ajustados no treino, aplicado pelo codificador colunar
+        # ou, no caminho via pandas, ao DataFrame antes do pipeline
+        self.capping = None
+        if outlier_capping_path:
+            self.capping = load_outlier_capping(outlier_capping_path)
+            input_columns = layout_encoder.input_columns if layout_encoder is not None else self.model.feature_names_in_
+            unknown_columns = set(self.capping.limits_) - set(input_columns)
+            if unknown_columns:
+                raise ValueError(f"Outlier capping columns are not model inputs: {sorted(unknown_columns)}")
+            # O codificador colunar só aplica o capping às etapas numéricas: uma variável one-hot ou ordinal
+            # com capping teria predições diferentes nos dois caminhos
+            if layout_encoder is not None:
+                non_numeric_columns = set(self.capping.limits_) - set(layout_encoder.numeric_input_columns())
+                if non_numeric_columns:
+                    raise ValueError(f"Outlier capping columns are not numeric model inputs: {sorted(non_numeric_columns)}")
+            if self.encoder is not None:
+                self.encoder.capping = self.capping
+
+        # Motor de inferência alternativo: as mesmas árvores percorridas sobre arrays planos
+        if inference_engine not in ('xgboost', 'compiled'):
+            raise ValueError(f"Unsupported inference engine: '{inference_engine}'")
+        self.compiled = None
+        if inference_engine == 'compiled':
+            self.compiled = CompiledTreeEnsemble.from_model(self, thresholds=compiled_thresholds)
+
+        # O esquema de entrada é compilado a partir do codificador; sem ele, não há validação prévia
+        self.schema = None
+        if self.encoder is not None:
+            self.schema = InputSchema(self.encoder, strict_categories=strict_categories)
+
+        # As contribuições das features (ex.: cada coluna one-hot) são somadas por variável de entrada
+        self.explained_columns = None
+        self._contribution_matrix = None
+        if layout_encoder is not None:
+            feature_columns = layout_encoder.feature_input_columns()
+            self.explained_columns = list(dict.fromkeys(feature_columns))
+            column_index = {column: i for i, column in enumerate(self.explained_columns)}
+            self._contribution_matrix = np.zeros((len(feature_columns), len(self.explained_columns)))
+            self._contribution_matrix[np.arange(len(feature_columns)),
+                                      [column_index[column] for column in feature_columns]] = 1.0
+
+        # As predições em cache pertencem a esta versão do modelo e são descartadas junto com ela
+        self.cache = None
+        if cache_size > 0:
+            columns = self.encoder.input_columns if self.encoder is not None else None
+            self.cache = PredictionCache(max_size=cache_size, ttl_seconds=cache_ttl_seconds, columns=columns)
+
+    def synthetic_records(self, n_rows: int) -> list:
+        """
+        Gera registros sintéticos válidos para o aquecimento do modelo: zero nas variáveis numéricas
+        e a primeira categoria conhecida nas variáveis categóricas.
+
+        Args:
+            n_rows (int): Número de registros.
+
+        Returns:
+            list: Lista de dicionários, um por registro.
+        """
+        if self.native is not None:
+            spec = self.native.encoder.to_spec()
+            record = {column: 0 for column in spec['input_columns']}
+            for step in spec['steps']:
+                for column, categories in zip(step['columns'], (step['params'] or {}).get('categories', [])):
+                    record[column] = categories[0]
+        else:
+            record = {column: 0 for column in self.model.feature_names_in_}
+            for _, transformer, columns in self.model[0].transformers_:
+                for column, categories in zip(columns, getattr(transformer, 'categories_', [])):
+                    record[column] = categories[0]
+        return [dict(record) for _ in range(n_rows)]
+
+    def preprocess(self, df: pd.DataFrame):
+        """
+        Aplica o pré-processamento do modelo a um DataFrame.
+
+        Args:
+            df (pandas.DataFrame): Dataframe dos dados.
+
+        Returns:
+            Matriz de features esperada pelo regressor.
+        """
+        if self.native is not None:
+            return self.native.encoder.encode_frame(df)
+        if self.capping is not None:
+            df = self.capping.transform(df)
+        return self.model[:-1].transform(df)
+
+    def predict_features(self, X):
+        """
+        Prediz a partir da matriz de features já pré-processada.
+
+        Args:
+            X: Matriz de features.
+
+        Returns:
+            numpy.ndarray: Predições.
+        """
+        if self.compiled is not None:
+            return self.compiled.predict(X)
+        if self.native is not None:
+            return self.native.predict(X)
+        return self.model[-1].predict(X)
+
+    def explain_features(self, X, top_k: int = None) -> list:
+        """
+        Explica as predições a partir da matriz de features já pré-processada, com as contribuições
+        calculadas pelo XGBoost (TreeSHAP, `pred_contribs`) para o lote inteiro de uma vez.
+
+        As contribuições das features geradas a partir da mesma variável de entrada (ex.: colunas
+        one-hot) são somadas, de modo que cada explicação usa os nomes dos campos da requisição. O valor
+        base somado às contribuições (e a `other`, se truncadas) é igual à predição.
+
+        Args:
+            X: Matriz de features.
+            top_k (int): Se informado, mantém apenas as `top_k` variáveis de maior contribuição absoluta;
+                a soma das demais é retornada em `other`.
+
+        Returns:
+            list: Uma explicação por linha: {'base_value', 'contributions' (variável -> contribuição,
+                em ordem decrescente de valor absoluto) e, se truncada, 'other'}.
+
+        Raises:
+            ValueError: Se o pré-processamento do modelo não permitir mapear as features para as variáveis.
+        """
+        if self._contribution_matrix is None:
+            raise ValueError("Explanations are not supported for this model's preprocessing")
+
+        if self.native is not None:
+            contributions = self.native.predict_contributions(X)
+        else:
+            regressor = self.model[-1]
+            iteration_range = (0, regressor.best_iteration + 1) if hasattr(regressor, 'best_iteration') else (0, 0)
+            contributions = regressor.get_booster().predict(xgb.DMatrix(X, missing=regressor.missing),
+                                                            pred_contribs=True, iteration_range=iteration_range)
+
+        # A última coluna do pred_contribs é o valor base (bias)
+        column_contributions = contributions[:, :-1] @ self._contribution_matrix
+        base_values = contributions[:, -1].tolist()
+
+        order = np.argsort(-np.abs(column_contributions), axis=1, kind='stable')
+        truncated = top_k is not None and top_k < len(self.explained_columns)
+        if truncated:
+            order = order[:, :top_k]
+        top_contributions = np.take_along_axis(column_contributions, order, axis=1)
+        if truncated:
+            other = (column_contributions.sum(axis=1) - top_contributions.sum(axis=1)).tolist()
+
+        explanations = []
+        for i, (columns, values) in enumerate(zip(order.tolist(), top_contributions.tolist())):
+            explanation = {'base_value': base_values[i],
+                           'contributions': {self.explained_columns[c]: value for c, value in zip(columns, values)}}
+            if truncated:
+                explanation['other'] = other[i]
+            explanations.append(explanation)
+        return explanations
+
+    def set_n_threads(self, n_threads: int):
+        """
+        Define o número de threads usadas pelo XGBoost nas predições desta versão.
+
+        Args:
+            n_threads (int): Número de threads do XGBoost neste processo.
+        """
+        if self.native is not None:
+            self.native.set_n_threads(n_threads)
+            return
+        regressor = self.model[-1]
+        regressor.set_params(n_jobs=n_threads)
+        regressor.get_booster().set_param({'nthread': n_threads})
+
+
+def get_model_file_fingerprint(model_path: str) -> tuple:
+    stat = os.stat(model_path)
+    return stat.st_mtime_ns, stat.st_size
+
 
 class ModelHandler:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, fast_path: bool = True, cache_size: int = 0, cache_ttl_seconds: float = 3600,
+                 metrics: PredictionMetrics = None, background_loading: bool = False, warmup_rows: int = 0,
+                 reload_interval_seconds: float = 0, strict_categories: bool = True,
+                 inference_engine: str = 'xgboost', compiled_thresholds: str = 'float32',
+                 outlier_capping_path: str = None):
         """
         Inicializa o manipulador do modelo.
 
         Args:
-            model_path (str): Caminho para o arquivo do modelo salvo (.pkl).
+            model_path (str): Caminho para o arquivo do modelo salvo (.pkl ou especificação .json do formato nativo).
+            fast_path (bool): Se True, compila o esquema de entrada do pipeline para codificar
+                registros diretamente em arrays NumPy, sem passar pelo pandas.
+            cache_size (int): Número máximo de predições mantidas em cache. Se 0, o cache é desabilitado.
+            cache_ttl_seconds (float): Tempo de validade de cada predição em cache, em segundos.
+            metrics (PredictionMetrics): Métricas de latência por etapa e tamanho dos lotes. Se None, desabilitadas.
+            background_loading (bool): Se True, o modelo é carregado em uma thread separada e o construtor
+                retorna imediatamente; até o fim da carga, as predições lançam ModelNotReadyError.
+            warmup_rows (int): Tamanho do lote sintético predito após cada carga, antes de o modelo
+                receber requisições. Se 0, não há aquecimento.
+            reload_interval_seconds (float): Intervalo entre as verificações do arquivo do modelo; quando o
+                arquivo muda, a nova versão é carregada, aquecida e trocada atomicamente. Se 0, desabilitado.
+            strict_categories (bool): Se True, `validate_records` rejeita categorias desconhecidas também
+                nas variáveis one-hot (que o modelo ignoraria); as ordinais são sempre verificadas.
+            inference_engine (str): 'xgboost' ou 'compiled' (árvores compiladas em arrays NumPy e percorridas
+                com numba, com as mesmas predições do XGBoost).
+            compiled_thresholds (str): Formato dos limiares das árvores compiladas ('float32' ou 'quantized').
+            outlier_capping_path (str): Limites do capping percentual dos outliers (JSON salvo pelo
+                `PercentileCapper` dos notebooks), recarregados junto com cada versão do modelo. Se None, desabilitado.
+        """
+        self.model_path = model_path
+        self.fast_path = fast_path
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.metrics = metrics if metrics is not None else PredictionMetrics(enabled=False)
+        self.warmup_rows = warmup_rows
+        self.reload_interval_seconds = reload_interval_seconds
+        self.strict_categories = strict_categories
+        self.inference_engine = inference_engine
+        self.compiled_thresholds = compiled_thresholds
+        self.outlier_capping_path = outlier_capping_path
+        self.n_threads = None
+
+        self._loaded = None
+        self._lock = threading.Lock()
+        self._pid = None
+
+        if background_loading:
+            self._ensure_worker()
+        else:
+            self._loaded = self._load()
+
+    @property
+    def is_ready(self) -> bool:
+        """Indica se há uma versão do modelo carregada e aquecida."""
+        self._ensure_worker()
+        return self._loaded is not None
+
+    @property
+    def loaded(self) -> LoadedModel:
+        """Versão do modelo em uso. Lança ModelNotReadyError se o modelo ainda não foi carregado."""
+        self._ensure_worker()
+        loaded = self._loaded
+        if loaded is None:
+            raise ModelNotReadyError("Model is still loading")
+        return loaded
+
+    @property
+    def model(self):
+        return self.loaded.model
+
+    @property
+    def encoder(self) -> ColumnarEncoder:
+        return self.loaded.encoder
+
+    @property
+    def cache(self) -> PredictionCache:
+        loaded = self._loaded
+        return loaded.cache if loaded is not None else None
+
+    def _ensure_worker(self):
+        # A thread de carga e de verificação do arquivo é criada sob demanda em cada processo,
+        # pois threads não sobrevivem ao fork dos workers do servidor de produção
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                if self._loaded is None or self.reload_interval_seconds > 0:
+                    threading.Thread(target=self._run, name="model-loader", daemon=True).start()
+                self._pid = os.getpid()
+
+    def _run(self):
+        while self._loaded is None:
+            try:
+                self._loaded = self._load()
+            except Exception as e:
+                logger.error(f"Error while loading the model: {str(e)}")
+                time.sleep(max(self.reload_interval_seconds, 1.0))
+
+        while self.reload_interval_seconds > 0:
+            time.sleep(self.reload_interval_seconds)
+            try:
+                if get_model_file_fingerprint(self.model_path) != self._loaded.fingerprint:
+                    # Troca atômica: as requisições em andamento mantêm a referência à versão anterior
+                    self._loaded = self._load()
+                    logger.info(f"Model reloaded (version {self._loaded.version}).")
+            except Exception as e:
+                # Mantém a versão atual; a carga é tentada novamente na próxima verificação
+                logger.error(f"Error while reloading the model: {str(e)}")
+
+    def _load(self) -> LoadedModel:
+        start = time.perf_counter()
+        loaded = LoadedModel(self.model_path, fast_path=self.fast_path, cache_size=self.cache_size,
+                             cache_ttl_seconds=self.cache_ttl_seconds, strict_categories=self.strict_categories,
+                             inference_engine=self.inference_engine, compiled_thresholds=self.compiled_thresholds,
+                             outlier_capping_path=self.outlier_capping_path)
+        if self.n_threads is not None:
+            loaded.set_n_threads(self.n_threads)
+
+        # Aquecimento nos dois caminhos de predição, para que a primeira requisição real não pague
+        # a inicialização preguiçosa do XGBoost e do pandas (nem a compilação do numba, no motor compilado)
+        if self.warmup_rows > 0:
+            records = loaded.synthetic_records(self.warmup_rows)
+            loaded.predict_features(loaded.preprocess(pd.DataFrame(records)))
+            if loaded.encoder is not None:
+                loaded.predict_features(loaded.encoder.encode(records))
+
+        logger.info(f"Model loaded in {time.perf_counter() - start:.2f}s (version {loaded.version}).")
+        return loaded
+
+    def set_n_threads(self, n_threads: int):
+        """
+        Define o número de threads usadas pelo XGBoost nas predições, inclusive nas versões
+        do modelo carregadas depois desta chamada.
+
+        Args:
+            n_threads (int): Número de threads do XGBoost neste processo.
+        """
+        self.n_threads = n_threads
+        loaded = self._loaded
+        if loaded is not None:
+            loaded.set_n_threads(n_threads)
+
+    def validate_records(self, records: list) -> list:
+        """
+        Valida os registros contra o esquema de entrada do modelo, antes da predição.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+
+        Returns:
+            list: Erros por linha, no formato {'row', 'field', 'message'}. Lista vazia se todos os
+                registros forem válidos ou se o modelo não tiver esquema compilado (caminho via pandas).
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
+        """
+        schema = self.loaded.schema
+        if schema is None:
+            return []
+        with self.metrics.time_stage('validate'):
+            return schema.validate(records)
+
+    def validate_columns(self, columns: dict, n_rows: int) -> list:
+        """
+        Valida um lote colunar (ex.: MessagePack ou Arrow IPC) contra o esquema de entrada do modelo.
+
+        Args:
+            columns (dict): Valores de cada coluna, em listas ou arrays NumPy do mesmo tamanho.
+            n_rows (int): Número de linhas do lote.
+
+        Returns:
+            list: Erros por linha, no formato {'row', 'field', 'message'}.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
+            ValueError: Se faltarem colunas obrigatórias.
+        """
+        schema = self.loaded.schema
+        if schema is None:
+            return []
+        with self.metrics.time_stage('validate'):
+            return schema.validate_columns(columns, n_rows)
+
+    def predict_columns(self, columns: dict, n_rows: int) -> list:
+        """
+        Faz predições a partir de um lote colunar, sem passar por registros nem pelo cache.
+
+        Args:
+            columns (dict): Valores de cada coluna, em listas ou arrays NumPy do mesmo tamanho.
+            n_rows (int): Número de linhas do lote.
+
+        Returns:
+            list: Lista de predições.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
+        """
+        loaded = self.loaded
+        if loaded.encoder is None:
+            with self.metrics.time_stage('frame_build'):
+                df = pd.DataFrame(columns)
+            return self._predict_frame(loaded, df)
+
+        self.metrics.observe_batch_size(n_rows)
+
+        with self.metrics.time_stage('preprocess'):
+            X = loaded.encoder.encode_columns(columns, n_rows)
+        with self.metrics.time_stage('model'):
+            predictions = loaded.predict_features(X)
+        return predictions.tolist()
+
+    def explain(self, df: pd.DataFrame, top_k: int = None) -> list:
+        """
+        Explica as predições de um DataFrame com as contribuições de cada variável de entrada.
+
+        Args:
+            df (pandas.DataFrame): Dataframe dos dados.
+            top_k (int): Número máximo de variáveis por explicação (ver `LoadedModel.explain_features`).
+
+        Returns:
+            list: Uma explicação por linha.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
+        """
+        loaded = self.loaded
+        with self.metrics.time_stage('preprocess'):
+            X = loaded.preprocess(df)
+        with self.metrics.time_stage('explain'):
+            return loaded.explain_features(X, top_k=top_k)
+
+    def explain_records(self, records: list, top_k: int = None) -> list:
+        """
+        Explica as predições de uma lista de registros com as contribuições de cada variável de entrada.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+            top_k (int): Número máximo de variáveis por explicação (ver `LoadedModel.explain_features`).
+
+        Returns:
+            list: Uma explicação por registro.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
         """
-        self.model = joblib.load(model_path)
+        loaded = self.loaded
+        if loaded.encoder is None:
+            with self.metrics.time_stage('frame_build'):
+                df = pd.DataFrame(records)
+            with self.metrics.time_stage('preprocess'):
+                X = loaded.preprocess(df)
+        else:
+            with self.metrics.time_stage('preprocess'):
+                X = loaded.encoder.encode(records)
+        with self.metrics.time_stage('explain'):
+            return loaded.explain_features(X, top_k=top_k)
 
     def predict(self, df: pd.DataFrame) -> list:
         """
@@ -20,7 +527,67 @@ class ModelHandler:
 
         Returns:
             list: Lista de predições.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
+        """
+        return self._predict_frame(self.loaded, df)
+
+    def _predict_frame(self, loaded: LoadedModel, df: pd.DataFrame) -> list:
+        self.metrics.observe_batch_size(len(df))
+
+        # Equivalente a loaded.model.predict(df), separado para medir o pré-processamento e o modelo
+        with self.metrics.time_stage('preprocess'):
+            X = loaded.preprocess(df)
+        with self.metrics.time_stage('model'):
+            predictions = loaded.predict_features(X)
+        return predictions.tolist()
+
+    def predict_records(self, records: list) -> list:
+        """
+        Faz predições a partir de uma lista de registros (ex.: o JSON da requisição).
+
+        Usa o codificador colunar quando disponível, chamando o regressor diretamente sobre a
+        matriz de features; caso contrário, constrói o DataFrame e usa o pipeline completo.
+        Com o cache habilitado, apenas os registros ausentes do cache são enviados ao modelo.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+
+        Returns:
+            list: Lista de predições.
+
+        Raises:
+            ModelNotReadyError: Se o modelo ainda não foi carregado.
         """
+        # Toda a predição usa a mesma versão do modelo, mesmo que uma nova seja carregada no meio
+        loaded = self.loaded
+        if loaded.cache is None:
+            return self._predict_records(loaded, records)
+
+        keys = [loaded.cache.make_key(record) for record in records]
+        predictions = loaded.cache.get_many(keys)
+
+        missing_rows = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if missing_rows:
+            missing_predictions = self._predict_records(loaded, [records[i] for i in missing_rows])
+            loaded.cache.put_many([keys[i] for i in missing_rows], missing_predictions)
+            for i, prediction in zip(missing_rows, missing_predictions):
+                predictions[i] = prediction
+
+        return predictions
+
+    def _predict_records(self, loaded: LoadedModel, records: list) -> list:
+        if loaded.encoder is None:
+            with self.metrics.time_stage('frame_build'):
+                df = pd.DataFrame(records)
+            return self._predict_frame(loaded, df)
+
+        self.metrics.observe_batch_size(len(records))
 
-        predictions = self.model.predict(df)
-        return predictions.tolist()
\ No newline at end of file
+        # O codificador colunar monta a matriz de features sem DataFrame: a etapa de frame build não existe
+        with self.metrics.time_stage('preprocess'):
+            X = loaded.encoder.encode(records)
+        with self.metrics.time_stage('model'):
+            predictions = loaded.predict_features(X)
+        return predictions.tolist()
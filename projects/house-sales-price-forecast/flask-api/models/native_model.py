@@ -0,0 +1,117 @@
+import json
+import os
+
+import numpy as np
+import xgboost as xgb
+
+from models.encoder import ColumnarEncoder
+
+# Versão do formato da especificação exportada
+SPEC_FORMAT_VERSION = 1
+
+
+def export_native_model(pipeline, spec_path: str, booster_format: str = 'ubj') -> str:
+    """
+    Separa o pipeline treinado em uma especificação do pré-processamento (JSON) e no booster
+    nativo do XGBoost (JSON ou UBJSON), carregáveis sem o pickle do scikit-learn.
+
+    O booster é gravado ao lado da especificação, que é escrita por último e por renomeação,
+    para que a troca a quente do modelo nunca leia uma exportação incompleta.
+
+    Args:
+        pipeline (sklearn.pipeline.Pipeline): Pipeline treinado no formato (pré-processador, XGBRegressor).
+        spec_path (str): Caminho do arquivo de especificação (.json).
+        booster_format (str): Formato do booster: 'ubj' (binário, padrão) ou 'json'.
+
+    Returns:
+        str: Caminho do arquivo do booster.
+
+    Raises:
+        NotImplementedError: Se o pré-processador possuir alguma transformação não suportada.
+        ValueError: Se o formato do booster for inválido.
+    """
+    if booster_format not in ('ubj', 'json'):
+        raise ValueError(f"Unsupported booster format: '{booster_format}'")
+
+    encoder = ColumnarEncoder(pipeline[0])
+    regressor = pipeline[-1]
+
+    directory = os.path.dirname(spec_path)
+    os.makedirs(directory or '.', exist_ok=True)
+    booster_file = f"{os.path.splitext(os.path.basename(spec_path))[0]}.booster.{booster_format}"
+    booster_path = os.path.join(directory, booster_file)
+    regressor.get_booster().save_model(booster_path)
+
+    spec = {
+        'format_version': SPEC_FORMAT_VERSION,
+        'booster': booster_file,
+        # XGBRegressor.predict usa apenas as árvores até a melhor iteração, quando houve early stopping
+        'iteration_range': [0, regressor.best_iteration + 1] if hasattr(regressor, 'best_iteration') else [0, 0],
+        'missing': None if np.isnan(regressor.missing) else regressor.missing,
+        'preprocessing': encoder.to_spec(),
+    }
+    temporary_path = f"{spec_path}.tmp"
+    with open(temporary_path, 'w') as file:
+        json.dump(spec, file)
+    os.replace(temporary_path, spec_path)
+    return booster_path
+
+
+class NativeModel:
+    def __init__(self, spec_path: str):
+        """
+        Carrega o modelo exportado por `export_native_model`: o codificador colunar a partir da
+        especificação e o booster nativo do XGBoost.
+
+        Args:
+            spec_path (str): Caminho do arquivo de especificação (.json).
+
+        Raises:
+            ValueError: Se a versão do formato da especificação não for suportada.
+        """
+        with open(spec_path) as file:
+            spec = json.load(file)
+        if spec.get('format_version') != SPEC_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model spec version: {spec.get('format_version')}")
+
+        self.encoder = ColumnarEncoder.from_spec(spec['preprocessing'])
+        self.iteration_range = tuple(spec['iteration_range'])
+        self.missing = spec['missing'] if spec['missing'] is not None else np.nan
+
+        self.booster = xgb.Booster()
+        self.booster.load_model(os.path.join(os.path.dirname(os.path.abspath(spec_path)), spec['booster']))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Prediz diretamente sobre a matriz de features, sem cópia para uma DMatrix.
+
+        Args:
+            X (numpy.ndarray): Matriz float64 contígua de formato (n_linhas, n_features).
+
+        Returns:
+            numpy.ndarray: Predições em float32.
+        """
+        return self.booster.inplace_predict(np.ascontiguousarray(X), iteration_range=self.iteration_range,
+                                            missing=self.missing)
+
+    def predict_contributions(self, X: np.ndarray) -> np.ndarray:
+        """
+        Calcula a contribuição de cada feature para a predição (TreeSHAP do XGBoost), para o lote inteiro.
+
+        Args:
+            X (numpy.ndarray): Matriz float64 de formato (n_linhas, n_features).
+
+        Returns:
+            numpy.ndarray: Contribuições de formato (n_linhas, n_features + 1); a última coluna é o valor base.
+        """
+        return self.booster.predict(xgb.DMatrix(X, missing=self.missing), pred_contribs=True,
+                                    iteration_range=self.iteration_range)
+
+    def set_n_threads(self, n_threads: int):
+        """
+        Define o número de threads usadas pelo XGBoost nas predições.
+
+        Args:
+            n_threads (int): Número de threads do XGBoost neste processo.
+        """
+        self.booster.set_param({'nthread': n_threads})
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+# Diretório projects, com o módulo utils dos notebooks: a API aplica os limites com o mesmo `PercentileCapper`
+# usado no treino, sem uma segunda implementação do capping
+PROJECTS_DIR = str(Path(__file__).resolve().parents[3])
+
+
+def load_outlier_capping(path: str):
+    """
+    Carrega os limites do capping percentual salvos em JSON por `PercentileCapper.save`.
+
+    Valores abaixo do limite inferior ou acima do superior são substituídos pela mediana da variável, pelo
+    próprio `PercentileCapper` (`transform` no caminho via pandas e `cap_array` no codificador colunar). O
+    módulo utils é importado apenas quando o capping está configurado, pois também carrega as bibliotecas de
+    visualização dos notebooks.
+
+    Args:
+        path (str): Caminho do arquivo JSON.
+
+    Returns:
+        PercentileCapper: Transformador ajustado com os limites do arquivo.
+    """
+    if PROJECTS_DIR not in sys.path:
+        sys.path.append(PROJECTS_DIR)
+    from utils import PercentileCapper
+
+    return PercentileCapper.load(path)
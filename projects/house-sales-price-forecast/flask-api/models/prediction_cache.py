@@ -0,0 +1,123 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class PredictionCache:
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600, columns: list = None):
+        """
+        Inicializa o cache LRU/TTL de predições por registro.
+
+        Args:
+            max_size (int): Número máximo de predições mantidas; as menos usadas recentemente são descartadas.
+            ttl_seconds (float): Tempo de validade de cada predição, em segundos.
+            columns (list): Colunas consideradas na chave do registro. Se None, todas as chaves do registro são usadas.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.columns = sorted(columns) if columns is not None else None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _canonical_value(value) -> str:
+        # Normaliza números para que 81, 81.0 e numpy.int64(81) gerem a mesma chave,
+        # mantendo a distinção entre números e textos (ex.: 20 e "20")
+        if value is None:
+            return 'nan'
+        if isinstance(value, str):
+            return f"s:{value}"
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return f"o:{value!r}"
+        return 'nan' if math.isnan(number) else f"n:{number!r}"
+
+    def make_key(self, record: dict) -> bytes:
+        """
+        Gera a chave estável de um registro, independente da ordem dos campos e da formatação dos números.
+
+        Args:
+            record (dict): Registro de um imóvel.
+
+        Returns:
+            bytes: Hash do registro canonicalizado.
+        """
+        columns = self.columns if self.columns is not None else sorted(record)
+        canonical = '\x1f'.join(f"{column}={self._canonical_value(record.get(column))}" for column in columns)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+    def get_many(self, keys: list) -> list:
+        """
+        Busca as predições das chaves, linha a linha.
+
+        Args:
+            keys (list): Chaves dos registros.
+
+        Returns:
+            list: Predição de cada chave, ou None quando ausente ou expirada.
+        """
+        now = time.monotonic()
+        results = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    results.append(entry[0])
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    results.append(None)
+                    self.misses += 1
+        return results
+
+    def put_many(self, keys: list, predictions: list):
+        """
+        Armazena as predições das chaves, descartando as entradas menos usadas recentemente se necessário.
+
+        Args:
+            keys (list): Chaves dos registros.
+            predictions (list): Predições correspondentes.
+        """
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key, prediction in zip(keys, predictions):
+                self._entries[key] = (prediction, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove todas as predições do cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            dict: Tamanho atual, acertos, falhas, descartes e taxa de acerto.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,205 @@
+from operator import itemgetter
+
+import numpy as np
+
+from models.encoder import ColumnarEncoder
+
+# Marcador de campo ausente no registro
+_MISSING = object()
+
+# Tipos aceitos nas variáveis numéricas (None representa valor faltante, tratado pelo XGBoost); bool, embora
+# seja subclasse de int, é rejeitado para que `true` não seja aceito como 1.0
+NUMERIC_TYPES = frozenset({int, float, type(None)})
+
+
+class InputSchema:
+    def __init__(self, encoder: ColumnarEncoder, strict_categories: bool = True):
+        """
+        Compila o esquema de entrada do modelo a partir do codificador colunar: campos obrigatórios,
+        tipos das variáveis numéricas e categorias permitidas nas variáveis categóricas.
+
+        Args:
+            encoder (ColumnarEncoder): Codificador do pré-processamento do modelo.
+            strict_categories (bool): Se True, categorias desconhecidas são rejeitadas em todas as variáveis
+                categóricas. Se False, apenas nas ordinais; nas one-hot, o modelo as ignora.
+        """
+        spec = encoder.to_spec()
+        self.required_fields = list(spec['input_columns'])
+        self.numeric_fields = set()
+        self.allowed_categories = {}
+
+        # Compilação: conjunto dos campos obrigatórios e leitura de cada campo sem chamadas em Python
+        self._required = frozenset(self.required_fields)
+        self._getters = {field: itemgetter(field) for field in self.required_fields}
+
+        for step in spec['steps']:
+            if step['kind'] in ('minmax', 'robust', 'passthrough'):
+                self.numeric_fields.update(step['columns'])
+            elif step['kind'] == 'ordinal' or (step['kind'] == 'onehot' and strict_categories):
+                for column, categories in zip(step['columns'], step['params']['categories']):
+                    self.allowed_categories[column] = frozenset(categories)
+
+    def validate(self, records: list) -> list:
+        """
+        Valida um lote de registros coluna a coluna, sem chamar o modelo.
+
+        Cada coluna é verificada de uma vez com operações de conjunto, sem materializar listas
+        intermediárias; os registros só são percorridos individualmente nas colunas em que há
+        algum valor inválido.
+
+        Args:
+            records (list): Lista de dicionários, um por imóvel.
+
+        Returns:
+            list: Erros encontrados, ordenados por linha, no formato {'row', 'field', 'message'}.
+                Lista vazia se todos os registros forem válidos.
+        """
+        errors = []
+        rows = []
+        for i, record in enumerate(records):
+            if isinstance(record, dict):
+                rows.append(i)
+            else:
+                errors.append({'row': i, 'field': None, 'message': "expected a JSON object"})
+        objects = [records[i] for i in rows]
+        complete = all(record.keys() >= self._required for record in objects)
+
+        for field in self.required_fields:
+            if complete and self._column_is_valid(field, objects):
+                continue
+
+            values = [record.get(field, _MISSING) for record in objects]
+            if not self._values_are_valid(field, values):
+                errors.extend(self._field_errors(field, rows, values))
+
+        errors.sort(key=lambda error: error['row'])
+        return errors
+
+    def validate_columns(self, columns: dict, n_rows: int) -> list:
+        """
+        Valida um lote colunar (mapa de nome da coluna para os valores de todas as linhas).
+
+        Colunas numéricas em arrays NumPy de tipo numérico (ex.: vindas do Arrow) são aceitas sem
+        percorrer os valores.
+
+        Args:
+            columns (dict): Valores de cada coluna, em listas ou arrays NumPy do mesmo tamanho.
+            n_rows (int): Número de linhas do lote.
+
+        Returns:
+            list: Erros encontrados, ordenados por linha, no formato {'row', 'field', 'message'}.
+
+        Raises:
+            ValueError: Se faltarem colunas obrigatórias, o que invalida o lote inteiro.
+        """
+        missing_columns = set(self.required_fields) - set(columns)
+        if missing_columns:
+            raise ValueError(f"columns are missing: {missing_columns}")
+
+        errors = []
+        for field in self.required_fields:
+            values = columns[field]
+            if field in self.numeric_fields and isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+                continue
+            if not self._values_are_valid(field, values):
+                errors.extend(self._field_errors(field, range(n_rows), list(values)))
+
+        errors.sort(key=lambda error: error['row'])
+        return errors
+
+    def _field_errors(self, field: str, rows, values: list) -> list:
+        # Verificação linha a linha de uma coluna, usada apenas quando ela possui algum valor inválido
+        errors = []
+        allowed = self.allowed_categories.get(field)
+        for i, value in zip(rows, values):
+            if value is _MISSING:
+                errors.append({'row': i, 'field': field, 'message': "field is required"})
+            elif field in self.numeric_fields:
+                if type(value) not in NUMERIC_TYPES and not isinstance(value, (np.integer, np.floating)):
+                    errors.append({'row': i, 'field': field,
+                                   'message': f"expected a number, got {type(value).__name__}"})
+            elif allowed is not None and not _is_allowed(value, allowed):
+                errors.append({'row': i, 'field': field, 'message': f"unknown category {value!r}"})
+        return errors
+
+    def _column_is_valid(self, field: str, objects: list) -> bool:
+        # Verificação rápida de uma coluna em que todos os registros possuem o campo
+        if field not in self.numeric_fields and field not in self.allowed_categories:
+            return True
+        return self._values_are_valid(field, map(self._getters[field], objects))
+
+    def _values_are_valid(self, field: str, values) -> bool:
+        # Verificação de uma coluna inteira com operações de conjunto
+        if field in self.numeric_fields:
+            return NUMERIC_TYPES.issuperset(map(type, values))
+        if field in self.allowed_categories:
+            try:
+                return self.allowed_categories[field].issuperset(values)
+            except TypeError:
+                return False  # Valores não hasheáveis (listas, objetos)
+        return _MISSING not in values
+
+
+def _is_allowed(value, allowed: frozenset) -> bool:
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+def predict_valid_records(predict_records, records: list, errors: list) -> list:
+    """
+    Prediz apenas os registros sem erros de validação, mantendo a ordem do lote.
+
+    Args:
+        predict_records (callable): Função de predição de registros (ex.: ModelHandler.predict_records).
+        records (list): Lista de registros do lote.
+        errors (list): Erros de validação retornados por `InputSchema.validate`.
+
+    Returns:
+        list: Predição de cada registro, ou None nas linhas rejeitadas.
+    """
+    invalid_rows = {error['row'] for error in errors}
+    valid_rows = [i for i in range(len(records)) if i not in invalid_rows]
+
+    predictions = [None] * len(records)
+    if valid_rows:
+        valid_predictions = predict_records(records=[records[i] for i in valid_rows])
+        for i, prediction in zip(valid_rows, valid_predictions):
+            predictions[i] = prediction
+    return predictions
+
+
+def predict_valid_columns(predict_columns, columns: dict, n_rows: int, errors: list) -> list:
+    """
+    Equivalente a `predict_valid_records` para um lote colunar: prediz apenas as linhas sem erros
+    de validação, selecionando-as em cada coluna.
+
+    Args:
+        predict_columns (callable): Função de predição de colunas (ex.: ModelHandler.predict_columns).
+        columns (dict): Valores de cada coluna, em listas ou arrays NumPy do mesmo tamanho.
+        n_rows (int): Número de linhas do lote.
+        errors (list): Erros de validação retornados por `InputSchema.validate_columns`.
+
+    Returns:
+        list: Predição de cada linha, ou None nas linhas rejeitadas.
+    """
+    invalid_rows = {error['row'] for error in errors}
+    if not invalid_rows:
+        return predict_columns(columns=columns, n_rows=n_rows)
+
+    valid_rows = [i for i in range(n_rows) if i not in invalid_rows]
+    valid_columns = {}
+    for field, values in columns.items():
+        if isinstance(values, np.ndarray):
+            valid_columns[field] = values[valid_rows]
+        else:
+            valid_columns[field] = [values[i] for i in valid_rows]
+
+    predictions = [None] * n_rows
+    if valid_rows:
+        valid_predictions = predict_columns(columns=valid_columns, n_rows=len(valid_rows))
+        for i, prediction in zip(valid_rows, valid_predictions):
+            predictions[i] = prediction
+    return predictions
+
@@ -0,0 +1,111 @@
+import json
+
+import numpy as np
+
+# Content types dos formatos colunares aceitos pelo /predict, além do JSON
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+ARROW_CONTENT_TYPE = 'application/vnd.apache.arrow.stream'
+COLUMNAR_CONTENT_TYPES = {
+    MSGPACK_CONTENT_TYPE: MSGPACK_CONTENT_TYPE,
+    'application/x-msgpack': MSGPACK_CONTENT_TYPE,
+    ARROW_CONTENT_TYPE: ARROW_CONTENT_TYPE,
+}
+
+
+def negotiate_response_type(request_content_type: str, accept_mimetypes) -> str:
+    """
+    Escolhe o formato da resposta pelo cabeçalho Accept entre MessagePack, Arrow IPC e JSON. Sem
+    cabeçalho Accept, ou em caso de empate (ex.: */*), responde no mesmo formato da requisição.
+
+    Args:
+        request_content_type (str): Content type colunar da requisição.
+        accept_mimetypes (werkzeug.datastructures.MIMEAccept): Cabeçalho Accept da requisição.
+
+    Returns:
+        str: Content type da resposta.
+    """
+    request_type = COLUMNAR_CONTENT_TYPES[request_content_type]
+    if not accept_mimetypes:
+        return request_type
+    candidates = [request_type] + [content_type for content_type in (MSGPACK_CONTENT_TYPE, ARROW_CONTENT_TYPE,
+                                                                     'application/json')
+                                   if content_type != request_type]
+    return accept_mimetypes.best_match(candidates, default=request_type)
+
+
+def decode_columns(body: bytes, content_type: str) -> tuple:
+    """
+    Decodifica um lote colunar: um mapa de nome da coluna para o array de valores de todas as casas.
+
+    - MessagePack: mapa {coluna: lista de valores}.
+    - Arrow IPC (stream): tabela com uma coluna por variável.
+
+    Args:
+        body (bytes): Corpo da requisição.
+        content_type (str): Content type da requisição (ver `COLUMNAR_CONTENT_TYPES`).
+
+    Returns:
+        tuple: Dicionário de colunas (listas ou arrays NumPy) e número de linhas.
+
+    Raises:
+        ValueError: Se o corpo não for um lote colunar válido ou as colunas tiverem tamanhos diferentes.
+    """
+    if COLUMNAR_CONTENT_TYPES[content_type] == MSGPACK_CONTENT_TYPE:
+        import msgpack
+
+        try:
+            columns = msgpack.unpackb(body, raw=False)
+        except Exception as e:
+            raise ValueError(f"Invalid MessagePack body: {str(e)}")
+        if not isinstance(columns, dict) or not all(isinstance(values, list) for values in columns.values()):
+            raise ValueError("Expected a MessagePack map of column name to array of values")
+    else:
+        import pyarrow as pa
+
+        try:
+            table = pa.ipc.open_stream(body).read_all()
+        except Exception as e:
+            raise ValueError(f"Invalid Arrow IPC stream: {str(e)}")
+        columns = {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+    return columns, lengths.pop() if lengths else 0
+
+
+def encode_response(response: dict, content_type: str) -> bytes:
+    """
+    Codifica a resposta do /predict ({'predictions', 'errors'}) no formato negociado.
+
+    - JSON: mesmo corpo das requisições em JSON.
+    - MessagePack: mapa {'predictions': bytes float32 little-endian, 'errors': lista}; linhas rejeitadas são NaN.
+    - Arrow IPC (stream): tabela com a coluna float32 'prediction' (nula nas linhas rejeitadas) e os erros
+      em JSON nos metadados do esquema, na chave 'errors'.
+
+    Args:
+        response (dict): Predições, com None nas linhas rejeitadas, e erros de validação por linha (opcional).
+        content_type (str): Content type da resposta (ver `negotiate_response_type`).
+
+    Returns:
+        bytes: Corpo da resposta.
+    """
+    predictions = response['predictions']
+    errors = response.get('errors', [])
+    if content_type == 'application/json':
+        return json.dumps(response).encode()
+
+    if content_type == MSGPACK_CONTENT_TYPE:
+        import msgpack
+
+        values = np.array([np.nan if prediction is None else prediction for prediction in predictions], dtype='<f4')
+        return msgpack.packb({'predictions': values.tobytes(), 'errors': errors})
+
+    import pyarrow as pa
+
+    array = pa.array(predictions, type=pa.float32())
+    table = pa.table({'prediction': array}).replace_schema_metadata({'errors': json.dumps(errors)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
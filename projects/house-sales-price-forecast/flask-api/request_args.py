@@ -0,0 +1,41 @@
+def parse_positive_int(value: str, name: str, default: int = None):
+    """
+    Lê um parâmetro inteiro positivo da query string, com a mesma regra nas entradas WSGI (app.py)
+    e ASGI (asgi_app.py).
+
+    Args:
+        value (str): Valor do parâmetro na query string, ou None se ausente.
+        name (str): Nome do parâmetro, usado na mensagem de erro.
+        default (int): Valor retornado se o parâmetro estiver ausente.
+
+    Returns:
+        int: Valor do parâmetro, ou `default` se ele estiver ausente.
+
+    Raises:
+        ValueError: Se o valor não for um inteiro positivo.
+    """
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer, got '{value}'")
+    return number
+
+
+def parse_top_k(value: str):
+    """
+    Lê o parâmetro `top_k` das explicações (?explain=true&top_k=5).
+
+    Args:
+        value (str): Valor do parâmetro na query string, ou None se ausente.
+
+    Returns:
+        int: Número de contribuições mantidas por registro, ou None (todas) se o parâmetro estiver ausente.
+
+    Raises:
+        ValueError: Se o valor não for um inteiro positivo.
+    """
+    return parse_positive_int(value, 'top_k')
@@ -0,0 +1,97 @@
+import logging
+import os
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from pythonjsonlogger import jsonlogger
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+TEXT_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class ForkSafeQueueHandler(QueueHandler):
+    def __init__(self, handler: logging.Handler):
+        """
+        Handler que apenas enfileira os registros; a formatação e a escrita acontecem em uma
+        thread separada, fora da thread da requisição.
+
+        Args:
+            handler (logging.Handler): Handler que efetivamente escreve os registros.
+        """
+        super().__init__(SimpleQueue())
+        self.handler = handler
+        self._listener = None
+        self._pid = None
+        self._listener_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        # A thread de escrita é criada sob demanda em cada processo, pois threads não
+        # sobrevivem ao fork dos workers do servidor de produção
+        if self._pid == os.getpid():
+            return
+        with self._listener_lock:
+            if self._pid != os.getpid():
+                self.queue = SimpleQueue()
+                self._listener = QueueListener(self.queue, self.handler, respect_handler_level=True)
+                self._listener.start()
+                self._pid = os.getpid()
+
+    def emit(self, record: logging.LogRecord):
+        self._ensure_listener()
+        super().emit(record)
+
+    def close(self):
+        # Escreve os registros pendentes antes de encerrar
+        with self._listener_lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+                self._listener = None
+                self._pid = None
+        self.handler.close()
+        super().close()
+
+
+def setup_logging(level: str = 'INFO', json_format: bool = True, use_queue: bool = True, stream=None):
+    """
+    Configura os logs da API no logger raiz, substituindo os handlers existentes.
+
+    Args:
+        level (str): Nível mínimo dos logs (ex.: 'INFO', 'WARNING').
+        json_format (bool): Se True, cada registro é escrito como um objeto JSON por linha,
+            incluindo os campos passados em `extra`.
+        use_queue (bool): Se True, os registros são escritos por uma thread separada (QueueHandler).
+        stream: Destino dos logs. Se None, usa a saída de erro padrão.
+    """
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(jsonlogger.JsonFormatter(LOG_FORMAT) if json_format else logging.Formatter(TEXT_LOG_FORMAT))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(ForkSafeQueueHandler(handler) if use_queue else handler)
+    root.setLevel(level)
+
+
+def sample_payload(body: bytes, sample_rate: float, max_bytes: int) -> dict:
+    """
+    Sorteia se o corpo da requisição entra no log e, nesse caso, o trunca.
+
+    Args:
+        body (bytes): Corpo da requisição.
+        sample_rate (float): Fração das requisições com o corpo registrado (0 desabilita, 1 registra todas).
+        max_bytes (int): Tamanho máximo do corpo registrado, em bytes.
+
+    Returns:
+        dict: Campos extras do log (`payload`, `payload_bytes` e `payload_truncated`), ou vazio se não sorteado.
+    """
+    if sample_rate <= 0 or not body or random.random() >= sample_rate:
+        return {}
+    return {
+        'payload': body[:max_bytes].decode('utf-8', errors='replace'),
+        'payload_bytes': len(body),
+        'payload_truncated': len(body) > max_bytes,
+    }
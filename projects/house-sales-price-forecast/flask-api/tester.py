@@ -20,20 +20,21 @@ test_data = [
      "Fireplaces":0,"FireplaceQu":"None","GarageType":"Attchd","GarageYrBlt":1958,"GarageFinish":"Unf",
      "GarageCars":1.0,"GarageArea":312.0,"GarageQual":"TA","GarageCond":"TA","PavedDrive":"Y",
      "WoodDeckSF":393,"OpenPorchSF":36,"EnclosedPorch":0,"ScreenPorch":0,"Fence":"None","SaleType":"WD",
-     "SaleCondition":"Normal","HasPorch":1,"CountPorch":1}
+     "SaleCondition":"Normal","HasPorch":1,"CountPorch":1,"TotalPorchSF":36}
 ]
 
-# Enviando a requisição POST
-response = requests.post(url, json=test_data)
+if __name__ == '__main__':
+    # Enviando a requisição POST
+    response = requests.post(url, json=test_data)
 
-# Verificando a resposta
-if response.status_code == 200:
-    # Converte a resposta JSON em dicionário
-    response_data = response.json()
+    # Verificando a resposta
+    if response.status_code == 200:
+        # Converte a resposta JSON em dicionário
+        response_data = response.json()
     
-    # Imprime as predições
-    print(response)
-else:
-    # Caso a API retorne erro
-    print(f"Erro: Código de status {response.status_code}")
-    print("Resposta:", response.text)
\ No newline at end of file
+        # Imprime as predições
+        print(response)
+    else:
+        # Caso a API retorne erro
+        print(f"Erro: Código de status {response.status_code}")
+        print("Resposta:", response.text)
\ No newline at end of file
@@ -1,2 +1,8 @@
 from .eda_visualization_functions import *
-from .description_functions import *
\ No newline at end of file
+from .description_functions import *
+from .streaming_statistics import *
+from .association_functions import *
+from .figure_rendering import *
+from .metrics_functions import *
+from .aggregation_functions import *
+from .contingency_tables import *
\ No newline at end of file
@@ -0,0 +1,268 @@
+import numpy as np
+import pandas as pd
+
+
+def _category_order(groups):
+    # Ordem das categorias como no seaborn: categorias do tipo categórico, valores numéricos ordenados ou ordem de aparição
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        return list(groups.cat.categories)
+
+    order = [category for category in groups.unique() if pd.notnull(category)]
+    if pd.api.types.is_numeric_dtype(groups):
+        order = sorted(order)
+
+    return order
+
+
+def _capped_fliers(fliers, max_fliers, rng):
+    # Amostra dos outliers limitada a max_fliers, mantendo sempre os dois extremos
+    if fliers.size <= max_fliers:
+        return fliers
+
+    extremes = np.unique([fliers.argmin(), fliers.argmax()])
+    others = np.setdiff1d(np.arange(fliers.size), extremes)
+    sample = rng.choice(others, size= max(max_fliers - extremes.size, 0), replace= False)
+
+    return fliers[np.sort(np.concatenate([extremes, sample]))]
+
+
+def _single_box_statistics(values, label, whis, max_fliers, rng):
+    """
+    Calcula as estatísticas de um boxplot como o `matplotlib.cbook.boxplot_stats`, com os outliers amostrados.
+
+    Parâmetros:
+    -----------
+    values : np.ndarray
+        Valores do grupo, sem valores ausentes.
+
+    label : object
+        Rótulo do grupo.
+
+    whis : float
+        Comprimento dos bigodes em múltiplos do intervalo interquartil.
+
+    max_fliers : int
+        Número máximo de outliers mantidos.
+
+    rng : np.random.Generator
+        Gerador usado na amostragem dos outliers.
+
+    Retorno:
+    --------
+    dict
+        Estatísticas no formato aceito pelo `Axes.bxp`.
+    """
+    if values.size == 0:
+        return {'label': label, 'mean': np.nan, 'med': np.nan, 'q1': np.nan, 'q3': np.nan, 'iqr': np.nan,
+                'whislo': np.nan, 'whishi': np.nan, 'fliers': np.array([]), 'n_fliers': 0}
+
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    interquartile_range = q3 - q1
+    lower_limit, upper_limit = q1 - whis * interquartile_range, q3 + whis * interquartile_range
+
+    # Bigodes: valores mais extremos dentro dos limites, nunca aquém dos quartis
+    upper_whisker_values = values[values <= upper_limit]
+    whishi = q3 if upper_whisker_values.size == 0 or upper_whisker_values.max() < q3 else upper_whisker_values.max()
+    lower_whisker_values = values[values >= lower_limit]
+    whislo = q1 if lower_whisker_values.size == 0 or lower_whisker_values.min() > q1 else lower_whisker_values.min()
+
+    fliers = np.concatenate([values[values < whislo], values[values > whishi]])
+
+    return {'label': label, 'mean': values.mean(), 'med': median, 'q1': q1, 'q3': q3, 'iqr': interquartile_range,
+            'whislo': whislo, 'whishi': whishi, 'fliers': _capped_fliers(fliers, max_fliers, rng), 'n_fliers': fliers.size}
+
+
+def box_statistics(values, groups= None, order= None, whis= 1.5, max_fliers= 1000, random_state= 0):
+    """
+    Pré-calcula as estatísticas dos boxplots (quartis, bigodes e uma amostra limitada dos outliers) de uma
+    variável, opcionalmente por grupo, para desenhar boxplots com `Axes.bxp` sem passar todas as observações
+    ao matplotlib/seaborn.
+
+    Parâmetros:
+    -----------
+    values : pd.Series
+        Variável quantitativa.
+
+    groups : pd.Series, opcional
+        Variável que define os grupos, alinhada a `values`. Se None (padrão), calcula um único boxplot.
+
+    order : list, opcional
+        Ordem dos grupos. Se None (padrão), segue a ordem do seaborn: categorias do tipo categórico, valores
+        numéricos ordenados ou ordem de aparição.
+
+    whis : float, opcional
+        Comprimento dos bigodes em múltiplos do intervalo interquartil (padrão é 1.5).
+
+    max_fliers : int, opcional
+        Número máximo de outliers mantidos por grupo; acima disso, é mantida uma amostra aleatória que sempre
+        inclui o menor e o maior outlier (padrão é 1000).
+
+    random_state : int, opcional
+        Semente da amostragem dos outliers (padrão é 0).
+
+    Retorno:
+    --------
+    list
+        Lista de dicionários, um por grupo na ordem de `order`, com as chaves 'label', 'mean', 'med', 'q1', 'q3',
+        'iqr', 'whislo', 'whishi', 'fliers' (amostra) e 'n_fliers' (total de outliers).
+
+    Notas:
+    ------
+    - Quartis, bigodes e outliers seguem o `matplotlib.cbook.boxplot_stats` (usado pelo `plt.boxplot` e pelo
+      `sns.boxplot`); apenas a lista de outliers é limitada.
+    - Os grupos são fatias dos valores ordenados pelo código do grupo (uma ordenação estável para todos os grupos)
+      e cada quartil é obtido por seleção (`np.percentile`), sem ordenar cada grupo.
+    - Observações com valor ou grupo ausente são descartadas, como no seaborn.
+
+    Exemplos de uso:
+    ----------------
+    >>> stats = box_statistics(df['SalePrice'], groups= df['MSZoning'])
+    >>> ax.bxp(stats, positions= range(len(stats)))
+    """
+    rng = np.random.default_rng(random_state)
+    values = pd.Series(values)
+
+    if groups is None:
+        valid_values = values.to_numpy(dtype= float, na_value= np.nan)
+        return [_single_box_statistics(valid_values[~np.isnan(valid_values)], values.name, whis, max_fliers, rng)]
+
+    groups = pd.Series(groups)
+    if order is None:
+        order = _category_order(groups)
+
+    # Códigos dos grupos na ordem desejada (-1 para valores fora da ordem ou ausentes), no menor tipo inteiro
+    # possível, para que a ordenação estável seja um radix sort
+    codes = pd.Categorical(groups, categories= order).codes
+    value_array = values.to_numpy(dtype= float, na_value= np.nan)
+    valid = (codes >= 0) & ~np.isnan(value_array)
+    codes, value_array = codes[valid], value_array[valid]
+
+    group_rows = np.argsort(codes, kind= 'stable')
+    group_offsets = np.r_[0, np.cumsum(np.bincount(codes, minlength= len(order)))]
+    grouped_values = value_array[group_rows]
+
+    return [_single_box_statistics(grouped_values[group_offsets[i]:group_offsets[i + 1]], category, whis, max_fliers, rng)
+            for i, category in enumerate(order)]
+
+
+def _bin_indexes(values, edges):
+    # Índice do intervalo de cada valor em intervalos de mesma largura (o último intervalo é fechado, como no np.histogram)
+    n_bins = edges.size - 1
+    span = edges[-1] - edges[0]
+    if span == 0:
+        return np.zeros(values.size, dtype= np.int64)
+
+    return np.clip(((values - edges[0]) * (n_bins / span)).astype(np.int64), 0, n_bins - 1)
+
+
+def _valid_pairs(x, y):
+    x = np.asarray(x, dtype= float)
+    y = np.asarray(y, dtype= float)
+    valid = ~(np.isnan(x) | np.isnan(y))
+
+    return x[valid], y[valid], np.flatnonzero(valid)
+
+
+def scatter_histogram(x, y, bins= 200):
+    """
+    Pré-calcula o histograma 2D (contagem de observações por célula) de um par de variáveis, para desenhar a
+    densidade de um gráfico de dispersão sem desenhar cada ponto.
+
+    Parâmetros:
+    -----------
+    x : array-like
+        Variável do eixo horizontal.
+
+    y : array-like
+        Variável do eixo vertical, alinhada a `x`.
+
+    bins : int, opcional
+        Número de intervalos em cada eixo (padrão é 200).
+
+    Retorno:
+    --------
+    counts : np.ndarray
+        Matriz (bins x bins) de contagens, com `x` nas linhas e `y` nas colunas, como no `np.histogram2d`.
+
+    x_edges : np.ndarray
+        Limites dos intervalos de `x`.
+
+    y_edges : np.ndarray
+        Limites dos intervalos de `y`.
+
+    Notas:
+    ------
+    - Os pares com valor ausente são descartados.
+    - As contagens são um único `np.bincount` sobre o índice da célula de cada observação.
+    """
+    x, y, _ = _valid_pairs(x, y)
+    if x.size == 0:
+        return np.zeros((bins, bins), dtype= np.int64), np.linspace(0, 1, bins + 1), np.linspace(0, 1, bins + 1)
+
+    x_edges = np.linspace(x.min(), x.max(), bins + 1)
+    y_edges = np.linspace(y.min(), y.max(), bins + 1)
+    cells = _bin_indexes(x, x_edges) * bins + _bin_indexes(y, y_edges)
+    counts = np.bincount(cells, minlength= bins * bins).reshape(bins, bins)
+
+    return counts, x_edges, y_edges
+
+
+def stratified_sample(x, y, n_samples= 10000, bins= 50, random_state= 0):
+    """
+    Seleciona uma amostra estratificada pelas células de uma grade 2D, preservando as regiões esparsas (e os
+    outliers) que uma amostra aleatória simples tende a perder.
+
+    Parâmetros:
+    -----------
+    x : array-like
+        Variável do eixo horizontal.
+
+    y : array-like
+        Variável do eixo vertical, alinhada a `x`.
+
+    n_samples : int, opcional
+        Tamanho máximo da amostra (padrão é 10000).
+
+    bins : int, opcional
+        Número de intervalos da grade em cada eixo (padrão é 50).
+
+    random_state : int, opcional
+        Semente da amostragem (padrão é 0).
+
+    Retorno:
+    --------
+    np.ndarray
+        Posições (inteiras, ordenadas) das observações amostradas em `x` e `y`.
+
+    Notas:
+    ------
+    - Cada célula ocupada contribui com até a mesma cota de observações; a cota é a maior possível sem exceder
+      `n_samples`, de modo que células com poucas observações são mantidas inteiras e as demais são sorteadas sem
+      reposição.
+    - Os pares com valor ausente nunca são amostrados.
+    """
+    x, y, valid_positions = _valid_pairs(x, y)
+    if x.size <= n_samples:
+        return valid_positions
+
+    rng = np.random.default_rng(random_state)
+    cells = (_bin_indexes(x, np.linspace(x.min(), x.max(), bins + 1)) * bins
+             + _bin_indexes(y, np.linspace(y.min(), y.max(), bins + 1)))
+    cell_counts = np.bincount(cells, minlength= bins * bins)
+
+    # Cota por célula: a maior tal que a soma de min(contagem, cota) não exceda n_samples
+    sorted_counts = np.sort(cell_counts[cell_counts > 0])
+    taken_by_quota = lambda quota: np.minimum(sorted_counts, quota).sum()
+    low, high = 1, int(sorted_counts[-1])
+    while low < high:
+        middle = (low + high + 1) // 2
+        low, high = (middle, high) if taken_by_quota(middle) <= n_samples else (low, middle - 1)
+
+    # Observações agrupadas por célula (ordenação estável de inteiros pequenos, um radix sort) e sorteio sem reposição
+    # da cota dentro de cada célula que a excede
+    by_cell = np.argsort(cells.astype(np.min_scalar_type(bins * bins - 1)), kind= 'stable')
+    cell_starts = np.r_[0, np.cumsum(cell_counts)[:-1]]
+    sampled = [by_cell[start:start + count] if count <= low else by_cell[start + rng.choice(count, size= low, replace= False)]
+               for start, count in zip(cell_starts[cell_counts > 0], cell_counts[cell_counts > 0])]
+
+    return np.sort(valid_positions[np.concatenate(sampled)])
@@ -0,0 +1,519 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import scipy.stats as sts
+from sklearn.feature_selection import mutual_info_regression
+
+
+def _univariate_normality(quant_var):
+    """
+    Padroniza a variável quantitativa e verifica a sua normalidade (Shapiro-Wilk até 50 observações,
+    Kolmogorov-Smirnov acima disso).
+
+    Parâmetros:
+    ----------
+    quant_var : array-like
+        Variável quantitativa contínua.
+
+    Retorno:
+    --------
+    standardized_variable : np.ndarray
+        Variável padronizada (z-score).
+
+    is_normal : bool
+        Se o p-valor do teste de normalidade é maior que 0.05.
+    """
+    # Padroniza a variável quantitativa
+    standardized_variable = sts.zscore(quant_var)
+
+    # Verifica normalidade para a variável quantitativa (univariada)
+    if len(quant_var) <= 50:
+        _, p_value = sts.shapiro(standardized_variable)
+    else:
+        _, p_value = sts.kstest(standardized_variable, 'norm')
+
+    return standardized_variable, p_value > 0.05
+
+
+def _comparison_test_by_groups(split_groups, n_categories, quant_var= None, numeric_ordinal_var= None, normality= None):
+    """
+    Núcleo de `_comparison_test_for_ordinal_or_quantitative_vars`: escolhe e aplica o teste de comparação a partir
+    de uma função que divide um array de valores nos grupos da variável qualitativa.
+
+    Parâmetros:
+    ----------
+    split_groups : callable
+        Função que recebe um array com um valor por linha e retorna a lista de arrays de cada categoria da
+        variável qualitativa, na ordem de `Series.unique()`.
+
+    n_categories : int
+        Número de categorias não faltantes da variável qualitativa (`Series.nunique()`).
+
+    quant_var : array-like, opcional
+        Variável quantitativa contínua.
+
+    numeric_ordinal_var : array-like, opcional
+        Variável numérica ordinal.
+
+    normality : tuple, opcional
+        Resultado de `_univariate_normality(quant_var)`, quando já calculado para outro par com a mesma variável
+        quantitativa.
+
+    Retorno:
+    --------
+    p_value : float
+        O valor p do teste estatístico aplicado.
+
+    test_name : str
+        O nome do teste estatístico aplicado.
+
+    Erros:
+    -------
+    AttributeError
+        É levantado se não for passada uma variável numérica (quantitativa ou ordinal) ou se ambas forem fornecidas
+        simultaneamente.
+    """
+    if (quant_var is not None) & (numeric_ordinal_var is None):
+        # A padronização e a normalidade univariada não dependem da variável qualitativa
+        standardized_variable, is_normal = normality if normality is not None else _univariate_normality(quant_var)
+
+        # Se a variável quantiativa não for normal na análise univariada, usar testes não paramétricos
+        if is_normal:
+            # Verifica normalidade da variável contínua por grupo da variável qualitativa (bivariada)
+            group_normality_results = []
+            for group_data in split_groups(standardized_variable):
+                if len(group_data) <= 50:
+                    _, p_value = sts.shapiro(group_data)
+                else:
+                    _, p_value = sts.kstest(group_data, 'norm')
+
+                group_normality_results.append(p_value > 0.05)
+
+            # Escolha do teste estatístico baseado na normalidade dos grupos
+            if all(group_normality_results):
+                # Caso todos os grupos possuam distribuições normais, utiliza testes paramétricos
+                if n_categories == 2:
+                    _, p_value = sts.ttest_ind(*split_groups(quant_var))
+                    test_name = 'T-Test'
+                else:
+                    _, p_value = sts.f_oneway(*split_groups(quant_var))
+                    test_name = 'ANOVA Test'
+            else:
+                # Caso algum dos grupos não seja normal, utiliza testes não paramétricos
+                if n_categories == 2:
+                    _, p_value = sts.mannwhitneyu(*split_groups(quant_var))
+                    test_name = 'Mann Whitney U Test'
+                else:
+                    _, p_value = sts.kruskal(*split_groups(quant_var))
+                    test_name = 'Kruskal-Wallis Test'
+        else:
+            # Caso algum dos grupos não seja normal, utiliza testes não paramétricos
+            if n_categories == 2:
+                _, p_value = sts.mannwhitneyu(*split_groups(quant_var))
+                test_name = 'Mann Whitney U Test'
+            else:
+                _, p_value = sts.kruskal(*split_groups(quant_var))
+                test_name = 'Kruskal-Wallis Test'
+
+        return p_value, test_name
+    elif (quant_var is None) & (numeric_ordinal_var is not None):
+        if n_categories == 2:
+            _, p_value = sts.mannwhitneyu(*split_groups(numeric_ordinal_var))
+            test_name = 'Mann Whitney U Test'
+        elif (n_categories < 2) | (len(np.unique(numeric_ordinal_var)) < 2):
+            p_value = float(1)
+            test_name = None
+
+            return p_value, test_name
+        else:
+            _, p_value = sts.kruskal(*split_groups(numeric_ordinal_var))
+            test_name = 'Kruskal-Wallis Test'
+        return p_value, test_name
+    else:
+        raise AttributeError("Passe pelo menos e apenas uma variavel numérica, ou 'quant_var' ou 'numeric_ordinal_var'")
+
+
+def _encode_qualitative_variable(qualitative_var, categories= None):
+    """
+    Codifica uma variável qualitativa em inteiros uma única vez, para os testes de todos os pares em que ela aparece.
+
+    Parâmetros:
+    ----------
+    qualitative_var : pd.Series
+        Variável qualitativa.
+
+    categories : list, opcional
+        Ordem das categorias, se a variável for ordinal.
+
+    Retorno:
+    --------
+    dict
+        - 'codes': código de cada linha, na ordem de aparição das categorias (como `Series.unique()`), -1 se faltante;
+        - 'n_categories': número de categorias não faltantes;
+        - 'na_position': posição do valor faltante entre as categorias de `Series.unique()` (None se não houver);
+        - 'sorted_rank': posição de cada categoria em ordem crescente (a ordem das linhas do `pd.crosstab`);
+        - 'group_rows' e 'group_offsets': índice dos grupos, com as linhas de cada categoria em sequência (na ordem
+          original) e as posições de início e fim de cada categoria, de modo que `group_rows[offsets[c]:offsets[c + 1]]`
+          são as linhas da categoria c;
+        - 'ordinal_codes': códigos da ordem das categorias, se a variável for ordinal (como `pd.Categorical(...).codes`).
+    """
+    codes, uniques = pd.factorize(qualitative_var, sort= False)
+
+    # Posição do primeiro valor faltante entre as categorias, contadas por ordem de aparição
+    na_rows = np.flatnonzero(codes < 0)
+    na_position = len(np.unique(codes[:na_rows[0]])) if len(na_rows) else None
+
+    # Índice dos grupos: ordenação estável dos códigos (mantém a ordem original das linhas em cada categoria)
+    present_rows = np.flatnonzero(codes >= 0)
+    group_rows = present_rows[np.argsort(codes[present_rows], kind= 'stable')]
+    group_offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[present_rows], minlength= len(uniques)))])
+
+    encoded = {
+        'codes': codes.astype(np.int64),
+        'n_categories': len(uniques),
+        'na_position': na_position,
+        'sorted_rank': pd.factorize(uniques, sort= True)[0].astype(np.int64),
+        'group_rows': group_rows,
+        'group_offsets': group_offsets,
+    }
+    if categories is not None:
+        encoded['ordinal_codes'] = pd.Categorical(qualitative_var, categories= categories, ordered= True).codes
+
+    return encoded
+
+
+def _split_groups_by_index(encoded):
+    # Divide valores (arrays posicionais) pelos grupos da variável codificada, na mesma ordem de `Series.unique()`,
+    # fatiando o índice dos grupos em vez de comparar os códigos de todas as linhas a cada categoria
+    group_rows, group_offsets = encoded['group_rows'], encoded['group_offsets']
+
+    def split_groups(values):
+        sorted_values = values[group_rows]
+        groups = [sorted_values[group_offsets[code]:group_offsets[code + 1]] for code in range(encoded['n_categories'])]
+        if encoded['na_position'] is not None:
+            # Como em Series.unique(), o valor faltante é uma categoria, mas `== NaN` não seleciona nenhuma linha
+            groups.insert(encoded['na_position'], values[:0])
+        return groups
+
+    return split_groups
+
+
+def _chi2_pvalue_by_codes(encoded1, encoded2):
+    # Tabela de contingência por contagem dos pares de códigos, com linhas e colunas na ordem do pd.crosstab
+    both_present = (encoded1['codes'] >= 0) & (encoded2['codes'] >= 0)
+    rows = encoded1['sorted_rank'][encoded1['codes'][both_present]]
+    columns = encoded2['sorted_rank'][encoded2['codes'][both_present]]
+    n_rows, n_columns = encoded1['n_categories'], encoded2['n_categories']
+    contingency_table = np.bincount(rows * n_columns + columns, minlength= n_rows * n_columns).reshape(n_rows, n_columns)
+
+    # Como no pd.crosstab, categorias sem nenhuma observação não entram na tabela
+    contingency_table = contingency_table[contingency_table.sum(axis= 1) > 0][:, contingency_table.sum(axis= 0) > 0]
+
+    _, p_value, _, _ = sts.chi2_contingency(contingency_table)
+
+    return p_value
+
+
+# Variáveis codificadas disponíveis em cada processo do pool (definidas pelo inicializador)
+_worker_variables = None
+
+# Normalidade univariada de cada variável quantitativa, calculada no primeiro par em que ela aparece
+_worker_normality = {}
+
+
+def _init_worker(variables):
+    global _worker_variables, _worker_normality
+    _worker_variables = variables
+    _worker_normality = {}
+
+
+def _qualitative_pair_pvalue(task):
+    # Teste de um par de variáveis qualitativas: (tipo do teste, variável que define os grupos, variável testada)
+    test_kind, group_var_name, tested_var_name = task
+    group_var = _worker_variables[group_var_name]
+    tested_var = _worker_variables[tested_var_name]
+
+    if test_kind == 'chi2':
+        return _chi2_pvalue_by_codes(group_var, tested_var)
+
+    p_value, _ = _comparison_test_by_groups(_split_groups_by_index(group_var), group_var['n_categories'],
+                                            numeric_ordinal_var= tested_var['ordinal_codes'])
+    return p_value
+
+
+def _quantitative_qualitative_pair_pvalue(task):
+    quant_var_name, qual_var_name = task
+    quant_var = _worker_variables[quant_var_name]
+    qual_var = _worker_variables[qual_var_name]
+
+    if quant_var_name not in _worker_normality:
+        _worker_normality[quant_var_name] = _univariate_normality(quant_var)
+
+    p_value, _ = _comparison_test_by_groups(_split_groups_by_index(qual_var), qual_var['n_categories'],
+                                            quant_var= quant_var, normality= _worker_normality[quant_var_name])
+    return p_value
+
+
+def _map_pair_tests(test_func, tasks, variables, n_jobs):
+    # Executa os testes dos pares em sequência ou em um pool de processos; o resultado segue a ordem das tarefas
+    if n_jobs <= 1 or len(tasks) <= 1:
+        _init_worker(variables)
+        return [test_func(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (n_jobs * 4))
+    with ProcessPoolExecutor(max_workers= n_jobs, initializer= _init_worker, initargs= (variables,)) as executor:
+        return list(executor.map(test_func, tasks, chunksize= chunksize))
+
+
+def qualitative_vars_pvalues_matrix(qualitative_vars_df, ordinal_vars_dict= dict(), n_jobs= 1):
+    """
+    Calcula a matriz de p-valores das comparações entre variáveis qualitativas (nominais e ordinais), sem plotar.
+
+    Os testes são os mesmos de `plot_multivariate_heatmap_qualitative_vars`: Mann-Whitney U ou Kruskal-Wallis quando
+    há variável ordinal no par e qui-quadrado de independência entre variáveis nominais. Cada variável é codificada
+    em inteiros uma única vez; os pares simétricos (nominal-nominal e ordinal-nominal) são testados uma vez e
+    espelhados, e os testes podem ser distribuídos em um pool de processos com resultado determinístico.
+
+    Parâmetros:
+    -----------
+    qualitative_vars_df : pandas.DataFrame
+        DataFrame contendo variáveis qualitativas (nominais ou ordinais) para análise.
+
+    ordinal_vars_dict : dict, opcional
+        Dicionário com as variáveis ordinais (chaves) e a ordem das suas categorias (valores).
+
+    n_jobs : int, opcional
+        Número de processos entre os quais os testes são distribuídos (padrão é 1, sem pool).
+
+    Retorno:
+    --------
+    pd.DataFrame
+        Matriz de p-valores (float) com as variáveis qualitativas nas linhas e nas colunas.
+
+    Notas:
+    ------
+    - Entre duas variáveis ordinais, o teste agrupa a variável da linha e compara os códigos da variável da coluna,
+      então a matriz não é simétrica nesses pares, e ambos os sentidos são testados.
+    - O qui-quadrado de um par nominal espelhado usa a tabela de contingência transposta, com o mesmo p-valor
+      (a menos de arredondamentos da ordem das somas).
+
+    Exemplos de uso:
+    ----------------
+    >>> pvalues_matrix_df = qualitative_vars_pvalues_matrix(df[qualitative_vars], ordinal_vars_dict, n_jobs=4)
+    """
+    qualitative_vars_list = list(qualitative_vars_df.columns)
+    ordinals_vars_list = list(ordinal_vars_dict.keys())
+
+    variables = {var: _encode_qualitative_variable(qualitative_vars_df[var], ordinal_vars_dict.get(var))
+                 for var in qualitative_vars_list}
+
+    # Cada tarefa calcula uma ou duas células (o par espelhado tem o mesmo teste)
+    tasks, cells = [], []
+    for i, qual_var_name1 in enumerate(qualitative_vars_list):
+        for j, qual_var_name2 in enumerate(qualitative_vars_list):
+            is_ordinal1 = qual_var_name1 in ordinals_vars_list
+            is_ordinal2 = qual_var_name2 in ordinals_vars_list
+            if is_ordinal1 & is_ordinal2:
+                tasks.append(('comparison', qual_var_name1, qual_var_name2))
+                cells.append([(i, j)])
+            elif j < i:
+                continue
+            elif is_ordinal1:
+                tasks.append(('comparison', qual_var_name2, qual_var_name1))
+                cells.append([(i, j), (j, i)])
+            elif is_ordinal2:
+                tasks.append(('comparison', qual_var_name1, qual_var_name2))
+                cells.append([(i, j), (j, i)])
+            else:
+                tasks.append(('chi2', qual_var_name1, qual_var_name2))
+                cells.append([(i, j), (j, i)])
+
+    pvalues_matrix = np.full((len(qualitative_vars_list), len(qualitative_vars_list)), np.nan)
+    for task_cells, p_value in zip(cells, _map_pair_tests(_qualitative_pair_pvalue, tasks, variables, n_jobs)):
+        for cell in task_cells:
+            pvalues_matrix[cell] = p_value
+
+    return pd.DataFrame(pvalues_matrix, index= qualitative_vars_df.columns, columns= qualitative_vars_df.columns)
+
+
+def quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df, qualitative_vars_df, n_jobs= 1):
+    """
+    Calcula a matriz de p-valores das comparações entre variáveis quantitativas e qualitativas, sem plotar.
+
+    Os testes são os mesmos de `plot_multivariate_heatmap_quantitative_qualitative_vars` (T-Test, ANOVA,
+    Mann-Whitney U ou Kruskal-Wallis, conforme a normalidade). Cada variável qualitativa é codificada em inteiros
+    uma única vez, e os testes podem ser distribuídos em um pool de processos com resultado determinístico.
+
+    Parâmetros:
+    -----------
+    quantitative_vars_df : pandas.DataFrame
+        DataFrame contendo as variáveis quantitativas contínuas.
+
+    qualitative_vars_df : pandas.DataFrame
+        DataFrame contendo as variáveis qualitativas (categóricas).
+
+    n_jobs : int, opcional
+        Número de processos entre os quais os testes são distribuídos (padrão é 1, sem pool).
+
+    Retorno:
+    --------
+    pd.DataFrame
+        Matriz de p-valores (float) com as variáveis quantitativas nas linhas e as qualitativas nas colunas.
+
+    Exemplos de uso:
+    ----------------
+    >>> pvalues_matrix_df = quantitative_qualitative_vars_pvalues_matrix(df[quant_vars], df[qual_vars], n_jobs=4)
+    """
+    quantitative_vars_list = list(quantitative_vars_df.columns)
+    qualitative_vars_list = list(qualitative_vars_df.columns)
+
+    # As variáveis quantitativas e qualitativas ficam no mesmo dicionário, com chaves distintas por tipo
+    variables = {('quantitative', var): quantitative_vars_df[var].to_numpy() for var in quantitative_vars_list}
+    variables.update({('qualitative', var): _encode_qualitative_variable(qualitative_vars_df[var])
+                      for var in qualitative_vars_list})
+
+    tasks = [(('quantitative', quant_var_name), ('qualitative', qual_var_name))
+             for quant_var_name in quantitative_vars_list for qual_var_name in qualitative_vars_list]
+    p_values = _map_pair_tests(_quantitative_qualitative_pair_pvalue, tasks, variables, n_jobs)
+
+    pvalues_matrix = np.array(p_values, dtype= np.float64).reshape(len(quantitative_vars_list), len(qualitative_vars_list))
+
+    return pd.DataFrame(pvalues_matrix, index= quantitative_vars_df.columns, columns= qualitative_vars_df.columns)
+
+
+# Métodos aceitos por `target_correlations`
+_TARGET_CORRELATION_METHODS = ('spearman', 'pearson', 'kendall', 'mutual_information')
+
+# Quantidade máxima de valores (linhas x colunas) de cada bloco de colunas processado de uma vez (~32 MB em float64)
+_CORRELATION_BLOCK_SIZE = 2 ** 22
+
+
+def _pearson_with_target(values, target_values):
+    """
+    Calcula a correlação de Pearson de cada coluna de uma matriz com um vetor, em uma única operação matricial.
+
+    Parâmetros:
+    -----------
+    values : np.ndarray
+        Matriz (observações x variáveis) sem valores ausentes.
+
+    target_values : np.ndarray
+        Vetor da variável-alvo, sem valores ausentes e alinhado às linhas de `values`.
+
+    Retorno:
+    --------
+    np.ndarray
+        Coeficiente de cada coluna (NaN para colunas constantes ou sem observações).
+    """
+    if values.shape[0] == 0:
+        return np.full(values.shape[1], np.nan)
+
+    centered_values = values - values.mean(axis= 0)
+    centered_target = target_values - target_values.mean()
+
+    with np.errstate(divide= 'ignore', invalid= 'ignore'):
+        return (centered_target @ centered_values) / np.sqrt((centered_values ** 2).sum(axis= 0) * (centered_target @ centered_target))
+
+
+def target_correlations(independent_vars_df, target_var, methods= ('spearman', 'pearson'), random_state= 0):
+    """
+    Calcula as correlações de todas as variáveis quantitativas independentes com a variável-alvo de uma só vez,
+    considerando, para cada variável, apenas as observações sem valores ausentes no par (como o `DataFrame.corr`).
+
+    Parâmetros:
+    -----------
+    independent_vars_df : pd.DataFrame
+        DataFrame contendo as variáveis quantitativas independentes.
+
+    target_var : pd.Series
+        Variável-alvo quantitativa. Se o índice difere do de `independent_vars_df`, as observações são pareadas
+        pelo índice (apenas os rótulos presentes em ambos).
+
+    methods : tuple, opcional
+        Medidas calculadas, entre 'spearman', 'pearson', 'kendall' e 'mutual_information' (padrão é
+        ('spearman', 'pearson')).
+
+    random_state : int, opcional
+        Semente do estimador de informação mútua, para resultados reprodutíveis (padrão é 0).
+
+    Retorno:
+    --------
+    correlations_df : pd.DataFrame
+        DataFrame com uma linha por variável independente, uma coluna por medida de `methods` e a coluna
+        'n_observations' (número de observações completas do par).
+
+    Erros:
+    -------
+    ValueError
+        É levantado se `methods` contiver uma medida desconhecida.
+
+    Notas:
+    ------
+    - A variável-alvo é ordenada em postos uma única vez; as variáveis sem valores ausentes adicionais são
+      ordenadas em postos por blocos de colunas (`scipy.stats.rankdata` ao longo das linhas) e as correlações
+      de Spearman e Pearson de cada bloco são um único produto matricial.
+    - As variáveis com valores ausentes em observações em que a variável-alvo está presente têm os postos
+      recalculados apenas nas observações completas do par, como no `DataFrame.corr`.
+    - Kendall (`scipy.stats.kendalltau`) e informação mútua (`mutual_info_regression`) não têm forma matricial e
+      são calculadas variável a variável.
+
+    Exemplos de uso:
+    ----------------
+    >>> correlations_df = target_correlations(df[numeric_vars], df['SalePrice'], methods= ('spearman', 'kendall'))
+    >>> correlations_df.sort_values('spearman', ascending= False).head()
+    """
+    unknown_methods = [method for method in methods if method not in _TARGET_CORRELATION_METHODS]
+    if unknown_methods:
+        raise ValueError(f"Unknown correlation methods {unknown_methods}. Expected a subset of {_TARGET_CORRELATION_METHODS}.")
+
+    if not target_var.index.equals(independent_vars_df.index):
+        independent_vars_df, target_var = independent_vars_df.align(target_var, join= 'inner', axis= 0)
+
+    # Observações com a variável-alvo presente e seus postos, calculados uma única vez
+    target_values = target_var.to_numpy(dtype= float, na_value= np.nan)
+    target_rows = ~np.isnan(target_values)
+    target_values = target_values[target_rows]
+    target_ranks = sts.rankdata(target_values)
+
+    n_vars = independent_vars_df.shape[1]
+    correlations = {method: np.full(n_vars, np.nan) for method in methods}
+    n_observations = np.zeros(n_vars, dtype= np.int64)
+
+    block_size = max(1, _CORRELATION_BLOCK_SIZE // max(target_values.size, 1))
+    for block_start in range(0, n_vars, block_size):
+        block = independent_vars_df.iloc[:, block_start:block_start + block_size].to_numpy(dtype= float, na_value= np.nan)[target_rows]
+        block_valid = ~np.isnan(block)
+        complete_columns = block_valid.all(axis= 0)
+        n_observations[block_start:block_start + block.shape[1]] = block_valid.sum(axis= 0)
+
+        # Variáveis completas nas observações da variável-alvo: um produto matricial por medida para o bloco todo
+        complete_positions = block_start + np.flatnonzero(complete_columns)
+        if complete_positions.size:
+            complete_block = block[:, complete_columns]
+            if 'pearson' in methods:
+                correlations['pearson'][complete_positions] = _pearson_with_target(complete_block, target_values)
+            if 'spearman' in methods:
+                correlations['spearman'][complete_positions] = _pearson_with_target(sts.rankdata(complete_block, axis= 0), target_ranks)
+
+        for j in range(block.shape[1]):
+            pair_rows = None if complete_columns[j] else block_valid[:, j]
+            values = block[:, j] if pair_rows is None else block[pair_rows, j]
+            pair_target = target_values if pair_rows is None else target_values[pair_rows]
+
+            # Valores ausentes adicionais: postos recalculados nas observações completas do par
+            if pair_rows is not None:
+                if 'pearson' in methods:
+                    correlations['pearson'][block_start + j] = _pearson_with_target(values[:, None], pair_target)[0]
+                if 'spearman' in methods:
+                    correlations['spearman'][block_start + j] = _pearson_with_target(sts.rankdata(values)[:, None], sts.rankdata(pair_target))[0]
+
+            if 'kendall' in methods and values.size > 1:
+                correlations['kendall'][block_start + j] = sts.kendalltau(values, pair_target).statistic
+            if 'mutual_information' in methods and values.size > 3:
+                correlations['mutual_information'][block_start + j] = mutual_info_regression(
+                    values.reshape(-1, 1), pair_target, random_state= random_state)[0]
+
+    correlations_df = pd.DataFrame(correlations, index= independent_vars_df.columns, columns= list(methods))
+    correlations_df['n_observations'] = n_observations
+
+    return correlations_df
@@ -0,0 +1,128 @@
+"""
+Tabelas de contingência das variáveis qualitativas com a variável-alvo: um `pd.crosstab` por variável (versão
+anterior) e `StreamingContingencyTables` (códigos inteiros e um `np.bincount` por variável, em uma única passada
+por blocos mergeáveis).
+
+No `churn.csv` do projeto de churn de clientes, verifica que as tabelas e os valores p do qui-quadrado coincidem
+com os do `pd.crosstab` + `sts.chi2_contingency`, tanto em uma única passada quanto em blocos de `--chunk-rows`
+linhas acumulados em `--n-jobs` processos e combinados com `merge`.
+
+Em seguida, consome um fluxo sintético de `--rows` linhas (blocos de `--stream-chunk-size` linhas reamostrados do
+`churn.csv`, gerados um a um, como a leitura de um arquivo em blocos) e mede o tempo e o pico de memória, que não
+dependem do número de linhas. A versão anterior, que precisa das colunas inteiras em memória, é medida com
+`--compare-rows` linhas do mesmo fluxo.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_contingency_tables --rows 100000000 --compare-rows 5000000
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.stats as sts
+
+import utils
+from utils.benchmarks.benchmark_figure_rendering import PeakRssSampler
+
+CHURN_CSV_PATH = "bank-customers-churn-forecast/data/churn.csv"
+
+TARGET = 'Exited'
+
+VARIABLES = ['Geography', 'Gender', 'HasCrCard', 'IsActiveMember', 'NumOfProducts', 'Tenure', 'FicoScale']
+
+
+def _churn_frame():
+    df = pd.read_csv(CHURN_CSV_PATH)
+    # Escala FICO do notebook do projeto: variável ordinal (categórica) derivada do score de crédito
+    df['FicoScale'] = pd.cut(df['CreditScore'], bins=[300, 580, 670, 740, 800, float('inf')], right=False,
+                             labels=['too bad', 'bad', 'good', 'very good', 'excellent'])
+    return df[[TARGET] + VARIABLES]
+
+
+def _legacy_pvalues(df):
+    # Versão anterior (eda_visualization_functions): um pd.crosstab por variável antes do qui-quadrado
+    tables = {var_name: pd.crosstab(df[var_name], df[TARGET]) for var_name in VARIABLES}
+    return tables, pd.Series({var_name: sts.chi2_contingency(table)[1] for var_name, table in tables.items()})
+
+
+def _tables_from_chunks(args):
+    # Acumula, em um processo, as tabelas de uma parte dos blocos
+    df, chunk_rows, part, n_parts = args
+    tables = utils.StreamingContingencyTables(TARGET, VARIABLES)
+    for start in range(part * chunk_rows, len(df), n_parts * chunk_rows):
+        tables.update(df.iloc[start:start + chunk_rows])
+    return tables
+
+
+def _synthetic_chunks(df, n_rows, chunk_size, seed=0):
+    # Blocos reamostrados do churn.csv, gerados sob demanda (apenas um bloco em memória por vez)
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunk_size):
+        yield df.iloc[rng.integers(0, len(df), size=min(chunk_size, n_rows - start))]
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tabelas de contingência com a variável-alvo em uma passada por blocos")
+    parser.add_argument('--chunk-rows', type=int, default=1_000)
+    parser.add_argument('--n-jobs', type=int, default=4)
+    parser.add_argument('--rows', type=int, default=100_000_000)
+    parser.add_argument('--stream-chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--compare-rows', type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    df = _churn_frame()
+
+    # Paridade no churn.csv: uma passada e blocos acumulados em processos diferentes e combinados
+    (reference_tables, reference_pvalues), legacy_s = _timed(lambda: _legacy_pvalues(df))
+    single_pass, single_pass_s = _timed(lambda: utils.StreamingContingencyTables(TARGET, VARIABLES).update(df))
+    with ProcessPoolExecutor(max_workers=args.n_jobs) as executor:
+        parts = list(executor.map(_tables_from_chunks, [(df, args.chunk_rows, part, args.n_jobs)
+                                                        for part in range(args.n_jobs)]))
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    for name, tables in [('uma passada', single_pass), (f'{args.n_jobs} processos + merge', merged)]:
+        for var_name in VARIABLES:
+            pd.testing.assert_frame_equal(tables.table(var_name), reference_tables[var_name])
+        if not tables.chi2_pvalues().equals(reference_pvalues.rename('p_value')):
+            raise SystemExit(f"Os valores p ({name}) divergem do pd.crosstab + chi2_contingency")
+
+    print(f"churn.csv ({len(df):,} linhas): tabelas e valores p idênticos ao pd.crosstab "
+          f"(uma passada e {args.n_jobs} processos + merge)")
+    print(f"  pd.crosstab por variável: {legacy_s:.3f} s; uma passada: {single_pass_s:.3f} s\n")
+    print(pd.DataFrame({'p-value': reference_pvalues}).to_string(), "\n")
+
+    # Fluxo sintético: versão anterior com as colunas em memória x uma passada por blocos
+    print(f"{'linhas':>13}  {'método':<30}{'tempo (s)':>11}{'pico RSS (MB)':>15}")
+    compare_df = pd.concat(_synthetic_chunks(df, args.compare_rows, args.stream_chunk_size), ignore_index=True)
+    with PeakRssSampler() as sampler:
+        (_, legacy_pvalues), legacy_s = _timed(lambda: _legacy_pvalues(compare_df))
+    print(f"{args.compare_rows:>13,}  {'pd.crosstab (em memória)':<30}{legacy_s:>11.2f}{sampler.peak_rss / 2 ** 20:>15.0f}")
+    del compare_df
+
+    for n_rows in (args.compare_rows, args.rows):
+        with PeakRssSampler() as sampler:
+            def stream():
+                tables = utils.StreamingContingencyTables(TARGET, VARIABLES)
+                for chunk in _synthetic_chunks(df, n_rows, args.stream_chunk_size):
+                    tables.update(chunk)
+                return tables
+            tables, stream_s = _timed(stream)
+        if n_rows == args.compare_rows and not np.allclose(tables.chi2_pvalues(), legacy_pvalues, rtol=1e-12, atol=0):
+            raise SystemExit("Os valores p do fluxo divergem do pd.crosstab")
+        if tables.n_rows != n_rows or any(tables.table(var_name).to_numpy().sum() > n_rows for var_name in VARIABLES):
+            raise SystemExit("As contagens do fluxo não conferem com o número de linhas")
+        print(f"{n_rows:>13,}  {'uma passada por blocos':<30}{stream_s:>11.2f}{sampler.peak_rss / 2 ** 20:>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Métricas das variáveis contínuas: cálculo por coluna (versão anterior), cálculo vetorizado sobre todas as
+colunas e leitura do cache em disco indexado pelo conteúdo.
+
+Mede, no `train.csv` do projeto de preços de casas (colunas numéricas) e em um DataFrame sintético de
+`--rows` linhas x `--columns` colunas (com valores ausentes), o tempo de:
+
+- anterior: `_calculate_continuous_variable_metrics` chamada coluna a coluna;
+- vetorizado: `continuous_variables_metrics` sem cache;
+- cache (1ª execução): cálculo, hash do conteúdo e escrita do arquivo;
+- cache (reexecução): hash do conteúdo e leitura do arquivo, como ao reexecutar um notebook sem alterar os dados;
+
+verificando que as métricas coincidem.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_continuous_metrics --rows 1000000 --columns 40
+"""
+import argparse
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+TRAIN_CSV_PATH = "house-sales-price-forecast/data/extracted_data/train.csv"
+
+
+def _legacy_calculate_continuous_variable_metrics(numeric_variable):
+    # Versão anterior (eda_visualization_functions): uma série de reduções por coluna
+    minimum_value = numeric_variable.min()
+    maximum_value = numeric_variable.max()
+    mean_value = numeric_variable.mean()
+    median_value = numeric_variable.median()
+    mode_value = numeric_variable.mode().min()
+    first_quartile_value = numeric_variable.quantile(0.25)
+    third_quartile_value = numeric_variable.quantile(0.75)
+    interquartile_range = third_quartile_value - first_quartile_value
+    lower_fence_value = max(first_quartile_value - (1.5 * interquartile_range), minimum_value)
+    upper_fence_value = min(third_quartile_value + (1.5 * interquartile_range), maximum_value)
+
+    return {'minimum': minimum_value, 'maximum': maximum_value, 'mean': mean_value, 'median': median_value,
+            'mode': mode_value, 'first_quartile': first_quartile_value, 'third_quartile': third_quartile_value,
+            'lower_fence': lower_fence_value, 'upper_fence': upper_fence_value}
+
+
+def _legacy_metrics(numeric_vars_df):
+    return pd.DataFrame([_legacy_calculate_continuous_variable_metrics(numeric_vars_df[var])
+                         for var in numeric_vars_df.columns], index=numeric_vars_df.columns)
+
+
+def _synthetic_frame(n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(mean=8, sigma=1, size=(n_rows, n_columns)).round(1)
+    values[rng.random((n_rows, n_columns)) < 0.02] = np.nan
+    return pd.DataFrame(values, columns=[f"var_{i}" for i in range(n_columns)])
+
+
+def _best_of(func, n_repeats):
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Métricas das variáveis contínuas: por coluna, vetorizadas e em cache")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--columns', type=int, default=40)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    # Avisos de colunas inteiramente ausentes (os mesmos nas duas versões)
+    warnings.filterwarnings('ignore')
+
+    frames = {
+        'train.csv': pd.read_csv(TRAIN_CSV_PATH).select_dtypes(exclude='object').drop(columns='Id'),
+        f'sintético {args.rows:,} x {args.columns}': _synthetic_frame(args.rows, args.columns),
+    }
+
+    print(f"{'dados':<28}{'anterior (s)':>14}{'vetorizado (s)':>16}{'cache 1ª (s)':>14}{'cache reexec. (s)':>19}")
+    for name, numeric_vars_df in frames.items():
+        reference, legacy_s = _best_of(lambda: _legacy_metrics(numeric_vars_df), args.repeats)
+        metrics_df, vectorized_s = _best_of(lambda: utils.continuous_variables_metrics(numeric_vars_df), args.repeats)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            _, first_run_s = _best_of(lambda: utils.continuous_variables_metrics(numeric_vars_df, cache_dir=cache_dir), 1)
+            cached_df, cached_s = _best_of(lambda: utils.continuous_variables_metrics(numeric_vars_df, cache_dir=cache_dir),
+                                           args.repeats)
+
+        for result in (metrics_df, cached_df):
+            if not np.array_equal(result[reference.columns].to_numpy(float), reference.to_numpy(float), equal_nan=True):
+                raise SystemExit(f"As métricas de '{name}' divergem da versão anterior")
+        print(f"{name:<28}{legacy_s:>14.3f}{vectorized_s:>16.3f}{first_run_s:>14.3f}{cached_s:>19.3f}")
+
+
+if __name__ == '__main__':
+    main()
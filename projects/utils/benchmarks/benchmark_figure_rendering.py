@@ -0,0 +1,137 @@
+"""
+Renderização das figuras em arquivos: tempo e pico de memória de `plot_continuous_variables_distributions`
+no `train.csv` do projeto de preços de casas, em sequência e em um pool de processos.
+
+As variáveis contínuas (numéricas com mais de 25 valores distintos) são salvas em PNG com o backend Agg em
+três cenários, cada um em um processo novo:
+
+- sem fechar as figuras: as mesmas figuras salvas em sequência, mas mantidas abertas no pyplot, como
+  acontecia com `plt.show()` fora do notebook (backend Agg);
+- 1 processo: `output_dir` com `n_jobs= 1` (cada figura é fechada após ser salva);
+- N processos: `output_dir` com `n_jobs= N`.
+
+Os picos de RSS e de PSS somam o processo do cenário e os processos filhos (pool de renderização).
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_figure_rendering --n-jobs 4 --repeats 3
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import psutil
+
+TRAIN_CSV_PATH = "house-sales-price-forecast/data/extracted_data/train.csv"
+
+
+class PeakRssSampler:
+    # Amostra em segundo plano a memória do processo somada à dos seus filhos e guarda os maiores valores observados
+    # (RSS conta as páginas compartilhadas dos processos criados por fork uma vez por processo; PSS as divide)
+
+    def __init__(self, interval=0.05):
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak_rss, self.peak_pss = self._tree_memory()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _tree_memory(self):
+        rss, pss = 0, 0
+        for process in [self.process] + self.process.children(recursive=True):
+            try:
+                memory = process.memory_full_info()
+            except psutil.NoSuchProcess:
+                continue
+            rss += memory.rss
+            pss += memory.pss
+        return rss, pss
+
+    def _sample(self):
+        rss, pss = self._tree_memory()
+        self.peak_rss, self.peak_pss = max(self.peak_rss, rss), max(self.peak_pss, pss)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def _save_without_closing(continuous_vars_df, output_dir):
+    import matplotlib.pyplot as plt
+    from utils.eda_visualization_functions import _continuous_variable_distribution_figure
+
+    for var_name in continuous_vars_df.columns:
+        fig = _continuous_variable_distribution_figure(continuous_vars_df[var_name], var_name)
+        fig.savefig(os.path.join(output_dir, f"continuous_distribution_{var_name}.png"), dpi=100)
+    n_open_figures = len(plt.get_fignums())
+    plt.close('all')
+    return n_open_figures
+
+
+def _run_scenario(n_jobs):
+    import matplotlib
+    matplotlib.use('Agg')
+    import pandas as pd
+    import utils
+
+    df = pd.read_csv(TRAIN_CSV_PATH)
+    numeric_vars_df = df.select_dtypes(exclude='object').drop(columns='Id')
+    continuous_vars_df = numeric_vars_df[[var for var in numeric_vars_df if numeric_vars_df[var].nunique() > 25]]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        with PeakRssSampler() as sampler:
+            start = time.perf_counter()
+            if n_jobs is None:
+                n_files = _save_without_closing(continuous_vars_df, output_dir)
+            else:
+                n_files = len(utils.plot_continuous_variables_distributions(continuous_vars_df, output_dir=output_dir,
+                                                                             n_jobs=n_jobs))
+            wall_time = time.perf_counter() - start
+
+    return {'n_figures': n_files, 'wall_s': wall_time, 'peak_rss_mb': sampler.peak_rss / 2 ** 20,
+            'peak_pss_mb': sampler.peak_pss / 2 ** 20}
+
+
+def _run_in_new_process(n_jobs):
+    # Cada cenário em um processo novo, para que o pico de memória de um não contamine o seguinte (o processo
+    # principal não importa pandas nem matplotlib, então o processo do cenário começa sem figuras nem caches)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_scenario, n_jobs).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo e pico de memória da renderização das figuras em arquivos")
+    parser.add_argument('--n-jobs', type=int, default=4)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    scenarios = {
+        'sem fechar as figuras': None,
+        '1 processo': 1,
+        f'{args.n_jobs} processos': args.n_jobs,
+    }
+
+    print(f"CPUs disponíveis: {os.cpu_count()}\n")
+    print(f"{'cenário':<24}{'figuras':>9}{'tempo (s)':>11}{'pico RSS (MB)':>15}{'pico PSS (MB)':>15}")
+    for name, n_jobs in scenarios.items():
+        runs = [_run_in_new_process(n_jobs) for _ in range(args.repeats)]
+        best = min(runs, key=lambda run: run['wall_s'])
+        peak_rss_mb = max(run['peak_rss_mb'] for run in runs)
+        peak_pss_mb = max(run['peak_pss_mb'] for run in runs)
+        print(f"{name:<24}{best['n_figures']:>9}{best['wall_s']:>11.2f}{peak_rss_mb:>15.0f}{peak_pss_mb:>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
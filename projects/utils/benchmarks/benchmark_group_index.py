@@ -0,0 +1,102 @@
+"""
+Índice dos grupos e memoização da normalidade nos testes de comparação quantitativa x qualitativa.
+
+No `train.csv` do projeto de preços de casas, calcula a carga completa do
+`plot_multivariate_heatmap_quantitative_qualitative_vars` (todos os pares quantitativa x
+qualitativa) de três formas, verificando que os p-valores coincidem:
+
+- anterior: `Series.unique()` e máscaras `qualitative_var == categoria` recalculadas em cada teste;
+- códigos + máscaras: variáveis codificadas uma única vez, grupos por máscara sobre os códigos;
+- índice + memoização: grupos fatiados do índice (ordenação estável dos códigos) e normalidade
+  univariada calculada uma vez por variável quantitativa.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_group_index
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import utils
+from utils.association_functions import _comparison_test_by_groups, _encode_qualitative_variable
+
+TRAIN_CSV_PATH = "house-sales-price-forecast/data/extracted_data/train.csv"
+
+
+def _legacy_comparison_test(qualitative_var, quant_var=None, numeric_ordinal_var=None):
+    # Versão anterior do _comparison_test_for_ordinal_or_quantitative_vars: máscaras por categoria em cada teste
+    split_groups = lambda values: [values[qualitative_var == category] for category in qualitative_var.unique()]
+    return _comparison_test_by_groups(split_groups, qualitative_var.nunique(), quant_var=quant_var,
+                                      numeric_ordinal_var=numeric_ordinal_var)
+
+
+def _legacy_pvalues_matrix(quantitative_vars_df, qualitative_vars_df):
+    pvalues_matrix_df = pd.DataFrame(index=quantitative_vars_df.columns, columns=qualitative_vars_df.columns)
+    for quant_var_name in quantitative_vars_df.columns:
+        for qual_var_name in qualitative_vars_df.columns:
+            p_value, _ = _legacy_comparison_test(qualitative_vars_df[qual_var_name],
+                                                 quant_var=quantitative_vars_df[quant_var_name])
+            pvalues_matrix_df.loc[quant_var_name, qual_var_name] = p_value
+    return pvalues_matrix_df.astype(float)
+
+
+def _masked_codes_pvalues_matrix(quantitative_vars_df, qualitative_vars_df):
+    # Variáveis codificadas uma única vez, mas grupos selecionados por máscara e normalidade recalculada por par
+    encoded_vars = {var: _encode_qualitative_variable(qualitative_vars_df[var]) for var in qualitative_vars_df.columns}
+    pvalues_matrix = np.empty((quantitative_vars_df.shape[1], qualitative_vars_df.shape[1]))
+    for i, quant_var_name in enumerate(quantitative_vars_df.columns):
+        quant_var = quantitative_vars_df[quant_var_name].to_numpy()
+        for j, qual_var_name in enumerate(qualitative_vars_df.columns):
+            encoded = encoded_vars[qual_var_name]
+            split_groups = lambda values: [values[encoded['codes'] == code] for code in range(encoded['n_categories'])]
+            pvalues_matrix[i, j], _ = _comparison_test_by_groups(split_groups, encoded['n_categories'],
+                                                                 quant_var=quant_var)
+    return pd.DataFrame(pvalues_matrix, index=quantitative_vars_df.columns, columns=qualitative_vars_df.columns)
+
+
+def _best_of(func, n_repeats):
+    timings = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Índice dos grupos e memoização da normalidade")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    # Avisos dos testes em grupos pequenos ou constantes (os mesmos nas três versões)
+    warnings.filterwarnings('ignore')
+
+    df = pd.read_csv(TRAIN_CSV_PATH)
+    qualitative_vars_df = df.select_dtypes(include='object').fillna('None')
+    quantitative_vars_df = df.select_dtypes(exclude='object').drop(columns='Id')
+    n_pairs = quantitative_vars_df.shape[1] * qualitative_vars_df.shape[1]
+
+    versions = {
+        'anterior': lambda: _legacy_pvalues_matrix(quantitative_vars_df, qualitative_vars_df),
+        'códigos + máscaras': lambda: _masked_codes_pvalues_matrix(quantitative_vars_df, qualitative_vars_df),
+        'índice + memoização': lambda: utils.quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df,
+                                                                                        qualitative_vars_df),
+    }
+
+    print(f"Pares quantitativa x qualitativa: {n_pairs}\n")
+    print(f"{'versão':<24}{'tempo (s)':>11}{'ms/par':>9}{'ganho':>8}")
+    reference, reference_s = None, None
+    for name, func in versions.items():
+        result, seconds = _best_of(func, args.repeats)
+        if reference is None:
+            reference, reference_s = result, seconds
+        elif not np.array_equal(result.to_numpy(), reference.to_numpy(), equal_nan=True):
+            raise SystemExit(f"Os p-valores da versão '{name}' divergem da versão anterior")
+        print(f"{name:<24}{seconds:>11.2f}{seconds * 1000 / n_pairs:>9.2f}{reference_s / seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Gráficos de dispersão e boxplots em grandes volumes: tempo de renderização das figuras com todas as observações
+(padrão) e com o modo para grandes volumes (`large_data_threshold`), que desenha histogramas 2D, amostras
+estratificadas e boxplots a partir de estatísticas pré-calculadas.
+
+Usa DataFrames sintéticos com uma variável contínua, uma variável discreta (10 valores) e uma variável-alvo
+contínua, e mede, para cada número de observações em `--rows`, o tempo de construir e salvar em PNG (backend
+Agg) as figuras de:
+
+- dispersão: `plot_bivariate_analysis_quantitative_variables` com a variável contínua ('histogram' e 'sample');
+- boxplots por grupo: `plot_bivariate_analysis_quantitative_variables` com a variável discreta;
+- distribuição: `plot_continuous_variables_distributions` (histograma e boxplot).
+
+O tempo inclui o cálculo dos agregados a partir das observações. O modo padrão só é medido até `--max-default-rows`
+observações, pois acima disso a dispersão com todos os pontos leva minutos e gigabytes de memória.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_large_data_plots --rows 100000 1000000 10000000
+"""
+import argparse
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+import utils
+from utils.eda_visualization_functions import _bivariate_quantitative_variables_figure, _continuous_variable_distribution_figure
+
+
+def _synthetic_frame(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    discrete = rng.integers(1, 11, size=n_rows)
+    continuous = rng.lognormal(mean=9, sigma=0.5, size=n_rows)
+    target = 20_000 * discrete + 5 * continuous + rng.lognormal(mean=10, sigma=0.6, size=n_rows)
+    return pd.DataFrame({'continuous': continuous, 'discrete': discrete, 'target': target})
+
+
+def _figure_tasks(df):
+    # Argumentos das figuras, calculados antes da medição (métricas e correlações não fazem parte da renderização)
+    metrics_df = utils.continuous_variables_metrics(df[['continuous', 'discrete', 'target']])
+    target_df = df[['target']]
+    bivariate_args = lambda var_name: (df[var_name], target_df, 0.5, metrics_df.loc[var_name, 'upper_fence'],
+                                       metrics_df.loc['target', 'upper_fence'], ['discrete'])
+    return {
+        'dispersão (histogram)': (_bivariate_quantitative_variables_figure, bivariate_args('continuous'), {}),
+        'dispersão (sample)': (_bivariate_quantitative_variables_figure, bivariate_args('continuous'),
+                               {'large_data_scatter': 'sample'}),
+        'boxplots por grupo': (_bivariate_quantitative_variables_figure, bivariate_args('discrete'), {}),
+        'distribuição': (_continuous_variable_distribution_figure,
+                         (df['continuous'], 'continuous', metrics_df.loc['continuous'].to_dict()), {}),
+    }
+
+
+def _render_time(figure_builder, args, output_dir):
+    start = time.perf_counter()
+    utils.render_figures(figure_builder, [('figure', args)], output_dir=output_dir)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de renderização de dispersões e boxplots em grandes volumes")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--max-default-rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'observações':>12}  {'figura':<24}{'padrão (s)':>12}{'grandes volumes (s)':>21}")
+    for n_rows in args.rows:
+        df = _synthetic_frame(n_rows)
+        with tempfile.TemporaryDirectory() as output_dir:
+            for name, (figure_builder, figure_args, large_data_kwargs) in _figure_tasks(df).items():
+                large_data_s = _render_time(lambda *a: figure_builder(*a, large_data_threshold=0, **large_data_kwargs),
+                                            figure_args, output_dir)
+                default = '-'
+                if n_rows <= args.max_default_rows and 'sample' not in name:
+                    default = f"{_render_time(figure_builder, figure_args, output_dir):.2f}"
+                print(f"{n_rows:>12,}  {name:<24}{default:>12}{large_data_s:>21.2f}")
+
+
+if __name__ == '__main__':
+    main()
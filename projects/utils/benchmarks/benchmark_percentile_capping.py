@@ -0,0 +1,103 @@
+"""
+Capping percentual dos outliers: `treat_outliers_by_percentile_capping` (transformador `PercentileCapper`, com os
+percentis de todas as variáveis em uma chamada e substituição por máscaras, opcionalmente com threads) contra a
+versão anterior (`Series.apply` por elemento).
+
+Em DataFrames sintéticos de `--rows` linhas e `--columns` variáveis contínuas com caudas longas, mede o tempo das
+duas versões e verifica que os resultados são idênticos. Verifica também que os limites salvos em JSON e
+recarregados (`save` e `load`, como na API do modelo) tratam os dados da mesma forma pelo `transform` e pelo
+`cap_array`.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_percentile_capping --rows 10000 1000000 10000000 --n-jobs 4
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+
+def _legacy_percentile_capping(continuous_vars_df, target_vars, percentile_inf_value=0, percentile_sup_value=99.5):
+    # Versão anterior do treat_outliers_by_percentile_capping, com Series.apply por elemento
+    for var in target_vars:
+        percentile_inf = np.percentile(continuous_vars_df[var], percentile_inf_value)
+        percentile_sup = np.percentile(continuous_vars_df[var], percentile_sup_value)
+        median = continuous_vars_df[var].median()
+        continuous_vars_df[var] = continuous_vars_df[var].apply(
+            lambda x: median if (x < percentile_inf) or (x > percentile_sup) else x)
+
+
+def _synthetic_frame(n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {f"float_{i}": rng.lognormal(mean=5, sigma=1, size=n_rows) for i in range(n_columns - n_columns // 2)}
+    columns.update({f"int_{i}": rng.pareto(3, size=n_rows).astype(np.int64) for i in range(n_columns // 2)})
+    return pd.DataFrame(columns)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _check_saved_bounds(df, target_vars):
+    # Limites salvos e recarregados, aplicados pelo transform (DataFrame) e pelo cap_array (matriz NumPy)
+    capper = utils.PercentileCapper(percentile_inf_value=0.5, percentile_sup_value=99.5).fit(df, target_vars)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'outlier_capping.json')
+        capper.save(path)
+        loaded = utils.PercentileCapper.load(path)
+
+    expected = capper.transform(df)
+    pd.testing.assert_frame_equal(loaded.transform(df), expected, check_exact=True)
+    array = df[target_vars].to_numpy(dtype=np.float64)
+    loaded.cap_array(array, target_vars)
+    if not np.array_equal(array, expected[target_vars].to_numpy(dtype=np.float64)):
+        raise SystemExit("O cap_array diverge do transform com os limites recarregados")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capping percentual dos outliers: vetorizado x versão anterior")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 1000000, 10000000])
+    parser.add_argument('--columns', type=int, default=4)
+    parser.add_argument('--n-jobs', type=int, default=4)
+    parser.add_argument('--legacy-max-rows', type=int, default=10000000,
+                        help="Maior DataFrame tratado também pela versão anterior (lenta)")
+    args = parser.parse_args()
+
+    print(f"{'linhas':>10}{'anterior (s)':>14}{'vetorizada (s)':>16}{f'{args.n_jobs} threads (s)':>16}{'ganho':>9}")
+    for n_rows in args.rows:
+        df = _synthetic_frame(n_rows, args.columns)
+        target_vars = list(df.columns)
+
+        vectorized_df = df.copy()
+        vectorized_s = _timed(lambda: utils.treat_outliers_by_percentile_capping(vectorized_df, target_vars))
+        parallel_df = df.copy()
+        parallel_s = _timed(lambda: utils.treat_outliers_by_percentile_capping(parallel_df, target_vars,
+                                                                               n_jobs=args.n_jobs))
+        pd.testing.assert_frame_equal(vectorized_df, parallel_df, check_exact=True)
+
+        legacy_s = np.nan
+        if n_rows <= args.legacy_max_rows:
+            legacy_df = df.copy()
+            legacy_s = _timed(lambda: _legacy_percentile_capping(legacy_df, target_vars))
+            pd.testing.assert_frame_equal(legacy_df, vectorized_df, check_exact=True)
+            del legacy_df
+
+        print(f"{n_rows:>10}{legacy_s:>14.2f}{vectorized_s:>16.3f}{parallel_s:>16.3f}"
+              f"{legacy_s / min(vectorized_s, parallel_s):>8.0f}x")
+        del vectorized_df, parallel_df
+
+        _check_saved_bounds(df, target_vars)
+        del df
+
+    print("\nLimites salvos e recarregados: transform e cap_array idênticos ao capper ajustado")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Matrizes de p-valores dos heatmaps multivariados: motor com codificação prévia, simetria e pool de
+processos contra os laços anteriores.
+
+No `train.csv` do projeto de preços de casas (variáveis qualitativas com os valores ausentes
+preenchidos com 'None', como no notebook, e as escalas de qualidade como ordinais), calcula a
+matriz qualitativa x qualitativa e a quantitativa x qualitativa com a versão anterior (laço duplo
+de testes, célula a célula via `.loc`) e com `qualitative_vars_pvalues_matrix` e
+`quantitative_qualitative_vars_pvalues_matrix` em sequência e em um pool de processos, verificando
+que os p-valores coincidem.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_pvalue_matrices --n-jobs 4
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import scipy.stats as sts
+
+import utils
+from utils.benchmarks.benchmark_group_index import _legacy_comparison_test
+
+TRAIN_CSV_PATH = "house-sales-price-forecast/data/extracted_data/train.csv"
+QUALITY_SCALE = ['None', 'Po', 'Fa', 'TA', 'Gd', 'Ex']
+ORDINAL_VARS = ['ExterQual', 'ExterCond', 'BsmtQual', 'BsmtCond', 'HeatingQC', 'KitchenQual', 'FireplaceQu',
+                'GarageQual', 'GarageCond', 'PoolQC']
+
+
+def _legacy_qualitative_vars_pvalues_matrix(qualitative_vars_df, ordinal_vars_dict):
+    # Laço da versão anterior do plot_multivariate_heatmap_qualitative_vars (todos os pares, célula a célula)
+    qualitative_vars_list = qualitative_vars_df.columns
+    ordinals_vars_list = list(ordinal_vars_dict.keys())
+    pvalues_matrix_df = pd.DataFrame(index=qualitative_vars_list, columns=qualitative_vars_list)
+
+    for qual_var_name1 in qualitative_vars_list:
+        for qual_var_name2 in qualitative_vars_list:
+            if (qual_var_name1 in ordinals_vars_list) & (qual_var_name2 in ordinals_vars_list):
+                ordinal_var2 = pd.Categorical(qualitative_vars_df[qual_var_name2],
+                                              categories=ordinal_vars_dict[qual_var_name2], ordered=True).codes
+                p_value, _ = _legacy_comparison_test(
+                    qualitative_vars_df[qual_var_name1], numeric_ordinal_var=ordinal_var2)
+            elif qual_var_name1 in ordinals_vars_list:
+                ordinal_var = pd.Categorical(qualitative_vars_df[qual_var_name1],
+                                             categories=ordinal_vars_dict[qual_var_name1], ordered=True).codes
+                p_value, _ = _legacy_comparison_test(
+                    qualitative_vars_df[qual_var_name2], numeric_ordinal_var=ordinal_var)
+            elif qual_var_name2 in ordinals_vars_list:
+                ordinal_var = pd.Categorical(qualitative_vars_df[qual_var_name2],
+                                             categories=ordinal_vars_dict[qual_var_name2], ordered=True).codes
+                p_value, _ = _legacy_comparison_test(
+                    qualitative_vars_df[qual_var_name1], numeric_ordinal_var=ordinal_var)
+            else:
+                contingency_table = pd.crosstab(qualitative_vars_df[qual_var_name1], qualitative_vars_df[qual_var_name2])
+                _, p_value, _, _ = sts.chi2_contingency(contingency_table)
+            pvalues_matrix_df.loc[qual_var_name1, qual_var_name2] = p_value
+
+    return pvalues_matrix_df.astype(float)
+
+
+def _legacy_quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df, qualitative_vars_df):
+    # Laço da versão anterior do plot_multivariate_heatmap_quantitative_qualitative_vars
+    pvalues_matrix_df = pd.DataFrame(index=quantitative_vars_df.columns, columns=qualitative_vars_df.columns)
+    for quant_var_name in quantitative_vars_df.columns:
+        for qual_var_name in qualitative_vars_df.columns:
+            p_value, _ = _legacy_comparison_test(
+                qualitative_vars_df[qual_var_name], quant_var=quantitative_vars_df[quant_var_name])
+            pvalues_matrix_df.loc[quant_var_name, qual_var_name] = p_value
+
+    return pvalues_matrix_df.astype(float)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def _max_relative_difference(reference, result):
+    both_nan = reference.isna() & result.isna()
+    relative = ((reference - result).abs() / reference.abs().clip(lower=np.finfo(float).tiny)).where(~both_nan, 0)
+    return relative.to_numpy().max()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Matrizes de p-valores dos heatmaps multivariados")
+    parser.add_argument('--n-jobs', type=int, default=4)
+    args = parser.parse_args()
+
+    # Avisos dos testes em grupos pequenos ou constantes (os mesmos nas duas versões)
+    warnings.filterwarnings('ignore')
+
+    df = pd.read_csv(TRAIN_CSV_PATH)
+    qualitative_vars_df = df.select_dtypes(include='object').fillna('None')
+    quantitative_vars_df = df.select_dtypes(exclude='object').drop(columns='Id')
+    ordinal_vars_dict = {var: QUALITY_SCALE for var in ORDINAL_VARS}
+
+    scenarios = {
+        f"qualitativas ({qualitative_vars_df.shape[1]} x {qualitative_vars_df.shape[1]})": (
+            lambda: _legacy_qualitative_vars_pvalues_matrix(qualitative_vars_df, ordinal_vars_dict),
+            lambda n_jobs: utils.qualitative_vars_pvalues_matrix(qualitative_vars_df, ordinal_vars_dict, n_jobs=n_jobs)),
+        f"quantitativas x qualitativas ({quantitative_vars_df.shape[1]} x {qualitative_vars_df.shape[1]})": (
+            lambda: _legacy_quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df, qualitative_vars_df),
+            lambda n_jobs: utils.quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df, qualitative_vars_df,
+                                                                             n_jobs=n_jobs)),
+    }
+
+    print(f"{'matriz':<42}{'anterior (s)':>14}{'1 processo (s)':>16}{f'{args.n_jobs} processos (s)':>17}"
+          f"{'dif. relativa máx.':>20}")
+    for name, (legacy, engine) in scenarios.items():
+        reference, legacy_s = _timed(legacy)
+        serial, serial_s = _timed(lambda: engine(1))
+        parallel, parallel_s = _timed(lambda: engine(args.n_jobs))
+        if not serial.equals(parallel):
+            raise SystemExit(f"O pool de processos alterou a matriz {name}")
+        print(f"{name:<42}{legacy_s:>14.2f}{serial_s:>16.2f}{parallel_s:>17.2f}"
+              f"{_max_relative_difference(reference, serial):>20.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Estatísticas descritivas em blocos: `print_missing_values_in_dataframe`, `print_zero_values_in_dataframe` e
+`descriptive_statistics_continuous_variables` sobre o DataFrame inteiro em memória (versão anterior) e
+`streaming_statistics_from_file` (uma passada pelo arquivo em blocos de `--chunk-size` linhas, com sketches
+mergeáveis por coluna).
+
+No `churn.csv` do projeto de churn de clientes e no `train.csv` do projeto de preços de casas, verifica que:
+
+- com os parâmetros padrão, os relatórios de valores faltantes e zerados são idênticos e a tabela de estatísticas
+  descritivas coincide com a versão em memória (tolerância relativa de 1e-9, pela ordem das somas), tanto em uma
+  passada quanto em duas metades combinadas com `merge`;
+- com sketches reduzidos (`--quantile-capacity` valores por nível e contagem exata de distintos até
+  `--distinct-limit`), os quantis e o número de valores distintos passam a ser aproximados. Para cada variável
+  numérica, reporta o maior erro de posto dos quantis 1%, 2%, ..., 99% (distância, em fração das observações,
+  entre o quantil pedido e a posição do valor retornado na amostra ordenada) e o erro relativo do número de
+  valores distintos estimado pelo HyperLogLog.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_streaming_statistics --chunk-size 1000 --quantile-capacity 128 --distinct-limit 16
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+CSV_PATHS = {
+    'churn.csv': "bank-customers-churn-forecast/data/churn.csv",
+    'train.csv': "house-sales-price-forecast/data/extracted_data/train.csv",
+}
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+def _printed(func, *args):
+    # Saída de um relatório impresso, para comparar as duas versões
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        func(*args)
+    return output.getvalue()
+
+
+def _in_memory_reports(path):
+    # Versão anterior: o arquivo inteiro em memória e as funções de description_functions
+    df = pd.read_csv(path)
+    numeric_df = df.select_dtypes(include=['int64', 'float64'])
+    return (_printed(utils.print_missing_values_in_dataframe, df), _printed(utils.print_zero_values_in_dataframe, df),
+            utils.descriptive_statistics_continuous_variables(numeric_df))
+
+
+def _streamed_reports(stats, columns):
+    return (_printed(stats.print_missing_values), _printed(stats.print_zero_values),
+            stats.descriptive_statistics(columns))
+
+
+def _merged_halves(path, chunk_size):
+    # Blocos alternados acumulados em duas instâncias e combinados, como em processos diferentes
+    halves = [utils.StreamingStatistics(), utils.StreamingStatistics()]
+    for i, chunk in enumerate(pd.read_csv(path, chunksize=chunk_size)):
+        halves[i % 2].update(chunk)
+    return halves[0].merge(halves[1])
+
+
+def _rank_error(sorted_values, estimates, q):
+    # Distância entre o quantil pedido e o intervalo de postos (empates incluídos) do valor retornado
+    n = len(sorted_values)
+    lower = np.searchsorted(sorted_values, estimates, side='left') / n
+    upper = np.searchsorted(sorted_values, estimates, side='right') / n
+    return np.maximum(np.maximum(lower - q, q - upper), 0).max()
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estatísticas descritivas em blocos x DataFrame em memória")
+    parser.add_argument('--chunk-size', type=int, default=1_000)
+    parser.add_argument('--quantile-capacity', type=int, default=128)
+    parser.add_argument('--distinct-limit', type=int, default=16)
+    args = parser.parse_args()
+
+    for name, path in CSV_PATHS.items():
+        df = pd.read_csv(path)
+        columns = list(df.select_dtypes(include=['int64', 'float64']).columns)
+
+        # Paridade com os parâmetros padrão: uma passada e duas metades combinadas com merge
+        reference, in_memory_s = _timed(lambda: _in_memory_reports(path))
+        single_pass, streamed_s = _timed(lambda: utils.streaming_statistics_from_file(path, chunk_size=args.chunk_size))
+        for label, stats in [('uma passada', single_pass), ('merge', _merged_halves(path, args.chunk_size))]:
+            missing_report, zero_report, stats_df = _streamed_reports(stats, columns)
+            if missing_report != reference[0] or zero_report != reference[1]:
+                raise SystemExit(f"Os relatórios de faltantes/zerados de '{name}' ({label}) divergem da versão em memória")
+            pd.testing.assert_frame_equal(stats_df, reference[2], check_dtype=False, rtol=1e-9)
+
+        print(f"{name} ({len(df):,} linhas, {len(columns)} variáveis numéricas, blocos de {args.chunk_size:,}): "
+              f"relatórios idênticos e estatísticas iguais à versão em memória (uma passada e merge)")
+        print(f"  em memória: {in_memory_s:.3f} s; em blocos: {streamed_s:.3f} s")
+
+        # Erro dos sketches reduzidos: quantis aproximados e distintos estimados pelo HyperLogLog
+        approximate = utils.streaming_statistics_from_file(path, chunk_size=args.chunk_size,
+                                                           quantile_capacity=args.quantile_capacity,
+                                                           exact_distinct_limit=args.distinct_limit)
+        print(f"  sketches reduzidos (capacidade {args.quantile_capacity}, distintos exatos até {args.distinct_limit}):")
+        print(f"  {'variável':<16}{'distintos':>10}{'estimados':>11}{'erro rel.':>11}{'erro de posto (quantis)':>26}")
+        rank_errors, distinct_errors = [], []
+        for column in columns:
+            values = np.sort(df[column].dropna().to_numpy(dtype=np.float64))
+            column_stats = approximate.columns[column]
+            rank_error = _rank_error(values, approximate.quantiles(column, QUANTILES), QUANTILES)
+            exact_distinct = df[column].nunique(dropna=False)
+            estimated_distinct = column_stats.distinct_count()
+            distinct_error = abs(estimated_distinct - exact_distinct) / exact_distinct
+
+            rank_errors.append(rank_error)
+            if column_stats.distinct_sketch is not None:
+                distinct_errors.append(distinct_error)
+            print(f"  {column:<16}{exact_distinct:>10,}{estimated_distinct:>11,.0f}{distinct_error:>11.2%}"
+                  f"{rank_error:>26.2%}")
+        print(f"  maior erro de posto: {max(rank_errors):.2%}; maior erro relativo dos distintos estimados "
+              f"({len(distinct_errors)} variáveis): {max(distinct_errors, default=0):.2%}\n")
+
+
+if __name__ == '__main__':
+    main()
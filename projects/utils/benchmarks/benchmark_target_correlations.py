@@ -0,0 +1,83 @@
+"""
+Correlações das variáveis independentes com a variável-alvo: laço anterior (um `pd.merge` e um
+`DataFrame.corr(method='spearman')` por variável), `DataFrame.corrwith` do pandas e `target_correlations`
+(postos da variável-alvo calculados uma vez e produto matricial por bloco de colunas).
+
+Usa DataFrames sintéticos largos de `--rows` linhas e `--columns` colunas, com valores repetidos
+(empates nos postos) e valores ausentes em parte das colunas e da variável-alvo, verificando que os
+coeficientes coincidem com os do pandas.
+
+Execução (a partir do diretório projects):
+    python -m utils.benchmarks.benchmark_target_correlations --rows 50000 --columns 1000 2000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+
+def _legacy_spearman_correlations(independent_vars_df, target_var_df):
+    # Laço da versão anterior do plot_bivariate_analysis_quantitative_variables
+    target_var_name = target_var_df.columns[0]
+    correlations = {}
+    for var_name in independent_vars_df.columns:
+        dataframe_for_correlation = pd.merge(independent_vars_df[var_name], target_var_df, right_index=True, left_index=True)
+        correlations[var_name] = dataframe_for_correlation.corr(method='spearman').loc[target_var_name, var_name]
+    return pd.Series(correlations)
+
+
+def _synthetic_frame(n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    target = rng.normal(size=n_rows)
+    weights = rng.uniform(-1, 1, size=n_columns)
+    values = (target[:, None] * weights + rng.normal(size=(n_rows, n_columns))).round(1)
+
+    # Valores ausentes em 10% das colunas e em 1% das observações da variável-alvo
+    columns_with_nan = rng.choice(n_columns, size=n_columns // 10, replace=False)
+    values[:, columns_with_nan] = np.where(rng.random((n_rows, columns_with_nan.size)) < 0.05, np.nan,
+                                           values[:, columns_with_nan])
+    target[rng.random(n_rows) < 0.01] = np.nan
+
+    independent_vars_df = pd.DataFrame(values, columns=[f"var_{i}" for i in range(n_columns)])
+    return independent_vars_df, pd.DataFrame({'target': target})
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Correlações com a variável-alvo em DataFrames largos")
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--columns', type=int, nargs='+', default=[1000, 2000])
+    args = parser.parse_args()
+
+    print(f"{'colunas':>8}{'anterior (s)':>14}{'corrwith (s)':>14}{'spearman (s)':>14}{'+ pearson (s)':>15}"
+          f"{'ganho':>8}{'dif. máx.':>11}")
+    for n_columns in args.columns:
+        independent_vars_df, target_var_df = _synthetic_frame(args.rows, n_columns)
+        target_var = target_var_df['target']
+
+        reference, legacy_s = _timed(lambda: _legacy_spearman_correlations(independent_vars_df, target_var_df))
+        corrwith, corrwith_s = _timed(lambda: independent_vars_df.corrwith(target_var, method='spearman'))
+        spearman_df, spearman_s = _timed(lambda: utils.target_correlations(independent_vars_df, target_var,
+                                                                         methods=('spearman',)))
+        both_df, both_s = _timed(lambda: utils.target_correlations(independent_vars_df, target_var))
+
+        pearson_reference = independent_vars_df.corrwith(target_var)
+        max_difference = max(np.nanmax(np.abs(spearman_df['spearman'] - reference)),
+                             np.nanmax(np.abs(corrwith - reference)),
+                             np.nanmax(np.abs(both_df['pearson'] - pearson_reference)))
+        if max_difference > 1e-12:
+            raise SystemExit(f"As correlações divergem do pandas ({max_difference:.1e})")
+        print(f"{n_columns:>8}{legacy_s:>14.2f}{corrwith_s:>14.2f}{spearman_s:>14.2f}{both_s:>15.2f}"
+              f"{legacy_s / spearman_s:>7.0f}x{max_difference:>11.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+import scipy.stats as sts
+
+
+class _CategoryEncoder:
+    """
+    Códigos inteiros de uma variável qualitativa, estáveis entre blocos: cada categoria recebe o próximo código na
+    primeira vez em que aparece, de modo que as contagens de blocos (ou processos) diferentes podem ser somadas.
+    """
+
+    def __init__(self):
+        self.labels = []
+        self.codes = {}
+        self.dtype = None
+
+    def _code(self, label):
+        code = self.codes.get(label)
+        if code is None:
+            code = self.codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def _merge_dtype(self, dtype):
+        # União das categorias de blocos (ou instâncias) diferentes: as categorias novas entram depois das conhecidas,
+        # na ordem do bloco, e o tipo mantém o flag `ordered` do primeiro bloco categórico
+        if dtype is None:
+            return
+        if self.dtype is None:
+            self.dtype = dtype
+            return
+        new_categories = dtype.categories[~dtype.categories.isin(self.dtype.categories)]
+        if len(new_categories):
+            self.dtype = pd.CategoricalDtype(self.dtype.categories.append(new_categories), ordered= self.dtype.ordered)
+
+    def encode(self, values):
+        # Códigos locais do bloco (pd.factorize) traduzidos para os códigos globais; -1 para valores faltantes
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            self._merge_dtype(values.dtype)
+        local_codes, uniques = pd.factorize(values, sort= False)
+        global_codes = np.array([self._code(label) for label in uniques] + [-1], dtype= np.int64)
+        return global_codes[local_codes]
+
+    def merge(self, other):
+        # Códigos desta instância para as categorias de outra instância, na ordem dos códigos da outra
+        self._merge_dtype(other.dtype)
+        return np.array([self._code(label) for label in other.labels], dtype= np.int64)
+
+    def sorted_index(self, codes, name):
+        # Categorias dos códigos na ordem do pd.crosstab: a ordem das categorias, se a variável for categórica,
+        # ou a ordem crescente dos valores
+        labels = [self.labels[code] for code in codes]
+        if self.dtype is not None:
+            index = pd.CategoricalIndex(labels, dtype= self.dtype, name= name)
+            order = np.argsort(index.codes, kind= 'stable')
+        else:
+            index = pd.Index(labels, name= name)
+            order = index.argsort()
+        return codes[order], index[order]
+
+
+class StreamingContingencyTables:
+    """
+    Tabelas de contingência de várias variáveis qualitativas com uma variável-alvo, acumuladas em uma única
+    passada por blocos (ex.: arquivos CSV ou Parquet maiores que a memória).
+
+    Cada bloco é codificado em inteiros (um `pd.factorize` por variável, com códigos globais estáveis entre blocos)
+    e a tabela de cada variável é um único `np.bincount` sobre os pares de códigos (variável, alvo). A memória é
+    limitada pelo tamanho do bloco e pelo número de categorias, e as tabelas de blocos processados separadamente
+    (ex.: em processos diferentes) podem ser combinadas com `merge`. As tabelas e os valores p reproduzem
+    `pd.crosstab` e `sts.chi2_contingency`.
+
+    Parâmetros:
+    -----------
+    target : str
+        Nome da variável-alvo qualitativa.
+
+    variables : list, opcional
+        Variáveis cruzadas com a variável-alvo (padrão: todas as demais colunas do primeiro bloco).
+
+    Exemplos de uso:
+    ----------------
+    >>> tables = StreamingContingencyTables('Exited', ['Geography', 'Gender'])
+    >>> for chunk in pd.read_csv('churn.csv', chunksize= 100_000):
+    ...     tables.update(chunk)
+    >>> tables.table('Geography')
+    >>> tables.chi2_pvalues()
+    """
+
+    def __init__(self, target, variables= None):
+        self.target = target
+        self.variables = None if variables is None else list(variables)
+        self.target_encoder = _CategoryEncoder()
+        self.encoders = {}
+        self.counts = {}
+        self.n_rows = 0
+
+    def _grown_counts(self, variable):
+        # Tabela de contagens da variável ampliada (com zeros) para as categorias conhecidas até o momento
+        shape = (len(self.encoders[variable].labels), len(self.target_encoder.labels))
+        counts = self.counts.get(variable)
+        if counts is None:
+            counts = np.zeros(shape, dtype= np.int64)
+        elif counts.shape != shape:
+            counts = np.pad(counts, [(0, shape[0] - counts.shape[0]), (0, shape[1] - counts.shape[1])])
+        self.counts[variable] = counts
+        return counts
+
+    def update(self, chunk):
+        """
+        Acumula as contagens de um bloco de linhas.
+
+        Parâmetros:
+        -----------
+        chunk : pd.DataFrame
+            Bloco do conjunto de dados, com a variável-alvo e as variáveis cruzadas.
+
+        Retorno:
+        --------
+        StreamingContingencyTables
+            A própria instância, para encadeamento.
+        """
+        if self.variables is None:
+            self.variables = [column for column in chunk.columns if column != self.target]
+
+        self.n_rows += len(chunk)
+        target_codes = self.target_encoder.encode(chunk[self.target])
+        target_present = target_codes >= 0
+        n_target_categories = len(self.target_encoder.labels)
+
+        for variable in self.variables:
+            encoder = self.encoders.setdefault(variable, _CategoryEncoder())
+            codes = encoder.encode(chunk[variable])
+
+            # Como no pd.crosstab, linhas com valor faltante na variável ou no alvo não são contadas
+            both_present = target_present & (codes >= 0)
+            counts = self._grown_counts(variable)
+            counts += np.bincount(codes[both_present] * n_target_categories + target_codes[both_present],
+                                  minlength= counts.size).reshape(counts.shape)
+        return self
+
+    def merge(self, other):
+        """
+        Combina as contagens acumuladas por outra instância (ex.: de outro processo ou de outro arquivo).
+
+        Parâmetros:
+        -----------
+        other : StreamingContingencyTables
+            Tabelas de outra parte do mesmo conjunto de dados, com a mesma variável-alvo.
+
+        Retorno:
+        --------
+        StreamingContingencyTables
+            A própria instância, para encadeamento.
+        """
+        if self.variables is None:
+            self.variables = other.variables
+        self.n_rows += other.n_rows
+
+        # As categorias da outra instância podem ter códigos diferentes: as contagens são somadas nas posições traduzidas
+        target_codes = self.target_encoder.merge(other.target_encoder)
+        for variable, other_counts in other.counts.items():
+            codes = self.encoders.setdefault(variable, _CategoryEncoder()).merge(other.encoders[variable])
+            counts = self._grown_counts(variable)
+            counts[np.ix_(codes[:other_counts.shape[0]], target_codes[:other_counts.shape[1]])] += other_counts
+        return self
+
+    def table(self, variable):
+        """
+        Retorna a tabela de contingência de uma variável com a variável-alvo.
+
+        Parâmetros:
+        -----------
+        variable : str
+            Nome da variável.
+
+        Retorno:
+        --------
+        pd.DataFrame
+            Contagens com as categorias da variável nas linhas e as da variável-alvo nas colunas, como
+            `pd.crosstab(df[variable], df[target])`: categorias sem nenhuma observação não entram na tabela e as
+            demais seguem a ordem das categorias (variáveis categóricas) ou a ordem crescente dos valores.
+        """
+        counts = self._grown_counts(variable)
+        rows, index = self.encoders[variable].sorted_index(np.flatnonzero(counts.sum(axis= 1) > 0), variable)
+        columns, column_index = self.target_encoder.sorted_index(np.flatnonzero(counts.sum(axis= 0) > 0), self.target)
+
+        return pd.DataFrame(counts[np.ix_(rows, columns)], index= index, columns= column_index)
+
+    def chi2_pvalues(self, variables= None):
+        """
+        Calcula o valor p do teste qui-quadrado de independência de cada variável com a variável-alvo.
+
+        Parâmetros:
+        -----------
+        variables : list, opcional
+            Variáveis testadas (padrão: todas).
+
+        Retorno:
+        --------
+        pd.Series
+            Valor p de cada variável (o mesmo de `sts.chi2_contingency(pd.crosstab(...))`).
+        """
+        variables = self.variables if variables is None else variables
+        return pd.Series({variable: sts.chi2_contingency(self.table(variable))[1] for variable in variables},
+                         name= 'p_value', dtype= float)
+
+
+def contingency_tables_from_file(path, target, variables= None, chunk_size= 100_000, file_format= None):
+    """
+    Calcula as tabelas de contingência das variáveis com a variável-alvo lendo um arquivo CSV ou Parquet em
+    blocos, com memória limitada pelo tamanho do bloco.
+
+    Parâmetros:
+    -----------
+    path : str
+        Caminho do arquivo.
+
+    target : str
+        Nome da variável-alvo qualitativa.
+
+    variables : list, opcional
+        Variáveis cruzadas com a variável-alvo (padrão: todas as demais colunas do arquivo).
+
+    chunk_size : int, opcional
+        Número de linhas por bloco (padrão é 100.000).
+
+    file_format : str, opcional
+        'csv' ou 'parquet' (padrão: inferido pela extensão do arquivo).
+
+    Retorno:
+    --------
+    StreamingContingencyTables
+        Tabelas acumuladas de todo o arquivo.
+
+    Erros:
+    -------
+    ValueError
+        É levantado se o formato do arquivo não for suportado.
+    """
+    file_format = file_format or path.rsplit('.', 1)[-1].lower()
+    columns = None if variables is None else [target] + list(variables)
+    tables = StreamingContingencyTables(target, variables)
+
+    if file_format == 'csv':
+        for chunk in pd.read_csv(path, chunksize= chunk_size, usecols= columns):
+            tables.update(chunk)
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size= chunk_size, columns= columns):
+            tables.update(record_batch.to_pandas())
+    else:
+        raise ValueError(f"Unsupported file format: '{file_format}'")
+
+    return tables
@@ -1,3 +1,5 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
@@ -122,7 +124,7 @@ def descriptive_statistics_continuous_variables(continuous_vars_df):
     return stats_df
 
 
-def treat_outliers_by_percentile_capping(continuous_vars_df, target_vars, percentile_inf_value= 0, percentile_sup_value= 99.5):
+def treat_outliers_by_percentile_capping(continuous_vars_df, target_vars, percentile_inf_value= 0, percentile_sup_value= 99.5, n_jobs= 1):
     """
     Trata outliers em variáveis contínuas por meio de capping percentual.
 
@@ -135,23 +137,280 @@ def treat_outliers_by_percentile_capping(continuous_vars_df, target_vars, percen
         Lista de nomes das variáveis contínuas que serão tratadas.
 
     percentile_inf_value : float, opcional
-        Percentil inferior para o capping (padrão é 0.5).
+        Percentil inferior para o capping (padrão é 0).
 
     percentile_sup_value : float, opcional
         Percentil superior para o capping (padrão é 99.5).
 
+    n_jobs : int, opcional
+        Número de threads entre as quais as variáveis são divididas (padrão é 1).
+
     Retorno:
     --------
     None
         O DataFrame de entrada é modificado in-place.
+
+    Notas:
+    ------
+    Para reaplicar os mesmos limites em outros dados (ex.: na API do modelo), use o `PercentileCapper`.
     """
-    for var in target_vars:
-        # Calcula os percentis inferior e superior
-        percentile_inf = np.percentile(continuous_vars_df[var], percentile_inf_value)
-        percentile_sup = np.percentile(continuous_vars_df[var], percentile_sup_value)
-        median = continuous_vars_df[var].median()
-
-        # Substitui valores fora dos percentis por mediana
-        continuous_vars_df[var] = continuous_vars_df[var].apply(lambda x: median if (x < percentile_inf) or (x > percentile_sup) else x)
+    capper = PercentileCapper(percentile_inf_value=percentile_inf_value, percentile_sup_value=percentile_sup_value,
+                              n_jobs=n_jobs)
+    capper.fit(continuous_vars_df, target_vars).transform(continuous_vars_df, inplace=True)
     
-    return None
\ No newline at end of file
+    return None
+
+
+class PercentileCapper:
+    """
+    Transformador de capping percentual: no `fit`, calcula os percentis inferior e superior e a mediana de cada
+    variável; no `transform`, substitui os valores fora dos percentis pela mediana da variável.
+
+    Os percentis de todas as variáveis são calculados de uma vez sobre a matriz das variáveis, e a substituição
+    usa máscaras booleanas sobre os arrays, sem chamadas Python por elemento. Com `n_jobs > 1`, as variáveis são
+    divididas entre threads (as operações do NumPy liberam o GIL). Os limites ajustados podem ser salvos em JSON
+    e reaplicados em outros dados, como na API do modelo (`OUTLIER_CAPPING_PATH`).
+
+    Parâmetros:
+    -----------
+    percentile_inf_value : float, opcional
+        Percentil inferior para o capping (padrão é 0).
+
+    percentile_sup_value : float, opcional
+        Percentil superior para o capping (padrão é 99.5).
+
+    n_jobs : int, opcional
+        Número de threads entre as quais as variáveis são divididas (padrão é 1).
+
+    Exemplos de uso:
+    ----------------
+    >>> capper = PercentileCapper(percentile_sup_value=99.5).fit(df_train, ['GrLivArea', 'LotArea'])
+    >>> df_train = capper.transform(df_train)
+    >>> capper.save('outlier_capping.json')
+    """
+
+    def __init__(self, percentile_inf_value=0, percentile_sup_value=99.5, n_jobs=1):
+        self.percentile_inf_value = percentile_inf_value
+        self.percentile_sup_value = percentile_sup_value
+        self.n_jobs = n_jobs
+        self.bounds_ = None
+        self.limits_ = None
+
+    def _map_columns(self, func, columns):
+        # Aplica a função a grupos de variáveis, em paralelo quando n_jobs > 1, e concatena os resultados
+        column_groups = [list(group) for group in np.array_split(np.array(columns, dtype=object), max(self.n_jobs, 1))
+                         if len(group)]
+        if len(column_groups) <= 1:
+            return [func(columns)]
+        with ThreadPoolExecutor(max_workers=len(column_groups)) as executor:
+            return list(executor.map(func, column_groups))
+
+    def fit(self, continuous_vars_df, target_vars):
+        """
+        Calcula os limites do capping de cada variável.
+
+        Parâmetros:
+        -----------
+        continuous_vars_df : pd.DataFrame
+            DataFrame contendo as variáveis contínuas.
+
+        target_vars : list
+            Lista de nomes das variáveis contínuas que serão tratadas.
+
+        Retorno:
+        --------
+        PercentileCapper
+            O próprio transformador, com os limites em `bounds_` (DataFrame com as colunas 'lower', 'upper'
+            e 'median', indexado pelas variáveis).
+        """
+        def fit_columns(columns):
+            # Cópia com uma linha contígua por variável, reordenada in-place pelas seleções de percentis
+            values = np.ascontiguousarray(continuous_vars_df[columns].to_numpy(dtype=np.float64).T)
+            has_missing = np.isnan(values).any(axis=1)
+
+            # Percentis inferior e superior de todas as variáveis do grupo em uma única chamada
+            # (como no np.percentile por variável, uma variável com valores faltantes resulta em NaN)
+            percentiles = np.percentile(values, [self.percentile_inf_value, self.percentile_sup_value], axis=1,
+                                        overwrite_input=True)
+            medians = np.median(values, axis=1, overwrite_input=True)
+            # A mediana do pandas ignora os valores faltantes
+            if has_missing.any():
+                missing_columns = [var for var, missing in zip(columns, has_missing) if missing]
+                medians[has_missing] = continuous_vars_df[missing_columns].median().to_numpy()
+            return pd.DataFrame({'lower': percentiles[0], 'upper': percentiles[1], 'median': medians}, index=columns)
+
+        self._set_bounds(pd.concat(self._map_columns(fit_columns, list(target_vars))))
+        return self
+
+    def _set_bounds(self, bounds):
+        # Limites em DataFrame (`bounds_`) e em dicionário (`limits_`), para a consulta por variável sem o pandas
+        self.bounds_ = bounds
+        self.limits_ = {var: tuple(limits) for var, limits in zip(bounds.index, bounds[['lower', 'upper', 'median']]
+                                                                  .to_numpy(dtype=np.float64).tolist())}
+
+    def cap_values(self, var, values):
+        """
+        Substitui os valores de uma variável fora dos limites ajustados pela mediana da variável.
+
+        Parâmetros:
+        -----------
+        var : str
+            Nome da variável ajustada no `fit`.
+
+        values : np.ndarray
+            Valores da variável.
+
+        Retorno:
+        --------
+        np.ndarray
+            Valores tratados, ou o próprio array de entrada se nenhum valor estiver fora dos limites.
+        """
+        lower, upper, median = self.limits_[var]
+        outliers = (values < lower) | (values > upper)
+        if outliers.any():
+            return np.where(outliers, median, values)
+        return values
+
+    def cap_array(self, array, columns):
+        """
+        Aplica o capping, in-place, a uma matriz com uma coluna por variável (ex.: o bloco de variáveis numéricas
+        codificado pela API do modelo).
+
+        Parâmetros:
+        -----------
+        array : np.ndarray
+            Matriz float64 de formato (n_linhas, len(columns)), modificada in-place.
+
+        columns : list
+            Nome da variável de cada coluna da matriz; as variáveis não ajustadas são mantidas.
+
+        Retorno:
+        --------
+        None
+        """
+        if self.limits_ is None:
+            raise ValueError("PercentileCapper must be fitted before cap_array")
+
+        for i, var in enumerate(columns):
+            if var in self.limits_:
+                array[:, i] = self.cap_values(var, array[:, i])
+
+        return None
+
+    def transform(self, continuous_vars_df, inplace=False):
+        """
+        Substitui os valores fora dos limites ajustados pela mediana de cada variável.
+
+        Parâmetros:
+        -----------
+        continuous_vars_df : pd.DataFrame
+            DataFrame contendo as variáveis ajustadas no `fit`.
+
+        inplace : bool, opcional
+            Se True, modifica o DataFrame de entrada; caso contrário, trata uma cópia (padrão é False).
+
+        Retorno:
+        --------
+        pd.DataFrame
+            DataFrame com os outliers tratados.
+
+        Erros:
+        -------
+        ValueError
+            É levantado se o transformador ainda não foi ajustado.
+        """
+        if self.bounds_ is None:
+            raise ValueError("PercentileCapper must be fitted before transform")
+
+        df = continuous_vars_df if inplace else continuous_vars_df.copy()
+
+        def cap_columns(columns):
+            capped = {}
+            for var in columns:
+                values = df[var].to_numpy()
+                capped_values = self.cap_values(var, values)
+                if capped_values is not values:
+                    capped[var] = capped_values
+            return capped
+
+        # As variáveis tratadas são calculadas em paralelo e atribuídas ao DataFrame depois, em sequência
+        for capped in self._map_columns(cap_columns, list(self.bounds_.index)):
+            for var, values in capped.items():
+                df[var] = values
+
+        return df
+
+    def fit_transform(self, continuous_vars_df, target_vars, inplace=False):
+        """
+        Ajusta os limites e trata os outliers do mesmo DataFrame.
+
+        Parâmetros:
+        -----------
+        continuous_vars_df : pd.DataFrame
+            DataFrame contendo as variáveis contínuas.
+
+        target_vars : list
+            Lista de nomes das variáveis contínuas que serão tratadas.
+
+        inplace : bool, opcional
+            Se True, modifica o DataFrame de entrada (padrão é False).
+
+        Retorno:
+        --------
+        pd.DataFrame
+            DataFrame com os outliers tratados.
+        """
+        return self.fit(continuous_vars_df, target_vars).transform(continuous_vars_df, inplace=inplace)
+
+    def save(self, path):
+        """
+        Salva os limites ajustados em JSON, no formato lido pela API do modelo (`OUTLIER_CAPPING_PATH`).
+
+        Parâmetros:
+        -----------
+        path : str
+            Caminho do arquivo JSON.
+
+        Retorno:
+        --------
+        None
+        """
+        if self.bounds_ is None:
+            raise ValueError("PercentileCapper must be fitted before save")
+
+        # Limites NaN (variáveis com valores faltantes no fit) nunca tratam valores e são salvos como null
+        bounds = {var: {key: (None if pd.isna(value) else float(value)) for key, value in row.items()}
+                  for var, row in self.bounds_.iterrows()}
+        with open(path, 'w') as file:
+            json.dump({'percentile_inf_value': self.percentile_inf_value,
+                       'percentile_sup_value': self.percentile_sup_value,
+                       'columns': bounds}, file, indent=2)
+
+        return None
+
+    @classmethod
+    def load(cls, path, n_jobs=1):
+        """
+        Carrega os limites salvos por `save`.
+
+        Parâmetros:
+        -----------
+        path : str
+            Caminho do arquivo JSON.
+
+        n_jobs : int, opcional
+            Número de threads usadas no `transform` (padrão é 1).
+
+        Retorno:
+        --------
+        PercentileCapper
+            Transformador ajustado com os limites do arquivo.
+        """
+        with open(path) as file:
+            spec = json.load(file)
+
+        capper = cls(percentile_inf_value=spec['percentile_inf_value'],
+                     percentile_sup_value=spec['percentile_sup_value'], n_jobs=n_jobs)
+        capper._set_bounds(pd.DataFrame.from_dict(spec['columns'], orient='index', dtype=np.float64
+                                                  )[['lower', 'upper', 'median']])
+        return capper
@@ -6,6 +6,13 @@ import scipy.stats as sts
 import matplotlib.colors as mcolors
 from matplotlib import cm
 import random
+from .figure_rendering import render_figures
+from .metrics_functions import continuous_variables_metrics
+from .aggregation_functions import box_statistics, scatter_histogram, stratified_sample
+from .contingency_tables import StreamingContingencyTables
+from .association_functions import (_comparison_test_by_groups, _encode_qualitative_variable, _split_groups_by_index,
+                                    qualitative_vars_pvalues_matrix, quantitative_qualitative_vars_pvalues_matrix,
+                                    target_correlations)
 
 def _n_bins(numeric_variable):
     n = numeric_variable.shape[0]
@@ -64,136 +71,126 @@ def _comparison_test_for_ordinal_or_quantitative_vars(qualitative_var, quant_var
     >>> p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_var, numeric_ordinal_var=numeric_ordinal_var)
     """
 
-    if (quant_var is not None) & (numeric_ordinal_var is None):
-        # Padroniza a variável quantitativa
-        standardized_variable = sts.zscore(quant_var)
-        
-        # Verifica normalidade para a variável quantitativa (univariada)
-        if len(quant_var) <= 50:
-            _, p_value = sts.shapiro(standardized_variable)
-        else:
-            _, p_value = sts.kstest(standardized_variable, 'norm')
-        
-        is_normal = p_value > 0.05
-        
-        # Se a variável quantiativa não for normal na análise univariada, usar testes não paramétricos
-        if is_normal:
-            # Verifica normalidade da variável contínua por grupo da variável qualitativa (bivariada)
-            group_normality_results = {}
-            for category in qualitative_var.unique():
-                group_data = standardized_variable[qualitative_var == category]
-                if len(group_data) <= 50:
-                    _, p_value = sts.shapiro(group_data)
-                else:
-                    _, p_value = sts.kstest(group_data, 'norm')
-
-                group_normality_results[category] = p_value > 0.05
-            
-            # Escolha do teste estatístico baseado na normalidade dos grupos
-            if all(group_normality_results.values()):
-                # Caso todos os grupos possuam distribuições normais, utiliza testes paramétricos
-                if qualitative_var.nunique() == 2:
-                    _, p_value = sts.ttest_ind(*[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                    test_name = 'T-Test'
-                else:
-                    _, p_value = sts.f_oneway(*[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                    test_name = 'ANOVA Test'
-            else:
-                # Caso algum dos grupos não seja normal, utiliza testes não paramétricos
-                if qualitative_var.nunique() == 2:
-                    _, p_value = sts.mannwhitneyu(*[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                    test_name = 'Mann Whitney U Test'
-                else:
-                    _, p_value = sts.kruskal( *[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                    test_name = 'Kruskal-Wallis Test'
-        else:
-            # Caso algum dos grupos não seja normal, utiliza testes não paramétricos
-            if qualitative_var.nunique() == 2:
-                _, p_value = sts.mannwhitneyu(*[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                test_name = 'Mann Whitney U Test'
-            else:
-                _, p_value = sts.kruskal(*[quant_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-                test_name = 'Kruskal-Wallis Test'
-
-        return p_value, test_name
-    elif (quant_var is None) & (numeric_ordinal_var is not None):
-        if qualitative_var.nunique() == 2:
-            _, p_value = sts.mannwhitneyu(*[numeric_ordinal_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-            test_name = 'Mann Whitney U Test'
-        elif (qualitative_var.nunique() < 2) | (len(np.unique(numeric_ordinal_var)) < 2):
-            p_value = float(1)
-            test_name = None
-
-            return p_value, test_name
-        else:
-            _, p_value = sts.kruskal(*[numeric_ordinal_var[qualitative_var == cat] for cat in qualitative_var.unique()])
-            test_name = 'Kruskal-Wallis Test'
-        return p_value, test_name
-    else:
-        raise AttributeError("Passe pelo menos e apenas uma variavel numérica, ou 'quant_var' ou 'numeric_ordinal_var'")
+    numeric_vars = [var for var in (quant_var, numeric_ordinal_var) if var is not None]
+    if all(not isinstance(var, pd.Series) or var.index.equals(qualitative_var.index) for var in numeric_vars):
+        # Índice dos grupos construído uma única vez: os grupos são fatias dos valores ordenados por categoria
+        encoded_var = _encode_qualitative_variable(qualitative_var)
+        return _comparison_test_by_groups(_split_groups_by_index(encoded_var), encoded_var['n_categories'],
+                                          quant_var= None if quant_var is None else np.asarray(quant_var),
+                                          numeric_ordinal_var= None if numeric_ordinal_var is None else np.asarray(numeric_ordinal_var))
+
+    # Com índices diferentes, os grupos são selecionados por máscara, com o alinhamento do pandas
+    categories = qualitative_var.unique()
+    split_groups = lambda values: [values[qualitative_var == category] for category in categories]
+
+    return _comparison_test_by_groups(split_groups, qualitative_var.nunique(), quant_var= quant_var,
+                                      numeric_ordinal_var= numeric_ordinal_var)
 
 
+def _is_large_data(variable, large_data_threshold):
+    # Modo para grandes volumes: ativado quando o número de observações excede o limite informado
+    return large_data_threshold is not None and len(variable) > large_data_threshold
 
-def _calculate_continuous_variable_metrics(numeric_variable):
+
+def _draw_box_statistics(ax, box_stats, palette= None, vert= True, flierprops= None):
     """
-    Calcula várias métricas descritivas para uma variável contínua.
+    Desenha boxplots a partir das estatísticas pré-calculadas (ver `box_statistics`), com custo independente do
+    número de observações.
 
     Parâmetros:
-    ----------
-    numeric_variable : pd.Series
-        Uma série do Pandas contendo valores numéricos contínuos.
+    -----------
+    ax : matplotlib.axes.Axes
+        Área de plotagem.
 
-    Retorno:
-    -------
-    metrics_dict : dict
-        Um dicionário contendo as seguintes métricas:
-        - 'minimum': valor mínimo
-        - 'maximum': valor máximo
-        - 'mean': valor médio
-        - 'median': valor mediano
-        - 'mode': valor modal (se houver mais de um, retorna o menor)
-        - 'first_quartile': primeiro quartil (25º percentil)
-        - 'third_quartile': terceiro quartil (75º percentil)
-        - 'lower_fence': limite inferior para detecção de outliers
-        - 'upper_fence': limite superior para detecção de outliers
+    box_stats : list
+        Estatísticas de cada boxplot, na ordem das categorias.
+
+    palette : list, opcional
+        Cores das caixas. Se None (padrão), reproduz o estilo do `Axes.boxplot` (caixas sem preenchimento nas
+        posições 1, 2, ...); caso contrário, o estilo do `sns.boxplot` (caixas preenchidas nas posições 0, 1, ...,
+        com os nomes das categorias nos eixos).
+
+    vert : bool, opcional
+        Se True (padrão), as caixas são verticais.
+
+    flierprops : dict, opcional
+        Propriedades dos marcadores dos outliers.
     """
-    # Calcula valor mínimo e máximo
-    minimum_value = numeric_variable.min()
-    maximum_value = numeric_variable.max()
-
-    # Calcula medidas de posição
-    mean_value = numeric_variable.mean()
-    median_value = numeric_variable.median()
-    mode_value = numeric_variable.mode().min()  # Retorna o menor valor em caso de múltiplos modos
-
-    # Calcula quartis
-    first_quartile_value = numeric_variable.quantile(0.25)
-    third_quartile_value = numeric_variable.quantile(0.75)
-    
-    # Calcula intervalo interquartil
-    interquartile_range = third_quartile_value - first_quartile_value
-    
-    # Calcula "fences" para detecção de outliers
-    lower_fence_value = max(first_quartile_value - (1.5 * interquartile_range), minimum_value)
-    upper_fence_value = min(third_quartile_value + (1.5 * interquartile_range), maximum_value)
-    
-    # Compila todas as métricas em um dicionário
-    metrics_dict = {
-        'minimum': minimum_value,
-        'maximum': maximum_value,
-        'mean': mean_value,
-        'median': median_value,
-        'mode': mode_value,
-        'first_quartile': first_quartile_value,
-        'third_quartile': third_quartile_value,
-        'lower_fence': lower_fence_value,
-        'upper_fence': upper_fence_value
-    }
-    
-    return metrics_dict
+    if palette is None:
+        ax.bxp(box_stats, positions= np.arange(1, len(box_stats) + 1), vert= vert, flierprops= flierprops)
+        return
+
+    # Grupos sem observações não são desenhados, mas mantêm a sua posição, como no seaborn
+    positions = np.arange(len(box_stats))
+    non_empty = [i for i, stats in enumerate(box_stats) if not np.isnan(stats['med'])]
+    line_props = dict(color= '#3f3f3f')
+    artists = ax.bxp([box_stats[i] for i in non_empty], positions= positions[non_empty], vert= vert, widths= 0.8,
+                     capwidths= 0.4, patch_artist= True, manage_ticks= False, boxprops= dict(edgecolor= '#3f3f3f'),
+                     medianprops= line_props, whiskerprops= line_props, capprops= line_props,
+                     flierprops= {**dict(markersize= 5, markeredgecolor= '#3f3f3f'), **(flierprops or dict())})
+    for i, box in zip(non_empty, artists['boxes']):
+        box.set_facecolor(palette[i % len(palette)])
+
+    labels = [str(stats['label']) for stats in box_stats]
+    if vert:
+        ax.set_xticks(positions, labels)
+        ax.set_xlim(-0.5, len(box_stats) - 0.5)
+    else:
+        # Categorias de cima para baixo, como no seaborn
+        ax.set_yticks(positions, labels)
+        ax.set_ylim(len(box_stats) - 0.5, -0.5)
+
+
+def _continuous_variable_distribution_figure(variable, var_name, metrics_dict, large_data_threshold= None):
+    """Constrói e retorna a figura de distribuição (histograma e boxplot) de uma variável contínua."""
+    # Chama n_bins para definir a quantidade de intervalos nas distribuições
+    bins = _n_bins(variable)
 
+    # Cria figura com duas área de plotagem
+    fig, axes = plt.subplots(2, 1, figsize= (16, 4.5), gridspec_kw= {'height_ratios': [2.5, 1]})
 
-def plot_continuous_variables_distributions(continuous_numeric_vars_df):
+    # Cria histograma com linhas representando as métricas
+    axes[0].hist(variable, color= '#34673e', edgecolor= 'black', bins= bins)
+
+    # Cria boxplot e adiciona customizações (em grandes volumes, a partir das estatísticas pré-calculadas)
+    if _is_large_data(variable, large_data_threshold):
+        _draw_box_statistics(axes[1], box_statistics(variable), vert= False)
+    else:
+        axes[1].boxplot(variable, vert= False)
+
+    # Adiciona customizações aos gáficos
+    ## Adiciona título a figura
+    fig.suptitle(f"Distribution ({var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adiciona linhas verticais para cada métrica no histograma
+    axes[0].axvline(x=metrics_dict['minimum'], color='black', linestyle='dashed', linewidth=2, label=f"Minimum: {metrics_dict['minimum']:.1f}")
+    axes[0].axvline(x=metrics_dict['lower_fence'], color='gray', linestyle='dashed', linewidth=2, label=f"Lower Fence: {metrics_dict['lower_fence']:.1f}")
+    axes[0].axvline(x=metrics_dict['mean'], color='cyan', linestyle='dashed', linewidth=2, label=f"Mean: {metrics_dict['mean']:.1f}")
+    axes[0].axvline(x=metrics_dict['median'], color='red', linestyle='dashed', linewidth=2, label=f"Median: {metrics_dict['median']:.1f}")
+    axes[0].axvline(x=metrics_dict['mode'], color='yellow', linestyle='dashed', linewidth=2, label=f"Mode: {metrics_dict['mode']:.1f}")
+    axes[0].axvline(x=metrics_dict['upper_fence'], color='gray', linestyle='dashed', linewidth=2, label=f"Upper Fence: {metrics_dict['upper_fence']:.1f}")
+    axes[0].axvline(x=metrics_dict['maximum'], color='black', linestyle='dashed', linewidth=2, label=f"Maximum: {metrics_dict['maximum']:.1f}")
+    ## Adiciona legendas ao histograma
+    axes[0].legend(loc='upper right', fontsize= 'x-small', fancybox= True, framealpha= 0.9, shadow= True, borderpad= 1)
+    ## Adiciona e customiza grades
+    axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5)
+    axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'x')
+    axes[0].set_axisbelow(True) # A grade fica atrás das barras
+    axes[1].set_axisbelow(True)
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    axes[0].set_ylabel('Absolute Frequencies (count)')
+    axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    axes[0].tick_params(axis='y', labelsize= 9, labelrotation=0)
+    axes[1].yaxis.set_ticks([])
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    axes[1].set_xlabel(var_name)  
+    axes[1].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
+
+    return fig
+
+
+def plot_continuous_variables_distributions(continuous_numeric_vars_df, output_dir= None, file_format= 'png', n_jobs= 1, cache_dir= None, large_data_threshold= None):
     """
     Plota a distribuição de variáveis contínuas em um DataFrame utilizando histogramas e boxplots.
 
@@ -202,67 +199,74 @@ def plot_continuous_variables_distributions(continuous_numeric_vars_df):
     continuous_numeric_variables_dataframe : pd.DataFrame
         Um DataFrame do Pandas contendo variáveis numéricas contínuas.
 
-    Retorno:
-    --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
-    """
-    list_continuous_variables = list(continuous_numeric_vars_df.columns)
-    
-    for var_name in list_continuous_variables:
-        variable = continuous_numeric_vars_df[var_name]
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
 
-        # Chama n_bins para definir a quantidade de intervalos nas distribuições
-        bins = _n_bins(variable)
-        
-        # Calcula as métricas da variável
-        metrics_dict = _calculate_continuous_variable_metrics(variable)
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
 
-        # Cria figura com duas área de plotagem
-        fig, axes = plt.subplots(2, 1, figsize= (16, 4.5), gridspec_kw= {'height_ratios': [2.5, 1]})
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
 
-        # Cria histograma com linhas representando as métricas
-        axes[0].hist(variable, color= '#34673e', edgecolor= 'black', bins= bins)
+    cache_dir : str, opcional
+        Diretório do cache em disco das métricas das variáveis (ver `continuous_variables_metrics`). Se None (padrão),
+        as métricas são sempre calculadas.
 
-        # Cria boxplot e adiciona customizações
-        axes[1].boxplot(variable, vert= False)
+    large_data_threshold : int, opcional
+        Número de observações acima do qual o boxplot é desenhado a partir de estatísticas pré-calculadas (quartis,
+        bigodes e uma amostra limitada dos outliers; ver `box_statistics`), com custo de renderização
+        independente do número de observações. Se None (padrão), todas as observações são passadas aos gráficos.
 
-        # Adiciona customizações aos gáficos
-        ## Adiciona título a figura
-        fig.suptitle(f"Distribution ({var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adiciona linhas verticais para cada métrica no histograma
-        axes[0].axvline(x=metrics_dict['minimum'], color='black', linestyle='dashed', linewidth=2, label=f"Minimum: {metrics_dict['minimum']:.1f}")
-        axes[0].axvline(x=metrics_dict['lower_fence'], color='gray', linestyle='dashed', linewidth=2, label=f"Lower Fence: {metrics_dict['lower_fence']:.1f}")
-        axes[0].axvline(x=metrics_dict['mean'], color='cyan', linestyle='dashed', linewidth=2, label=f"Mean: {metrics_dict['mean']:.1f}")
-        axes[0].axvline(x=metrics_dict['median'], color='red', linestyle='dashed', linewidth=2, label=f"Median: {metrics_dict['median']:.1f}")
-        axes[0].axvline(x=metrics_dict['mode'], color='yellow', linestyle='dashed', linewidth=2, label=f"Mode: {metrics_dict['mode']:.1f}")
-        axes[0].axvline(x=metrics_dict['upper_fence'], color='gray', linestyle='dashed', linewidth=2, label=f"Upper Fence: {metrics_dict['upper_fence']:.1f}")
-        axes[0].axvline(x=metrics_dict['maximum'], color='black', linestyle='dashed', linewidth=2, label=f"Maximum: {metrics_dict['maximum']:.1f}")
-        ## Adiciona legendas ao histograma
-        axes[0].legend(loc='upper right', fontsize= 'x-small', fancybox= True, framealpha= 0.9, shadow= True, borderpad= 1)
-        ## Adiciona e customiza grades
-        axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5)
-        axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'x')
-        axes[0].set_axisbelow(True) # A grade fica atrás das barras
-        axes[1].set_axisbelow(True)
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        axes[0].set_ylabel('Absolute Frequencies (count)')
-        axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        axes[0].tick_params(axis='y', labelsize= 9, labelrotation=0)
-        axes[1].yaxis.set_ticks([])
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        axes[1].set_xlabel(var_name)  
-        axes[1].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
-        
-        # Exibe o gráfico
-        plt.show()
+    Retorno:
+    --------
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
+    """
+    # Calcula (ou lê do cache) as métricas de todas as variáveis de uma só vez
+    metrics_df = continuous_variables_metrics(continuous_numeric_vars_df, cache_dir= cache_dir)
 
-    return None
+    figure_tasks = [(f"continuous_distribution_{var_name}",
+                     (continuous_numeric_vars_df[var_name], var_name, metrics_df.loc[var_name].to_dict(), large_data_threshold))
+                    for var_name in continuous_numeric_vars_df.columns]
 
+    return render_figures(_continuous_variable_distribution_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-def plot_discrete_variables_distributions(discrete_numeric_vars_df):
+
+def _discrete_variable_distribution_figure(variable, var_name):
+    """Constrói e retorna a figura de frequências (countplot) de uma variável discreta."""
+    n_unique_values = variable.nunique()
+
+    # Cria figura com uma área de plotagem
+    fig, ax = plt.subplots(1, 1, figsize= (16, 4.5))
+
+    # Cria do countplot
+    sns.countplot(x= variable, edgecolor= 'black', color= '#34673e', ax= ax)
+
+    # Adiciona customizações ao gráfico
+    fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adiciona e customiza grades da horizontal
+    ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    ax.set_axisbelow(True) # A grade fica atrás das barras
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    ax.set_ylabel('Absolute Frequencies (count)')
+    ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    ax.set_xlabel(var_name)  
+    ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    ax.xaxis.label.set_size(10)
+    ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
+    # Rotaciona os rótulos no eixo x se houver mais de 12 categorias
+    if variable.value_counts().shape[0] > 12:
+        ax.tick_params(axis= 'x', labelrotation= 90)
+
+    return fig
+
+
+def plot_discrete_variables_distributions(discrete_numeric_vars_df, output_dir= None, file_format= 'png', n_jobs= 1):
     """
     Plota a distribuição de variáveis discretas em um DataFrame utilizando gráficos de barras.
 
@@ -271,50 +275,65 @@ def plot_discrete_variables_distributions(discrete_numeric_vars_df):
     discrete_numeric_vars_df : pd.DataFrame
         Um DataFrame do Pandas contendo variáveis numéricas discretas.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
-    # Lista de variáveis discretas
-    list_discrete_vars = list(discrete_numeric_vars_df.columns)
-    
-    for var_name in list_discrete_vars:
-        variable = discrete_numeric_vars_df[var_name]
-        n_unique_values = variable.nunique()
+    figure_tasks = [(f"discrete_distribution_{var_name}", (discrete_numeric_vars_df[var_name], var_name))
+                    for var_name in discrete_numeric_vars_df.columns]
 
-        # Cria figura com uma área de plotagem
-        fig, ax = plt.subplots(1, 1, figsize= (16, 4.5))
+    return render_figures(_discrete_variable_distribution_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-        # Cria do countplot
-        sns.countplot(x= variable, edgecolor= 'black', color= '#34673e', ax= ax)
 
-        # Adiciona customizações ao gráfico
-        fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adiciona e customiza grades da horizontal
-        ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-        ax.set_axisbelow(True) # A grade fica atrás das barras
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        ax.set_ylabel('Absolute Frequencies (count)')
-        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        ax.set_xlabel(var_name)  
-        ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        ax.xaxis.label.set_size(10)
-        ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
-        # Rotaciona os rótulos no eixo x se houver mais de 12 categorias
-        if variable.value_counts().shape[0] > 12:
-            ax.tick_params(axis= 'x', labelrotation= 90)
-            
-        # Exibe o gráfico
-        plt.show()
+def _nominal_variable_distribution_figure(nominal_var_df, var_name):
+    """Constrói e retorna a figura de frequências (countplot) de uma variável nominal."""
+    n_unique_values = nominal_var_df[var_name].nunique()
 
-    return None
-
-
-def plot_nominal_variables_distributions(nominal_categorical_vars_df):
+    # Cria figura com uma área de plotagem
+    fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
+
+    # Define a paleta de cores e a embaralhas
+    palette = sns.color_palette('cubehelix', n_unique_values)
+    random.shuffle(palette)
+
+    # Criação do countplot
+    sns.countplot(data= nominal_var_df, x= var_name, edgecolor='black', hue= var_name, palette= palette, legend= False, ax=ax)
+
+    # Adiciona customizações ao gráfico
+    fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adiciona e customiza grades da horizontal
+    ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    ax.set_axisbelow(True) # A grade fica atrás das barras
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    ax.set_ylabel('Absolute Frequencies (count)')
+    ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    ax.set_xlabel(var_name)  
+    ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    ax.xaxis.label.set_size(10)
+    ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
+
+    if len(nominal_var_df[var_name].unique()) > 12:
+        ax.tick_params(axis='x', labelsize= 9, labelrotation= 50)
+
+    return fig
+
+
+def plot_nominal_variables_distributions(nominal_categorical_vars_df, output_dir= None, file_format= 'png', n_jobs= 1):
     """
     Plota a distribuição de variáveis categóricas nominais em um DataFrame utilizando gráficos de contagem.
 
@@ -323,53 +342,56 @@ def plot_nominal_variables_distributions(nominal_categorical_vars_df):
     nominal_categorical_vars_df : pd.DataFrame
         Um DataFrame do Pandas contendo variáveis categóricas nominais.
 
-    Retorno:
-    --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
-    """
-    # Lista de variáveis nominais
-    list_nominal_vars = list(nominal_categorical_vars_df.columns)
-    
-    for var_name in list_nominal_vars:
-        n_unique_values = nominal_categorical_vars_df[var_name].nunique()
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
 
-        # Cria figura com uma área de plotagem
-        fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
 
-        # Define a paleta de cores e a embaralhas
-        palette = sns.color_palette('cubehelix', n_unique_values)
-        random.shuffle(palette)
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
 
-        # Criação do countplot
-        sns.countplot(data= nominal_categorical_vars_df, x= var_name, edgecolor='black', hue= var_name, palette= palette, legend= False, ax=ax)
-        
-        # Adiciona customizações ao gráfico
-        fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adiciona e customiza grades da horizontal
-        ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-        ax.set_axisbelow(True) # A grade fica atrás das barras
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        ax.set_ylabel('Absolute Frequencies (count)')
-        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        ax.set_xlabel(var_name)  
-        ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        ax.xaxis.label.set_size(10)
-        ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
-
-        if len(nominal_categorical_vars_df[var_name].unique()) > 12:
-            ax.tick_params(axis='x', labelsize= 9, labelrotation= 50)
-        
-        # Exibe o gráfico
-        plt.show()
+    Retorno:
+    --------
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
+    """
+    figure_tasks = [(f"nominal_distribution_{var_name}", (nominal_categorical_vars_df[[var_name]], var_name))
+                    for var_name in nominal_categorical_vars_df.columns]
 
-    return None
+    return render_figures(_nominal_variable_distribution_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
 
-def plot_ordinal_variables_distributions(ordinal_categorical_vars_df, dict_ordinal_vars):
+def _ordinal_variable_distribution_figure(ordinal_var_df, var_name, order):
+    """Constrói e retorna a figura de frequências (countplot) de uma variável ordinal, na ordem das categorias."""
+    # Cria figura com uma área de plotagem
+    fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
+
+    # Cria countplot com as categorias na ordem correta
+    sns.countplot(data= ordinal_var_df, x= var_name, order= order, edgecolor='black', hue= var_name, palette= 'cubehelix', legend= False, ax=ax)
+
+    # Adiciona customizações ao gráfico
+    fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adiciona e customiza grades da horizontal
+    ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    ax.set_axisbelow(True) # A grade fica atrás das barras
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    ax.set_ylabel('Absolute Frequencies (count)')
+    ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    ax.set_xlabel(var_name)  
+    ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    ax.xaxis.label.set_size(10)
+    ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
+
+    return fig
+
+
+def plot_ordinal_variables_distributions(ordinal_categorical_vars_df, dict_ordinal_vars, output_dir= None, file_format= 'png', n_jobs= 1):
     """
     Plota a distribuição de variáveis categóricas ordinais em um DataFrame utilizando gráficos de contagem.
 
@@ -381,47 +403,131 @@ def plot_ordinal_variables_distributions(ordinal_categorical_vars_df, dict_ordin
     dict_ordinal_vars : dict
         Um dicionário onde as chaves são os nomes das variáveis ordinais e os valores são listas que definem a ordem das categorias.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
-    # Lista de variáveis ordinais a partir das chaves do dicionário
-    list_ordinal_vars = list(dict_ordinal_vars.keys())
-    
-    for var_name in list_ordinal_vars:
-        # Cria figura com uma área de plotagem
-        fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
-        
-        # Obtendo a ordem das categorias associada à variável no dicionário
-        order = dict_ordinal_vars.get(var_name)
+    # Variáveis ordinais a partir das chaves do dicionário, com a ordem das categorias de cada uma
+    figure_tasks = [(f"ordinal_distribution_{var_name}", (ordinal_categorical_vars_df[[var_name]], var_name, order))
+                    for var_name, order in dict_ordinal_vars.items()]
 
-        # Cria countplot com as categorias na ordem correta
-        sns.countplot(data= ordinal_categorical_vars_df, x= var_name, order= order, edgecolor='black', hue= var_name, palette= 'cubehelix', legend= False, ax=ax)
+    return render_figures(_ordinal_variable_distribution_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-        # Adiciona customizações ao gráfico
-        fig.suptitle(f"Frequencies ({var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adiciona e customiza grades da horizontal
-        ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-        ax.set_axisbelow(True) # A grade fica atrás das barras
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        ax.set_ylabel('Absolute Frequencies (count)')
-        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        ax.set_xlabel(var_name)  
-        ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        ax.xaxis.label.set_size(10)
-        ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
-            
-        # Exibe o gráfico    
-        plt.show()
-        
-    return None
- 
-    
-def plot_bivariate_analysis_quantitative_variables(numeric_independent_vars_df, numeric_target_var_df, list_discrete_var_names):
+
+def _large_data_scatter(ax, independent_var, target_var, large_data_scatter):
+    """Desenha a dispersão de um par de variáveis a partir do histograma 2D ou de uma amostra estratificada."""
+    if large_data_scatter == 'histogram':
+        counts, x_edges, y_edges = scatter_histogram(independent_var, target_var)
+
+        # Células vazias transparentes e escala logarítmica das contagens, para que as regiões esparsas continuem visíveis
+        greys = cm.get_cmap('Greys', 256)
+        new_greys = mcolors.LinearSegmentedColormap.from_list('greys_30_100', greys(np.linspace(0.30, 1.00, 256)))
+        mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), cmap= new_greys,
+                             norm= mcolors.LogNorm(vmin= 1, vmax= max(counts.max(), 1)))
+        ax.figure.colorbar(mesh, ax= ax, pad= 0.01).set_label('Count', fontsize= 9, fontstyle= 'italic')
+    else:
+        sample_positions = stratified_sample(independent_var, target_var)
+        ax.scatter(independent_var.to_numpy()[sample_positions], target_var.to_numpy()[sample_positions],
+                   color= "black", alpha= 0.5, s= 50)
+
+
+def _bivariate_quantitative_variables_figure(numeric_independent_var, numeric_target_var_df, spearman_correlation_value, value_independent_upper_fence, value_target_upper_fence, list_discrete_var_names, large_data_threshold= None, large_data_scatter= 'histogram'):
+    """Constrói e retorna a figura de correlação entre uma variável quantitativa independente e a variável-alvo."""
+    # Variáveis internas
+    numeric_independent_var_name = numeric_independent_var.name
+    numeric_target_var_name = numeric_target_var_df.columns[0]
+    large_data = _is_large_data(numeric_independent_var, large_data_threshold)
+    # Número de valores distintos (em grandes volumes, calculado apenas para as variáveis discretas: a dispersão não o usa)
+    if large_data and numeric_independent_var_name not in list_discrete_var_names:
+        n_unique_values_var = None
+    else:
+        n_unique_values_var = numeric_independent_var.nunique()
+    boxplot_by_group = numeric_independent_var_name in list_discrete_var_names and n_unique_values_var <= 12
+
+    # Correlação de Spearman entre variável independente e variável alvo, no formato do heatmap (alvo x independente)
+    spearman_correlation = pd.DataFrame([[spearman_correlation_value]], index= [numeric_target_var_name], columns= [numeric_independent_var_name])
+
+    # Cria figura com duas área de plotagem
+    fig, axes = plt.subplots(1, 2, figsize=(16, 4.5))
+
+    # Define a paleta de cores e a embaralha (em grandes volumes, apenas para os boxplots)
+    if boxplot_by_group or not large_data:
+        palette = sns.color_palette('cubehelix', n_unique_values_var)
+        random.shuffle(palette)
+
+    # Cria primeiro gráfico (em grandes volumes, a partir de agregados pré-calculados)
+    if boxplot_by_group:
+        if large_data:
+            independent_var, target_var = numeric_independent_var.align(numeric_target_var_df[numeric_target_var_name], join= 'inner')
+            _draw_box_statistics(axes[0], box_statistics(target_var, groups= independent_var), palette= palette)
+        else:
+            sns.boxplot(x= numeric_independent_var, y= numeric_target_var_df[numeric_target_var_name],
+                        orient= 'v', palette= palette, ax= axes[0])
+    else:
+        if large_data:
+            independent_var, target_var = numeric_independent_var.align(numeric_target_var_df[numeric_target_var_name], join= 'inner')
+            _large_data_scatter(axes[0], independent_var, target_var, large_data_scatter)
+        else:
+            dataframe_for_scatter = pd.merge(numeric_independent_var, numeric_target_var_df, right_index=True, left_index=True)
+            sns.scatterplot(data= dataframe_for_scatter, x= numeric_independent_var_name, 
+                            y= numeric_target_var_name, color= "black", alpha= 0.5, s= 50, ax= axes[0])
+        if numeric_independent_var_name not in list_discrete_var_names:
+            axes[0].axvline(x= value_independent_upper_fence, color= '#008080', linestyle= 'dashed', linewidth= 1, 
+                        label= f"Upper Fence ({numeric_independent_var_name}): {float(value_independent_upper_fence):.1f}")
+
+    # Cria segundo gráfico
+    icefire_r = cm.get_cmap('icefire_r', 256)
+    new_icefire_r = mcolors.LinearSegmentedColormap.from_list('icefire_r_10_90', icefire_r(np.linspace(0.10, 0.90, 256)))
+
+    sns.heatmap(spearman_correlation, annot=True, cmap= new_icefire_r, linewidths=1, linecolor='black', vmin=-1.01, vmax=1.01, ax= axes[1])
+
+    # Adiciona customizações aos subplots
+    fig.suptitle(f"Correlation Plot ({numeric_independent_var_name} x {numeric_target_var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adciona linha e legenda para cerca superior da variável alvo no primeiro subplot
+    axes[0].axhline(y=value_target_upper_fence, color='#483D8B', linestyle='dashed', linewidth=1, 
+                label=f"Upper Fence ({numeric_target_var_name}): {float(value_target_upper_fence):.1f}")
+    axes[0].legend(loc='upper right', fancybox=True, framealpha=1, shadow=True, borderpad=1)
+    ## Adiciona nome do teste de correlação no segundo subplot
+    axes[1].text(0.5, 0.95, 'Spearman Correlation', transform=axes[1].transAxes, fontsize=12, verticalalignment='top', 
+             horizontalalignment= 'center', bbox=dict(facecolor='white', alpha=0.5))
+    ## Adiciona e customiza grades no primeiro subplot
+    axes[0].grid(color="gray", linestyle="dotted", linewidth=0.5)
+    axes[0].set_axisbelow(True)
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    axes[0].set_ylabel(numeric_target_var_name)
+    axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    axes[0].tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
+    axes[1].yaxis.set_ticks([])
+    axes[1].set_ylabel(numeric_target_var_name)
+    axes[1].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    axes[1].yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    axes[0].set_xlabel(numeric_independent_var_name)
+    axes[0].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    axes[0].xaxis.label.set_size(10)
+    axes[0].tick_params(axis='x', labelsize= 9, labelrotation= 0)
+    axes[1].xaxis.set_ticks([])
+    axes[1].set_xlabel(numeric_independent_var_name)
+    axes[1].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    axes[1].xaxis.label.set_size(10)
+
+    return fig
+
+
+def plot_bivariate_analysis_quantitative_variables(numeric_independent_vars_df, numeric_target_var_df, list_discrete_var_names, output_dir= None, file_format= 'png', n_jobs= 1, cache_dir= None, large_data_threshold= None, large_data_scatter= 'histogram'):
     """
     Plota a análise bivariada entre variáveis quantitativas independentes e uma variável-alvo quantitativa.
 
@@ -436,92 +542,127 @@ def plot_bivariate_analysis_quantitative_variables(numeric_independent_vars_df,
     list_discrete_var_names : list
         Lista de nomes de variáveis discretas dentro das variáveis quantitativas independentes.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    cache_dir : str, opcional
+        Diretório do cache em disco das métricas das variáveis (ver `continuous_variables_metrics`). Se None (padrão),
+        as métricas são sempre calculadas.
+
+    large_data_threshold : int, opcional
+        Número de observações acima do qual os gráficos de dispersão e os boxplots são desenhados a partir de
+        agregados pré-calculados, com custo de renderização independente do número de observações. Se None (padrão),
+        todas as observações são desenhadas.
+
+    large_data_scatter : str, opcional
+        Agregado usado nos gráficos de dispersão acima de `large_data_threshold`: 'histogram' (padrão), densidade do
+        histograma 2D (ver `scatter_histogram`), ou 'sample', amostra estratificada de até 10000 pontos (ver
+        `stratified_sample`).
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
+
+    Erros:
+    -------
+    ValueError
+        É levantado se `large_data_scatter` não for 'histogram' nem 'sample'.
     """
+    if large_data_scatter not in ('histogram', 'sample'):
+        raise ValueError(f"large_data_scatter must be 'histogram' or 'sample', got {large_data_scatter!r}")
+
     # Variáveis externas
     numeric_target_var_name = numeric_target_var_df.columns[0] # Nome da variável alvo
-    dict_target_metrics = _calculate_continuous_variable_metrics(numeric_target_var_df[numeric_target_var_name]) # Dicionário de métricas da variável alvo
-    value_target_upper_fence = dict_target_metrics.get('upper_fence') # Valor da cerca superior da variável alvo
-    
-    list_numeric_independent_vars = list(numeric_independent_vars_df.columns) # Lista de variáveis independentes
-    
-    for numeric_independent_var_name in list_numeric_independent_vars:
-        # Variáveis internas
-        numeric_independent_var = numeric_independent_vars_df[numeric_independent_var_name]
-        n_unique_values_var = numeric_independent_var.nunique()
-        dict_independent_metrics = _calculate_continuous_variable_metrics(numeric_independent_var) # Dicionário de métricas da variável independente
-        value_independent_upper_fence = dict_independent_metrics.get('upper_fence') # Valor da cerca superior da variável independente
-        
-        # Calcula a correlação de Spearman entre variável independedente e variável alvo
-        dataframe_for_correlation = pd.merge(numeric_independent_var, numeric_target_var_df, right_index=True, left_index=True)
-        spearman_correlation = dataframe_for_correlation.corr(method='spearman')
-        spearman_correlation.drop(index=numeric_independent_var_name, columns=numeric_target_var_name, inplace=True)
-        
-        # Cria figura com duas área de plotagem
-        fig, axes = plt.subplots(1, 2, figsize=(16, 4.5))
+    value_target_upper_fence = continuous_variables_metrics(numeric_target_var_df, cache_dir= cache_dir).loc[numeric_target_var_name, 'upper_fence'] # Valor da cerca superior da variável alvo
+
+    # Cerca superior de todas as variáveis independentes, calculada (ou lida do cache) de uma só vez
+    independent_upper_fences = continuous_variables_metrics(numeric_independent_vars_df, cache_dir= cache_dir)['upper_fence']
+
+    # Correlações de Spearman de todas as variáveis independentes com a variável alvo, em uma única passada
+    spearman_correlations = target_correlations(numeric_independent_vars_df, numeric_target_var_df[numeric_target_var_name], methods= ('spearman',))['spearman']
+
+    figure_tasks = [(f"bivariate_{var_name}_x_{numeric_target_var_name}",
+                     (numeric_independent_vars_df[var_name], numeric_target_var_df, spearman_correlations[var_name],
+                      independent_upper_fences[var_name], value_target_upper_fence, list_discrete_var_names,
+                      large_data_threshold, large_data_scatter))
+                    for var_name in numeric_independent_vars_df.columns]
+
+    return render_figures(_bivariate_quantitative_variables_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-        # Define a paleta de cores e a embaralha
+
+def _continuous_target_and_qualitative_var_figure(variable, var_name, continuous_target_var, dict_ordinal_vars, large_data_threshold= None):
+    """Constrói e retorna a figura de boxplots da variável-alvo contínua por categoria de uma variável qualitativa."""
+    # Nome da variável-alvo
+    continuous_target_var_name = continuous_target_var.name
+
+    n_unique_values_var = variable.nunique()
+
+    #Realiza o teste de comparação adequado
+    p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(variable, quant_var= continuous_target_var)
+
+    # Cria igura com uma área de plotagem
+    fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
+
+    list_ordinal_vars = list(dict_ordinal_vars.keys())
+    large_data = _is_large_data(variable, large_data_threshold)
+    if large_data:
+        grouping_var, target_var = variable.align(continuous_target_var, join= 'inner')
+
+    if var_name in  list_ordinal_vars:
+        order = dict_ordinal_vars.get(var_name)
+
+        # Cria boxplot (em grandes volumes, a partir das estatísticas pré-calculadas)
+        if large_data:
+            _draw_box_statistics(ax, box_statistics(target_var, groups= grouping_var, order= order),
+                                 palette= sns.color_palette('cubehelix', len(order)))
+        else:
+            sns.boxplot(x= variable, y= continuous_target_var, order= order, palette= 'cubehelix', ax= ax)
+    else:
         palette = sns.color_palette('cubehelix', n_unique_values_var)
         random.shuffle(palette)
 
-        # Cria primeiro gráfico
-        if numeric_independent_var_name in list_discrete_var_names and n_unique_values_var <= 12:
-            sns.boxplot(x= numeric_independent_var, y= numeric_target_var_df[numeric_target_var_name],
-                        orient= 'v', palette= palette, ax= axes[0])
+        # Cria boxplot (em grandes volumes, a partir das estatísticas pré-calculadas)
+        if large_data:
+            _draw_box_statistics(ax, box_statistics(target_var, groups= grouping_var), palette= palette)
         else:
-            sns.scatterplot(data= dataframe_for_correlation, x= numeric_independent_var_name, 
-                            y= numeric_target_var_name, color= "black", alpha= 0.5, s= 50, ax= axes[0])
-            if numeric_independent_var_name not in list_discrete_var_names:
-                axes[0].axvline(x= value_independent_upper_fence, color= '#008080', linestyle= 'dashed', linewidth= 1, 
-                            label= f"Upper Fence ({numeric_independent_var_name}): {float(value_independent_upper_fence):.1f}")
-        
-        # Cria segundo gráfico
-        icefire_r = cm.get_cmap('icefire_r', 256)
-        new_icefire_r = mcolors.LinearSegmentedColormap.from_list('icefire_r_10_90', icefire_r(np.linspace(0.10, 0.90, 256)))
-
-        sns.heatmap(spearman_correlation, annot=True, cmap= new_icefire_r, linewidths=1, linecolor='black', vmin=-1.01, vmax=1.01, ax= axes[1])
-
-        # Adiciona customizações aos subplots
-        fig.suptitle(f"Correlation Plot ({numeric_independent_var_name} x {numeric_target_var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adciona linha e legenda para cerca superior da variável alvo no primeiro subplot
-        axes[0].axhline(y=value_target_upper_fence, color='#483D8B', linestyle='dashed', linewidth=1, 
-                    label=f"Upper Fence ({numeric_target_var_name}): {float(value_target_upper_fence):.1f}")
-        axes[0].legend(loc='upper right', fancybox=True, framealpha=1, shadow=True, borderpad=1)
-        ## Adiciona nome do teste de correlação no segundo subplot
-        axes[1].text(0.5, 0.95, 'Spearman Correlation', transform=axes[1].transAxes, fontsize=12, verticalalignment='top', 
-                 horizontalalignment= 'center', bbox=dict(facecolor='white', alpha=0.5))
-        ## Adiciona e customiza grades no primeiro subplot
-        axes[0].grid(color="gray", linestyle="dotted", linewidth=0.5)
-        axes[0].set_axisbelow(True)
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        axes[0].set_ylabel(numeric_target_var_name)
-        axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        axes[0].tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
-        axes[1].yaxis.set_ticks([])
-        axes[1].set_ylabel(numeric_target_var_name)
-        axes[1].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        axes[1].yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        axes[0].set_xlabel(numeric_independent_var_name)
-        axes[0].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        axes[0].xaxis.label.set_size(10)
-        axes[0].tick_params(axis='x', labelsize= 9, labelrotation= 0)
-        axes[1].xaxis.set_ticks([])
-        axes[1].set_xlabel(numeric_independent_var_name)
-        axes[1].xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        axes[1].xaxis.label.set_size(10)
-
-        # Exibe os gráficos
-        plt.show()
-    
-    return None
-              
+            sns.boxplot(x= variable, y= continuous_target_var, palette= palette, ax= ax)
 
-def plot_bivariate_analysis_continuous_target_and_qualitative_independent_vars(continuous_target_var_df, categorical_vars_df, dict_ordinal_vars):
+    # Adiciona customizações ao gráfico
+    ## Adiciona título a figura
+    fig.suptitle(f"Distributions ({var_name} x {continuous_target_var_name})", fontsize= 14, fontweight= 'bold')
+    ## Adiciona o valor p do teste de Kruskal-Wallis ao gráfico
+    ax.text(0.99, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 12, horizontalalignment='right',
+            verticalalignment= 'top', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
+    ## Adiciona e customiza grades ao gráfico
+    ax.grid(color="gray", linestyle="dotted", linewidth=0.5, axis= 'y')
+    ax.set_axisbelow(True)
+    ## Customiza labels e intervalos nos eixos verticiais dos gráficos
+    ax.set_ylabel(continuous_target_var_name)
+    ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
+    ## Customiza labels e intervalos nos eixos horizontais dos gráficos
+    ax.set_xlabel(var_name)
+    ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
+    ax.xaxis.label.set_size(10)
+    if n_unique_values_var > 12:
+        ax.tick_params(axis='x', labelsize= 9, labelrotation= 50)
+    else:
+        ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
+
+    return fig
+
+
+def plot_bivariate_analysis_continuous_target_and_qualitative_independent_vars(continuous_target_var_df, categorical_vars_df, dict_ordinal_vars, output_dir= None, file_format= 'png', n_jobs= 1, large_data_threshold= None):
     """
     Plota a análise bivariada entre uma variável-alvo contínua e variáveis independentes qualitativas.
 
@@ -536,69 +677,112 @@ def plot_bivariate_analysis_continuous_target_and_qualitative_independent_vars(c
     dict_ordinal_vars : dict
         Um dicionário onde as chaves são os nomes das variáveis ordinais e os valores são listas que definem a ordem das categorias.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    large_data_threshold : int, opcional
+        Número de observações acima do qual os boxplots são desenhados a partir de estatísticas pré-calculadas
+        (quartis, bigodes e uma amostra limitada dos outliers; ver `box_statistics`), com custo de renderização
+        independente do número de observações. Se None (padrão), todas as observações são passadas aos gráficos.
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
     # Nome da variável-alvo
     continuous_target_var_name = continuous_target_var_df.columns[0]
     continuous_target_var = continuous_target_var_df[continuous_target_var_name]
-    
-    for var_name in categorical_vars_df:
-        variable = categorical_vars_df[var_name]
-        n_unique_values_var = variable.nunique()
 
-        #Realiza o teste de comparação adequado
-        p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(variable, quant_var= continuous_target_var)
-        
-        # Cria igura com uma área de plotagem
-        fig, ax = plt.subplots(1, 1, figsize=(16, 4.5))
+    figure_tasks = [(f"bivariate_{var_name}_x_{continuous_target_var_name}",
+                     (categorical_vars_df[var_name], var_name, continuous_target_var, dict_ordinal_vars, large_data_threshold))
+                    for var_name in categorical_vars_df]
 
-        list_ordinal_vars = list(dict_ordinal_vars.keys())
+    return render_figures(_continuous_target_and_qualitative_var_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-        if var_name in  list_ordinal_vars:
-            order = dict_ordinal_vars.get(var_name)
 
-            # Cria boxplot
-            sns.boxplot(x= variable, y= continuous_target_var, order= order, palette= 'cubehelix', ax= ax)
-        else:
-            palette = sns.color_palette('cubehelix', n_unique_values_var)
-            random.shuffle(palette)
-            
-            # Cria boxplot
-            sns.boxplot(x= variable, y= continuous_target_var, palette= palette, ax= ax)
-        
-        # Adiciona customizações ao gráfico
-        ## Adiciona título a figura
-        fig.suptitle(f"Distributions ({var_name} x {continuous_target_var_name})", fontsize= 14, fontweight= 'bold')
-        ## Adiciona o valor p do teste de Kruskal-Wallis ao gráfico
-        ax.text(0.99, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 12, horizontalalignment='right',
-                verticalalignment= 'top', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
-        ## Adiciona e customiza grades ao gráfico
-        ax.grid(color="gray", linestyle="dotted", linewidth=0.5, axis= 'y')
-        ax.set_axisbelow(True)
-        ## Customiza labels e intervalos nos eixos verticiais dos gráficos
-        ax.set_ylabel(continuous_target_var_name)
-        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        ax.yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        ax.tick_params(axis= 'y', labelsize= 9, labelrotation= 0)
-        ## Customiza labels e intervalos nos eixos horizontais dos gráficos
-        ax.set_xlabel(var_name)
-        ax.xaxis.label.set_fontstyle('italic') # Define a label do eixo x como itálico
-        ax.xaxis.label.set_size(10)
-        if n_unique_values_var > 12:
-            ax.tick_params(axis='x', labelsize= 9, labelrotation= 50)
-        else:
-            ax.tick_params(axis='x', labelsize= 9, labelrotation= 0)
+def _contingency_tables_by_var(qualitative_vars_df, qualitative_target_var, contingency_tables= None):
+    """
+    Retorna as tabelas de contingência de cada variável com a variável-alvo, no formato do `pd.crosstab`.
 
-        # Exibe o gráfico
-        plt.show()
-    
-    return None
+    Parâmetros:
+    -----------
+    qualitative_vars_df : pd.DataFrame
+        DataFrame contendo as variáveis cruzadas com a variável-alvo.
 
+    qualitative_target_var : pd.Series
+        Variável-alvo qualitativa.
 
-def plot_bivariate_analysis_qualitative_target_and_nominal_independent_vars(qualitative_target_var_df, nominal_vars_df):
+    contingency_tables : StreamingContingencyTables, opcional
+        Tabelas já acumuladas (ex.: por `contingency_tables_from_file`). Se None (padrão), são calculadas a partir
+        das colunas em uma única passada, com códigos inteiros e um `np.bincount` por variável.
+
+    Retorno:
+    --------
+    dict
+        Tabela de contingência (pd.DataFrame) de cada variável.
+    """
+    if contingency_tables is None:
+        contingency_tables = StreamingContingencyTables(qualitative_target_var.name, qualitative_vars_df.columns)
+        contingency_tables.update(qualitative_vars_df.assign(**{qualitative_target_var.name: qualitative_target_var}))
+
+    return {var_name: contingency_tables.table(var_name) for var_name in qualitative_vars_df}
+
+
+def _qualitative_target_and_nominal_var_figure(contingency_table, var_name, colormap):
+    """Constrói e retorna a figura de frequências absolutas e relativas de uma variável nominal por categoria da variável-alvo."""
+    # Nome da variável-alvo
+    qualitative_target_var_name = contingency_table.columns.name
+
+    # Realiza o teste qui-quadrado
+    _, p_value, _, _ = sts.chi2_contingency(contingency_table)
+
+    # Cria figura com subplots
+    fig, axes = plt.subplots(1, 2, figsize= (16, 4.5))
+
+    # Gráfico de barras múltiplas agrupadas (frequência absoluta)
+    contingency_table.plot(kind= 'bar', stacked= False, ax= axes[0], colormap= colormap, edgecolor='black')
+
+    # Gráfico de barras empilhadas (frequência relativa percentual)
+    contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= colormap, edgecolor='black')
+
+    # Adiciona e ajusta customizações
+    fig.suptitle(f"Absolute and Relative Frequencies ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
+    ## Adiciona e customiza labels os eixos verticais dos gráficos
+    axes[0].set_ylabel("Absolute Frequencies (count)")
+    axes[1].set_ylabel("Relative Frequencies (%)")
+    axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    axes[1].yaxis.label.set_size(10)
+    axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
+    axes[1].yaxis.label.set_fontstyle('italic')
+    ## Adciona e customiza grades da horizontal
+    axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    axes[0].set_axisbelow(True) # A grade fica atrás das barras
+    axes[1].set_axisbelow(True)
+    ## Customiza labels e nome dos grupos nos eixos horizontais dos gráficos
+    axes[0].tick_params(axis='x', labelsize= 9, labelrotation=0)  # Ajusta o tamanho da fonte e rotação dos nomes dos grupos
+    axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
+    axes[0].xaxis.label.set_fontstyle('italic')  # Define a label do eixo x como itálico
+    axes[1].xaxis.label.set_fontstyle('italic')
+    ## Remove a legenda do primeiro gráfico e a move para fora do segundo gráfico
+    axes[0].legend().set_visible(False)
+    axes[1].legend(title='Churn', loc='upper right', bbox_to_anchor=(1.175, 1), fancybox=True, framealpha=1, shadow=True, borderpad=1)
+    ## Adiciona valor p do teste qui-quadrado ao gráfico
+    plt.figtext(0.5, 0.01, f"Chi-Square Test (p-value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor='white', alpha=0.5))
+
+    return fig
+
+
+def plot_bivariate_analysis_qualitative_target_and_nominal_independent_vars(qualitative_target_var_df, nominal_vars_df, output_dir= None, file_format= 'png', n_jobs= 1, contingency_tables= None):
     """
     Plota a análise bivariada entre uma variável-alvo qualitativa e variáveis independentes nominais.
 
@@ -610,10 +794,25 @@ def plot_bivariate_analysis_qualitative_target_and_nominal_independent_vars(qual
     nominal_vars_df : pd.DataFrame
         DataFrame contendo as variáveis independentes nominais.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    contingency_tables : StreamingContingencyTables, opcional
+        Tabelas de contingência das variáveis com a variável-alvo já acumuladas (ex.: por `contingency_tables_from_file`
+        em arquivos maiores que a memória). Se None (padrão), são calculadas a partir dos DataFrames em uma única
+        passada.
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
     cubehelix = cm.get_cmap('cubehelix', 256)
     new_cubehelix = mcolors.LinearSegmentedColormap.from_list('cubehelix_30_70', cubehelix(np.linspace(0.30, 0.70, 256)))
@@ -621,56 +820,65 @@ def plot_bivariate_analysis_qualitative_target_and_nominal_independent_vars(qual
     # Nome da variável-alvo
     qualitative_target_var_name = qualitative_target_var_df.columns[0]
     qualitative_target_var = qualitative_target_var_df[qualitative_target_var_name]
-    for var_name in nominal_vars_df:
-        nominal_var = nominal_vars_df[var_name]
-        
-        # Criação da tabela de contingência
-        contingency_table = pd.crosstab(nominal_var, qualitative_target_var)
 
-        # Realiza o teste qui-quadrado
-        _, p_value, _, _ = sts.chi2_contingency(contingency_table)
-        
-        # Cria figura com subplots
-        fig, axes = plt.subplots(1, 2, figsize= (16, 4.5))
+    # Tabelas de contingência de todas as variáveis com a variável-alvo, em uma única passada
+    contingency_tables_by_var = _contingency_tables_by_var(nominal_vars_df, qualitative_target_var, contingency_tables)
 
-        # Gráfico de barras múltiplas agrupadas (frequência absoluta)
-        contingency_table.plot(kind= 'bar', stacked= False, ax= axes[0], colormap= new_cubehelix, edgecolor='black')
-       
-        # Gráfico de barras empilhadas (frequência relativa percentual)
-        contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= new_cubehelix, edgecolor='black')
-        
-        # Adiciona e ajusta customizações
-        fig.suptitle(f"Absolute and Relative Frequencies ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
-        ## Adiciona e customiza labels os eixos verticais dos gráficos
-        axes[0].set_ylabel("Absolute Frequencies (count)")
-        axes[1].set_ylabel("Relative Frequencies (%)")
-        axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
-        axes[1].yaxis.label.set_size(10)
-        axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para label
-        axes[1].yaxis.label.set_fontstyle('italic')
-        ## Adciona e customiza grades da horizontal
-        axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-        axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-        axes[0].set_axisbelow(True) # A grade fica atrás das barras
-        axes[1].set_axisbelow(True)
-        ## Customiza labels e nome dos grupos nos eixos horizontais dos gráficos
-        axes[0].tick_params(axis='x', labelsize= 9, labelrotation=0)  # Ajusta o tamanho da fonte e rotação dos nomes dos grupos
-        axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
-        axes[0].xaxis.label.set_fontstyle('italic')  # Define a label do eixo x como itálico
-        axes[1].xaxis.label.set_fontstyle('italic')
-        ## Remove a legenda do primeiro gráfico e a move para fora do segundo gráfico
-        axes[0].legend().set_visible(False)
-        axes[1].legend(title='Churn', loc='upper right', bbox_to_anchor=(1.175, 1), fancybox=True, framealpha=1, shadow=True, borderpad=1)
-        ## Adiciona valor p do teste qui-quadrado ao gráfico
-        plt.figtext(0.5, 0.01, f"Chi-Square Test (p-value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor='white', alpha=0.5))
-        
-        # Exibe o gráfico
-        plt.show()
-    
-    return None
+    figure_tasks = [(f"bivariate_{var_name}_x_{qualitative_target_var_name}",
+                     (contingency_tables_by_var[var_name], var_name, new_cubehelix))
+                    for var_name in nominal_vars_df]
 
+    return render_figures(_qualitative_target_and_nominal_var_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-def plot_bivariate_analysis_qualitative_target_and_ordinal_independent_vars(qualitative_target_var_df, ordinal_vars_df, ordinal_vars_dict):
+
+def _qualitative_target_and_ordinal_var_figure(ordinal_var, var_name, qualitative_target_var, categories, contingency_table, colormap):
+    """Constrói e retorna a figura de frequências absolutas e relativas de uma variável ordinal por categoria da variável-alvo."""
+    # Nome da variável-alvo
+    qualitative_target_var_name = qualitative_target_var.name
+
+    # Cria a categoria ordenada da variável ordinal
+    ordinal_var_test = pd.Categorical(ordinal_var, categories= categories, ordered= True).codes
+
+    #Realiza o teste de comparação adequado
+    p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, numeric_ordinal_var= ordinal_var_test)
+
+    # Cria figura com subplots
+    fig, axes = plt.subplots(1, 2, figsize=(16, 4.5))
+
+    # Gráfico de barras múltiplas agrupadas (frequência absoluta)
+    contingency_table.plot(kind= 'bar', stacked= False, ax=axes[0], colormap= colormap, edgecolor='black')
+
+    # Gráfico de barras empilhadas (frequência relativa percentual)
+    contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= colormap, edgecolor='black')
+
+    # Adciona e ajusta customizações nos gráficos
+    fig.suptitle(f"Absolute and Relative Frequencies ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
+    plt.figtext(0.5, 0.01, f"{test_name} (p_value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor='white', alpha=0.5))
+    ## Customiza labels e nome dos grupos nos eixos horizontais dos gráficos
+    axes[0].tick_params(axis='x', labelsize= 9, labelrotation=0)  # Ajusta o tamanho da fonte e rotação dos nomes dos grupos
+    axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
+    axes[0].xaxis.label.set_fontstyle('italic')  # Define a label do eixo x como itálico
+    axes[1].xaxis.label.set_fontstyle('italic')
+    axes[0].set_ylabel("Frequência Absoluta") # Define o nome da label do eixo y
+    axes[1].set_ylabel("Frequência Relativa (%)")
+    axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
+    axes[1].yaxis.label.set_size(10)
+    axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
+    axes[1].yaxis.label.set_fontstyle('italic')
+    ## Adiciona e customiza grades da horizontal
+    axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+    axes[0].set_axisbelow(True) # A grade fica atrás das barras
+    axes[1].set_axisbelow(True)
+    ## Remove a legenda do primeiro gráfico e a move para fora do segundo gráfico
+    axes[0].legend().set_visible(False)
+    axes[1].legend(title='Churn', loc='upper right', bbox_to_anchor=(1.175, 1), fancybox=True, framealpha=1, shadow=True, borderpad=1)
+
+    return fig
+
+
+def plot_bivariate_analysis_qualitative_target_and_ordinal_independent_vars(qualitative_target_var_df, ordinal_vars_df, ordinal_vars_dict, output_dir= None, file_format= 'png', n_jobs= 1, contingency_tables= None):
     """
     Plota a análise bivariada entre uma variável-alvo qualitativa e variáveis independentes ordinais.
 
@@ -685,10 +893,25 @@ def plot_bivariate_analysis_qualitative_target_and_ordinal_independent_vars(qual
     ordinal_vars_dict : dict
         Dicionário com o nome das variáveis ordinais e suas categorias ordenadas em formato de lista.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    contingency_tables : StreamingContingencyTables, opcional
+        Tabelas de contingência das variáveis com a variável-alvo já acumuladas (ex.: por `contingency_tables_from_file`
+        em arquivos maiores que a memória). Se None (padrão), são calculadas a partir dos DataFrames em uma única
+        passada.
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
     cubehelix = cm.get_cmap('cubehelix', 256)
     new_cubehelix = mcolors.LinearSegmentedColormap.from_list('cubehelix_30_70', cubehelix(np.linspace(0.30, 0.70, 256)))
@@ -697,30 +920,65 @@ def plot_bivariate_analysis_qualitative_target_and_ordinal_independent_vars(qual
     qualitative_target_var_name = qualitative_target_var_df.columns[0]
     qualitative_target_var = qualitative_target_var_df[qualitative_target_var_name]
 
-    for var_name in ordinal_vars_df:
-        ordinal_var = ordinal_vars_df[var_name]
+    # Tabelas de contingência de todas as variáveis com a variável-alvo, em uma única passada
+    contingency_tables_by_var = _contingency_tables_by_var(ordinal_vars_df, qualitative_target_var, contingency_tables)
 
-        # Cria a categoria ordenada da variável ordinal
-        ordinal_var_test = pd.Categorical(ordinal_var, categories= ordinal_vars_dict[var_name], ordered= True).codes
-        
-        #Realiza o teste de comparação adequado
-        p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, numeric_ordinal_var= ordinal_var_test)
+    figure_tasks = [(f"bivariate_{var_name}_x_{qualitative_target_var_name}",
+                     (ordinal_vars_df[var_name], var_name, qualitative_target_var, ordinal_vars_dict[var_name],
+                      contingency_tables_by_var[var_name], new_cubehelix))
+                    for var_name in ordinal_vars_df]
 
-        # Criação da tabela de contingência
-        contingency_table = pd.crosstab(ordinal_var, qualitative_target_var)
-        
+    return render_figures(_qualitative_target_and_ordinal_var_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
+
+
+def _qualitative_target_and_discrete_var_figure(discrete_var, var_name, qualitative_target_var, contingency_table, colormap, large_data_threshold= None):
+    """Constrói e retorna a figura de boxplots ou de frequências de uma variável discreta por categoria da variável-alvo."""
+    # Nome da variável-alvo
+    qualitative_target_var_name = qualitative_target_var.name
+
+    #Realiza o teste de comparação adequado
+    p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, quant_var= discrete_var)
+
+    if discrete_var.nunique() > 12:
+        # Criação dos boxplots
+        fig, ax = plt.subplots(figsize= (16, 4.5))
+        if _is_large_data(discrete_var, large_data_threshold):
+            # Em grandes volumes, um boxplot por categoria da variável-alvo a partir das estatísticas pré-calculadas
+            grouping_var, values = qualitative_target_var.align(discrete_var, join= 'inner')
+            box_stats = box_statistics(values, groups= grouping_var)
+            _draw_box_statistics(ax, box_stats, palette= list(colormap(np.linspace(0, 1, len(box_stats)))))
+        else:
+            sns.boxplot(x= qualitative_target_var, y= discrete_var, hue= discrete_var, palette= colormap, ax= ax)
+
+        # Adicionando customizações ao gráfico
+        fig.suptitle(f"Distributions ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
+        plt.text(0.5, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 10, horizontalalignment='center',
+                 verticalalignment= 'center', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
+        ## Customiza labels
+        ax.set_xlabel(qualitative_target_var_name)
+        ax.set_ylabel(var_name)
+        ax.yaxis.label.set_size(10) # Ajusta o tamanho da label
+        ax.xaxis.label.set_size(9)
+        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
+        ax.xaxis.label.set_fontstyle('italic')
+        ## Adiciona e customiza grades da horizontal
+        ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
+        ax.set_axisbelow(True) # A grade fica atrás das barras
+
+    else:
         # Cria figura com subplots
-        fig, axes = plt.subplots(1, 2, figsize=(16, 4.5))
-        
+        fig, axes = plt.subplots(1, 2, figsize= (16, 4.5))
+
         # Gráfico de barras múltiplas agrupadas (frequência absoluta)
-        contingency_table.plot(kind= 'bar', stacked= False, ax=axes[0], colormap= new_cubehelix, edgecolor='black')
-        
+        contingency_table.plot(kind= 'bar', stacked= False, ax= axes[0], colormap= colormap, edgecolor='black')
+
         # Gráfico de barras empilhadas (frequência relativa percentual)
-        contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= new_cubehelix, edgecolor='black')
-        
-        # Adciona e ajusta customizações nos gráficos
+        contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= colormap, edgecolor='black')
+
+        # Adiciona e customiza os gráficos
         fig.suptitle(f"Absolute and Relative Frequencies ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
-        plt.figtext(0.5, 0.01, f"{test_name} (p_value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor='white', alpha=0.5))
+        plt.figtext(0.5, 0.01, f"{test_name} (p-value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor= 'white', alpha= 0.5))
         ## Customiza labels e nome dos grupos nos eixos horizontais dos gráficos
         axes[0].tick_params(axis='x', labelsize= 9, labelrotation=0)  # Ajusta o tamanho da fonte e rotação dos nomes dos grupos
         axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
@@ -740,14 +998,11 @@ def plot_bivariate_analysis_qualitative_target_and_ordinal_independent_vars(qual
         ## Remove a legenda do primeiro gráfico e a move para fora do segundo gráfico
         axes[0].legend().set_visible(False)
         axes[1].legend(title='Churn', loc='upper right', bbox_to_anchor=(1.175, 1), fancybox=True, framealpha=1, shadow=True, borderpad=1)
-        
-        # Exibe o gráfico
-        plt.show()
-    
-    return None
+
+    return fig
 
 
-def plot_bivariate_analysis_qualitative_target_and_discrete_independent_vars(qualitative_target_var_df, discrete_vars_df):
+def plot_bivariate_analysis_qualitative_target_and_discrete_independent_vars(qualitative_target_var_df, discrete_vars_df, output_dir= None, file_format= 'png', n_jobs= 1, large_data_threshold= None, contingency_tables= None):
     """
     Plota a análise bivariada entre uma variável-alvo qualitativa e variáveis independentes discretas.
 
@@ -759,10 +1014,30 @@ def plot_bivariate_analysis_qualitative_target_and_discrete_independent_vars(qua
     discrete_vars_df : pd.DataFrame
         DataFrame contendo as variáveis independentes discretas.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    large_data_threshold : int, opcional
+        Número de observações acima do qual os boxplots são desenhados a partir de estatísticas pré-calculadas
+        (quartis, bigodes e uma amostra limitada dos outliers; ver `box_statistics`), com custo de renderização
+        independente do número de observações. Se None (padrão), todas as observações são passadas aos gráficos.
+
+    contingency_tables : StreamingContingencyTables, opcional
+        Tabelas de contingência das variáveis com a variável-alvo já acumuladas (ex.: por `contingency_tables_from_file`
+        em arquivos maiores que a memória). Se None (padrão), são calculadas a partir dos DataFrames em uma única
+        passada.
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
     cubehelix = cm.get_cmap('cubehelix', 256)
     new_cubehelix = mcolors.LinearSegmentedColormap.from_list('cubehelix_30_70', cubehelix(np.linspace(0.30, 0.70, 256)))
@@ -770,75 +1045,60 @@ def plot_bivariate_analysis_qualitative_target_and_discrete_independent_vars(qua
     # Nome da variável-alvo
     qualitative_target_var_name = qualitative_target_var_df.columns[0]
     qualitative_target_var = qualitative_target_var_df[qualitative_target_var_name]
-    for var_name in discrete_vars_df:
-        discrete_var = discrete_vars_df[var_name]
 
-        #Realiza o teste de comparação adequado
-        p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, quant_var= discrete_var)
-        
-        if discrete_var.nunique() > 12:
-            # Criação dos boxplots
-            fig, ax = plt.subplots(figsize= (16, 4.5))
-            sns.boxplot(x= qualitative_target_var, y= discrete_var, hue= discrete_var, palette= new_cubehelix, ax= ax)
-            
-            # Adicionando customizações ao gráfico
-            fig.suptitle(f"Distributions ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
-            plt.text(0.5, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 10, horizontalalignment='center',
-                     verticalalignment= 'center', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
-            ## Customiza labels
-            ax.set_xlabel(qualitative_target_var_name)
-            ax.set_ylabel(var_name)
-            ax.yaxis.label.set_size(10) # Ajusta o tamanho da label
-            ax.xaxis.label.set_size(9)
-            ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
-            ax.xaxis.label.set_fontstyle('italic')
-            ## Adiciona e customiza grades da horizontal
-            ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-            ax.set_axisbelow(True) # A grade fica atrás das barras
-        
-        else:
-            # Criação da tabela de contingência
-            contingency_table = pd.crosstab(discrete_var, qualitative_target_var)
-            
-            # Cria figura com subplots
-            fig, axes = plt.subplots(1, 2, figsize= (16, 4.5))
-            
-            # Gráfico de barras múltiplas agrupadas (frequência absoluta)
-            contingency_table.plot(kind= 'bar', stacked= False, ax= axes[0], colormap= new_cubehelix, edgecolor='black')
-            
-            # Gráfico de barras empilhadas (frequência relativa percentual)
-            contingency_table.div(contingency_table.sum(1), axis= 0).plot(kind= 'bar', stacked= True, ax= axes[1], colormap= new_cubehelix, edgecolor='black')
-            
-            # Adiciona e customiza os gráficos
-            fig.suptitle(f"Absolute and Relative Frequencies ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
-            plt.figtext(0.5, 0.01, f"{test_name} (p-value): {p_value}", ha= "center", fontsize= 10, bbox=dict(facecolor= 'white', alpha= 0.5))
-            ## Customiza labels e nome dos grupos nos eixos horizontais dos gráficos
-            axes[0].tick_params(axis='x', labelsize= 9, labelrotation=0)  # Ajusta o tamanho da fonte e rotação dos nomes dos grupos
-            axes[1].tick_params(axis='x', labelsize= 9, labelrotation=0)
-            axes[0].xaxis.label.set_fontstyle('italic')  # Define a label do eixo x como itálico
-            axes[1].xaxis.label.set_fontstyle('italic')
-            axes[0].set_ylabel("Frequência Absoluta") # Define o nome da label do eixo y
-            axes[1].set_ylabel("Frequência Relativa (%)")
-            axes[0].yaxis.label.set_size(10)  # Ajusta o tamanho da label
-            axes[1].yaxis.label.set_size(10)
-            axes[0].yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
-            axes[1].yaxis.label.set_fontstyle('italic')
-            ## Adiciona e customiza grades da horizontal
-            axes[0].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-            axes[1].grid(color= "gray", linestyle= "dotted", linewidth= 0.5, axis= 'y')
-            axes[0].set_axisbelow(True) # A grade fica atrás das barras
-            axes[1].set_axisbelow(True)
-            ## Remove a legenda do primeiro gráfico e a move para fora do segundo gráfico
-            axes[0].legend().set_visible(False)
-            axes[1].legend(title='Churn', loc='upper right', bbox_to_anchor=(1.175, 1), fancybox=True, framealpha=1, shadow=True, borderpad=1)
-
-        # Exibe o gráfico
-        plt.show()
-
-    return None
-
-
-def plot_bivariate_analysis_qualitative_target_and_continuous_independent_vars(qualitative_target_var_df, continuous_vars_df):
+    # Tabelas de contingência de todas as variáveis com a variável-alvo, em uma única passada
+    contingency_tables_by_var = _contingency_tables_by_var(discrete_vars_df, qualitative_target_var, contingency_tables)
+
+    figure_tasks = [(f"bivariate_{var_name}_x_{qualitative_target_var_name}",
+                     (discrete_vars_df[var_name], var_name, qualitative_target_var, contingency_tables_by_var[var_name],
+                      new_cubehelix, large_data_threshold))
+                    for var_name in discrete_vars_df]
+
+    return render_figures(_qualitative_target_and_discrete_var_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
+
+
+def _qualitative_target_and_continuous_var_figure(continuous_var, var_name, qualitative_target_var, large_data_threshold= None):
+    """Constrói e retorna a figura de boxplots de uma variável contínua por categoria da variável-alvo."""
+    # Nome da variável-alvo
+    qualitative_target_var_name = qualitative_target_var.name
+
+    #Realiza o teste de comparação adequado
+    p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, quant_var= continuous_var)
+
+    # Criação de figura e 1 subplot
+    fig, ax = plt.subplots(figsize= (16, 4.5))
+
+    # Cria boxplot
+    flierprops = dict(marker= 'o', markerfacecolor='none', markersize= 6)
+
+    if _is_large_data(continuous_var, large_data_threshold):
+        # Em grandes volumes, os boxplots são desenhados a partir das estatísticas pré-calculadas
+        grouping_var, values = qualitative_target_var.align(continuous_var, join= 'inner')
+        box_stats = box_statistics(values, groups= grouping_var)
+        _draw_box_statistics(ax, box_stats, palette= sns.color_palette('cubehelix', len(box_stats)), vert= False,
+                             flierprops= flierprops)
+    else:
+        sns.boxplot(x= continuous_var, y= qualitative_target_var, hue= qualitative_target_var, palette= 'cubehelix', flierprops= flierprops, ax= ax)
+
+    fig.suptitle(f"Distributions ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
+    plt.text(0.99, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 10, horizontalalignment='right',
+                verticalalignment= 'top', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
+    ## Customiza labels
+    ax.set_xlabel(var_name)
+    ax.set_ylabel(qualitative_target_var_name)
+    ax.yaxis.label.set_size(10) # Ajusta o tamanho da label
+    ax.xaxis.label.set_size(10)
+    ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
+    ax.xaxis.label.set_fontstyle('italic')
+    ## Adiciona e customiza grades da horizontal
+    ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5)
+    ax.set_axisbelow(True) # A grade fica atrás das barras
+
+    return fig
+
+
+def plot_bivariate_analysis_qualitative_target_and_continuous_independent_vars(qualitative_target_var_df, continuous_vars_df, output_dir= None, file_format= 'png', n_jobs= 1, large_data_threshold= None):
     """
     Plota a análise bivariada entre uma variável-alvo qualitativa e variáveis independentes contínuas.
 
@@ -850,50 +1110,53 @@ def plot_bivariate_analysis_qualitative_target_and_continuous_independent_vars(q
     continuous_vars_df : pd.DataFrame
         DataFrame contendo as variáveis independentes contínuas.
 
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas, uma por variável. Se None (padrão), os gráficos são exibidos.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    large_data_threshold : int, opcional
+        Número de observações acima do qual os boxplots são desenhados a partir de estatísticas pré-calculadas
+        (quartis, bigodes e uma amostra limitada dos outliers; ver `box_statistics`), com custo de renderização
+        independente do número de observações. Se None (padrão), todas as observações são passadas aos gráficos.
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Caminhos dos arquivos salvos, na ordem das variáveis, quando `output_dir` é informado; caso contrário, a
+        função não retorna nenhum valor e exibe os gráficos gerados.
     """
     # Nome da variável-alvo
     qualitative_target_var_name = qualitative_target_var_df.columns[0]
     qualitative_target_var = qualitative_target_var_df[qualitative_target_var_name]
-    
-    for var_name in continuous_vars_df:
-        continuous_var = continuous_vars_df[var_name]
-        
-        #Realiza o teste de comparação adequado
-        p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qualitative_target_var, quant_var= continuous_var)
-        
-        # Criação de figura e 1 subplot
-        fig, ax = plt.subplots(figsize= (16, 4.5))
 
-        # Cria boxplot
-        flierprops = dict(marker= 'o', markerfacecolor='none', markersize= 6)
+    figure_tasks = [(f"bivariate_{var_name}_x_{qualitative_target_var_name}",
+                     (continuous_vars_df[var_name], var_name, qualitative_target_var, large_data_threshold))
+                    for var_name in continuous_vars_df]
 
-        sns.boxplot(x= continuous_var, y= qualitative_target_var, hue= qualitative_target_var, palette= 'cubehelix', flierprops= flierprops, ax= ax)
+    return render_figures(_qualitative_target_and_continuous_var_figure, figure_tasks, output_dir= output_dir,
+                          file_format= file_format, n_jobs= n_jobs)
 
-        fig.suptitle(f"Distributions ({var_name} x {qualitative_target_var_name})", fontsize=14, fontweight='bold')
-        plt.text(0.99, 0.95, f"{test_name} (p-value): {p_value}", fontsize= 10, horizontalalignment='right',
-                    verticalalignment= 'top', bbox= dict(facecolor='white', alpha=0.5), transform= ax.transAxes)
-        ## Customiza labels
-        ax.set_xlabel(var_name)
-        ax.set_ylabel(qualitative_target_var_name)
-        ax.yaxis.label.set_size(10) # Ajusta o tamanho da label
-        ax.xaxis.label.set_size(10)
-        ax.yaxis.label.set_fontstyle('italic') # Fonte itálico para as labels
-        ax.xaxis.label.set_fontstyle('italic')
-        ## Adiciona e customiza grades da horizontal
-        ax.grid(color= "gray", linestyle= "dotted", linewidth= 0.5)
-        ax.set_axisbelow(True) # A grade fica atrás das barras
-        
-        # Exibe o gráfico
-        plt.show()
-    
-    return None
+
+def _pvalues_heatmap_figure(pvalues_matrix_df):
+    """Constrói e retorna a figura do heatmap de uma matriz de p-valores."""
+    # Cria figura com uma área de plotagem
+    fig, ax = plt.subplots(1, 1, figsize=(20, 10))
+
+    icefire = cm.get_cmap('icefire', 256)
+    new_icefire = mcolors.LinearSegmentedColormap.from_list('icefire_50_80', icefire(np.linspace(0.5, 0.8, 256)))
+
+    # Cria heatmap da matrix
+    sns.heatmap(pvalues_matrix_df, annot=True, fmt=".2f", cmap= new_icefire, annot_kws={"size": 6}, ax= ax);
+
+    return fig
 
 
-def plot_multivariate_heatmap_qualitative_vars(qualitative_vars_df, ordinal_vars_dict= dict()):
+def plot_multivariate_heatmap_qualitative_vars(qualitative_vars_df, ordinal_vars_dict= dict(), n_jobs= 1, output_dir= None, file_format= 'png'):
     """
     Gera um heatmap multivariado que visualiza os p-valores das comparações entre variáveis qualitativas e ordinais, 
     utilizando testes estatísticos apropriados para cada combinação de variáveis.
@@ -911,10 +1174,20 @@ def plot_multivariate_heatmap_qualitative_vars(qualitative_vars_df, ordinal_vars
         Dicionário contendo as variáveis ordinais e suas respectivas ordens. As chaves do dicionário são os nomes das 
         variáveis ordinais, e os valores são listas que especificam a ordem das categorias da variável ordinal.
 
+    n_jobs : int, opcional
+        Número de processos entre os quais os testes dos pares são distribuídos (padrão é 1).
+
+    output_dir : str, opcional
+        Diretório onde a figura é salva. Se None (padrão), o gráfico é exibido.
+
+    file_format : str, opcional
+        Formato do arquivo salvo, 'png' ou 'svg' (padrão é 'png').
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor, mas exibe um gráfico de heatmap com os p-valores das comparações entre as 
+    list ou None
+        Lista com o caminho do arquivo salvo quando `output_dir` é informado; caso contrário, a função não retorna
+        nenhum valor, mas exibe um gráfico de heatmap com os p-valores das comparações entre as 
         variáveis qualitativas.
 
     Processo:
@@ -944,70 +1217,26 @@ def plot_multivariate_heatmap_qualitative_vars(qualitative_vars_df, ordinal_vars
     >>> ordinal_vars_dict = {'var3': ['Low', 'Medium', 'High']}
     >>> plot_multivariate_heatmap_qualitative_vars(qualitative_vars_df, ordinal_vars_dict)
     """
-    qualitative_vars_list = qualitative_vars_df.columns
-    ordinals_vars_list = list(ordinal_vars_dict.keys())
-
-    # Inicializa o DataFrame para armazenar os p-valores
-    pvalues_matrix_df = pd.DataFrame(index=qualitative_vars_list, columns=qualitative_vars_list)
-
-    for qual_var_name1 in qualitative_vars_list:
-        for qual_var_name2 in qualitative_vars_list:
-            if (qual_var_name1 in ordinals_vars_list) & (qual_var_name2 in ordinals_vars_list):
-                ordinal_var1 = qualitative_vars_df[qual_var_name1]
-                ordinal_var2 = qualitative_vars_df[qual_var_name2]
-
-                # Cria a categoria ordenada da variável ordinal
-                ordinal_var2 = pd.Categorical(ordinal_var2, categories= ordinal_vars_dict[qual_var_name2], ordered= True).codes
-                
-                #Realiza o teste de comparação adequado
-                p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(ordinal_var1, numeric_ordinal_var= ordinal_var2)
-            elif (qual_var_name1 in ordinals_vars_list) & (qual_var_name2 not in ordinals_vars_list):
-                ordinal_var = qualitative_vars_df[qual_var_name1]
-                nominal_var = qualitative_vars_df[qual_var_name2]
-
-                # Cria a categoria ordenada da variável ordinal
-                ordinal_var = pd.Categorical(ordinal_var, categories= ordinal_vars_dict[qual_var_name1], ordered= True).codes
-                
-                #Realiza o teste de comparação adequado
-                p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(nominal_var, numeric_ordinal_var= ordinal_var)
-            elif (qual_var_name1 not in ordinals_vars_list) & (qual_var_name2 in ordinals_vars_list):
-                ordinal_var = qualitative_vars_df[qual_var_name2]
-                nominal_var = qualitative_vars_df[qual_var_name1]
-
-                # Cria a categoria ordenada da variável ordinal
-                ordinal_var = pd.Categorical(ordinal_var, categories= ordinal_vars_dict[qual_var_name2], ordered= True).codes
-                
-                #Realiza o teste de comparação adequado
-                p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(nominal_var, numeric_ordinal_var= ordinal_var)
-            else:
-                # Criação da tabela de contingência
-                contingency_table = pd.crosstab(qualitative_vars_df[qual_var_name1], qualitative_vars_df[qual_var_name2])
-
-                # Realiza o teste qui-quadrado
-                _, p_value, _, _ = sts.chi2_contingency(contingency_table)
-
-            # Armazena o p-valor na matriz
-            pvalues_matrix_df.loc[qual_var_name1, qual_var_name2] = p_value
-
-    # Converte todos os valores para float
-    pvalues_matrix_df = pvalues_matrix_df.astype(float)
+    # Calcula a matriz de p-valores (pares simétricos testados uma vez, opcionalmente em paralelo)
+    pvalues_matrix_df = qualitative_vars_pvalues_matrix(qualitative_vars_df, ordinal_vars_dict, n_jobs= n_jobs)
 
-    # Cria figura com uma área de plotagem
-    fig, ax = plt.subplots(1, 1, figsize=(20, 10))
+    return render_figures(_pvalues_heatmap_figure, [("heatmap_qualitative_vars_pvalues", (pvalues_matrix_df,))],
+                          output_dir= output_dir, file_format= file_format)
 
-    icefire = cm.get_cmap('icefire', 256)
-    new_icefire = mcolors.LinearSegmentedColormap.from_list('icefire_50_80', icefire(np.linspace(0.5, 0.8, 256)))
 
-    # Cria heatmap da matrix
-    sns.heatmap(pvalues_matrix_df, annot=True, fmt=".2f", cmap= new_icefire, annot_kws={"size": 6}, ax= ax);
+def _correlations_heatmap_figure(correlations):
+    """Constrói e retorna a figura do heatmap de uma matriz de correlações."""
+    fig = plt.figure(figsize= (20, 10))
 
-    # Exibe o gráfico
-    plt.show()
+    icefire_r = cm.get_cmap('icefire_r', 256)
+    new_icefire_r = mcolors.LinearSegmentedColormap.from_list('icefire_r_10_90', icefire_r(np.linspace(0.10, 0.90, 256)))
+    
+    sns.heatmap(correlations, cmap= new_icefire_r, vmin=-1.01, vmax=1.01, annot=True, fmt=".2f", annot_kws={"size": 8});
 
-    return None
+    return fig
 
 
-def plot_multivariate_heatmap_quantitative_vars(quantitative_vars_df):
+def plot_multivariate_heatmap_quantitative_vars(quantitative_vars_df, output_dir= None, file_format= 'png'):
     """
     Calcula o score de correlação entre variáveis quantitativas e plota um heatmap das variáveis associadas.
 
@@ -1016,26 +1245,25 @@ def plot_multivariate_heatmap_quantitative_vars(quantitative_vars_df):
     quantitative_vars_df : pd.DataFrame
         DataFrame contendo as variáveis quantitativas.
 
+    output_dir : str, opcional
+        Diretório onde a figura é salva. Se None (padrão), o gráfico é exibido.
+
+    file_format : str, opcional
+        Formato do arquivo salvo, 'png' ou 'svg' (padrão é 'png').
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor. Ela exibe os gráficos gerados.
+    list ou None
+        Lista com o caminho do arquivo salvo quando `output_dir` é informado; caso contrário, a função não retorna
+        nenhum valor e exibe os gráficos gerados.
     """
     correlations = quantitative_vars_df.corr(method= 'spearman')
 
-    plt.figure(figsize= (20, 10))
-
-    icefire_r = cm.get_cmap('icefire_r', 256)
-    new_icefire_r = mcolors.LinearSegmentedColormap.from_list('icefire_r_10_90', icefire_r(np.linspace(0.10, 0.90, 256)))
-    
-    sns.heatmap(correlations, cmap= new_icefire_r, vmin=-1.01, vmax=1.01, annot=True, fmt=".2f", annot_kws={"size": 8});
-    
-    plt.show()
+    return render_figures(_correlations_heatmap_figure, [("heatmap_quantitative_vars_correlations", (correlations,))],
+                          output_dir= output_dir, file_format= file_format)
 
-    return None
 
-
-def plot_multivariate_heatmap_quantitative_qualitative_vars(quantitative_vars_df, qualitative_vars_df):
+def plot_multivariate_heatmap_quantitative_qualitative_vars(quantitative_vars_df, qualitative_vars_df, n_jobs= 1, output_dir= None, file_format= 'png'):
     """
     Gera um heatmap multivariado visualizando os p-valores das comparações entre variáveis quantitativas e qualitativas, 
     utilizando testes estatísticos adequados com base nos dados.
@@ -1053,10 +1281,20 @@ def plot_multivariate_heatmap_quantitative_qualitative_vars(quantitative_vars_df
         DataFrame contendo as variáveis qualitativas (categóricas). Cada coluna representa uma variável qualitativa e 
         cada linha representa uma observação.
 
+    n_jobs : int, opcional
+        Número de processos entre os quais os testes dos pares são distribuídos (padrão é 1).
+
+    output_dir : str, opcional
+        Diretório onde a figura é salva. Se None (padrão), o gráfico é exibido.
+
+    file_format : str, opcional
+        Formato do arquivo salvo, 'png' ou 'svg' (padrão é 'png').
+
     Retorno:
     --------
-    None
-        A função não retorna nenhum valor, mas exibe um gráfico de heatmap com os p-valores das comparações entre as 
+    list ou None
+        Lista com o caminho do arquivo salvo quando `output_dir` é informado; caso contrário, a função não retorna
+        nenhum valor, mas exibe um gráfico de heatmap com os p-valores das comparações entre as 
         variáveis quantitativas e qualitativas.
 
     Processo:
@@ -1086,37 +1324,8 @@ def plot_multivariate_heatmap_quantitative_qualitative_vars(quantitative_vars_df
     >>> })
     >>> plot_multivariate_heatmap_quantitative_qualitative_vars(quantitative_vars_df, qualitative_vars_df)
     """
-    quantitative_vars_list = quantitative_vars_df.columns
-    qualitative_vars_list = qualitative_vars_df.columns
-
-    # Inicializa o DataFrame para armazenar os p-valores
-    pvalues_matrix_df = pd.DataFrame(index=quantitative_vars_list, columns=qualitative_vars_list)
-
-    # Itera sobre cada combinação de variáveis quantitativas e qualitativas
-    for quant_var_name in quantitative_vars_list:
-        quant_var = quantitative_vars_df[quant_var_name]
-
-        for qual_var_name in qualitative_vars_list:
-            qual_var = qualitative_vars_df[qual_var_name]
-
-            p_value, test_name = _comparison_test_for_ordinal_or_quantitative_vars(qual_var, quant_var= quant_var)
-
-            # Armazena o p-valor na matriz
-            pvalues_matrix_df.loc[quant_var_name, qual_var_name] = p_value
-
-    # Converte todos os valores para float
-    pvalues_matrix_df = pvalues_matrix_df.astype(float)
-
-    # Cria figura com uma área de plotagem
-    fig, ax = plt.subplots(1, 1, figsize=(20, 10))
-
-    icefire = cm.get_cmap('icefire', 256)
-    new_icefire = mcolors.LinearSegmentedColormap.from_list('icefire_50_80', icefire(np.linspace(0.5, 0.8, 256)))
-
-    # Cria heatmap da matrix
-    sns.heatmap(pvalues_matrix_df, annot=True, fmt=".2f", cmap= new_icefire, annot_kws={"size": 6}, ax= ax);
-
-    # Exibe o gráfico
-    plt.show()
+    # Calcula a matriz de p-valores (opcionalmente em paralelo)
+    pvalues_matrix_df = quantitative_qualitative_vars_pvalues_matrix(quantitative_vars_df, qualitative_vars_df, n_jobs= n_jobs)
 
-    return None
\ No newline at end of file
+    return render_figures(_pvalues_heatmap_figure, [("heatmap_quantitative_qualitative_vars_pvalues", (pvalues_matrix_df,))],
+                          output_dir= output_dir, file_format= file_format)
\ No newline at end of file
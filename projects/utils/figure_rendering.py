@@ -0,0 +1,95 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib.pyplot as plt
+
+_FILE_FORMATS = ('png', 'svg')
+
+
+def _figure_file_path(output_dir, figure_name, file_format):
+    # Nome de arquivo seguro a partir do nome da figura (nomes de colunas podem ter espaços, barras etc.)
+    file_name = re.sub(r'[^\w.-]+', '_', str(figure_name)).strip('_')
+
+    return os.path.join(output_dir, f"{file_name}.{file_format}")
+
+
+def _init_render_worker():
+    # Backend sem interface gráfica nos processos de renderização (também fecha figuras herdadas do processo pai)
+    plt.switch_backend('Agg')
+
+
+def _render_figure_to_file(render_task):
+    figure_builder, args, file_path, dpi = render_task
+
+    fig = figure_builder(*args)
+    fig.savefig(file_path, dpi= dpi)
+
+    # Fecha a figura: o pyplot mantém referência a todas as figuras abertas até que sejam fechadas
+    plt.close(fig)
+
+    return file_path
+
+
+def render_figures(figure_builder, figure_tasks, output_dir= None, file_format= 'png', n_jobs= 1, dpi= 100):
+    """
+    Constrói uma figura por tarefa e a exibe ou salva em arquivo, opcionalmente em um pool de processos.
+
+    Parâmetros:
+    -----------
+    figure_builder : callable
+        Função que recebe os argumentos de uma tarefa e retorna a figura (matplotlib.figure.Figure) construída. Para
+        o pool de processos, deve ser uma função de nível de módulo (serializável).
+
+    figure_tasks : list
+        Lista de tuplas (figure_name, args), em que figure_name dá nome ao arquivo da figura e args é a tupla de
+        argumentos passada a `figure_builder`.
+
+    output_dir : str, opcional
+        Diretório onde as figuras são salvas (criado se não existir). Se None (padrão), as figuras são exibidas com
+        `plt.show()`.
+
+    file_format : str, opcional
+        Formato dos arquivos salvos, 'png' ou 'svg' (padrão é 'png').
+
+    n_jobs : int, opcional
+        Número de processos entre os quais as figuras são renderizadas quando `output_dir` é informado (padrão é 1).
+
+    dpi : int, opcional
+        Resolução das figuras salvas em PNG (padrão é 100).
+
+    Retorno:
+    --------
+    list ou None
+        Caminhos dos arquivos salvos, na ordem de `figure_tasks`, quando `output_dir` é informado; caso contrário, None.
+
+    Erros:
+    -------
+    ValueError
+        É levantado se `file_format` não for 'png' ou 'svg'.
+
+    Notas:
+    ------
+    - Toda figura é fechada após ser exibida ou salva, evitando o acúmulo de memória das figuras abertas no pyplot.
+    - Com `n_jobs > 1`, cada processo usa o backend Agg; no processo atual (`n_jobs= 1`), as figuras são salvas com
+      o backend ativo, que é o Agg em ambientes sem interface gráfica.
+    """
+    if output_dir is None:
+        for _, args in figure_tasks:
+            fig = figure_builder(*args)
+            plt.show()
+            plt.close(fig)
+
+        return None
+
+    if file_format not in _FILE_FORMATS:
+        raise ValueError(f"Unsupported file format '{file_format}'. Expected one of {_FILE_FORMATS}.")
+
+    os.makedirs(output_dir, exist_ok= True)
+    render_tasks = [(figure_builder, args, _figure_file_path(output_dir, figure_name, file_format), dpi)
+                    for figure_name, args in figure_tasks]
+
+    if n_jobs <= 1 or len(render_tasks) <= 1:
+        return [_render_figure_to_file(render_task) for render_task in render_tasks]
+
+    with ProcessPoolExecutor(max_workers= n_jobs, initializer= _init_render_worker) as executor:
+        return list(executor.map(_render_figure_to_file, render_tasks))
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+
+# Versão do formato das métricas em cache: alterá-la invalida os arquivos gerados por versões anteriores
+_METRICS_CACHE_VERSION = 1
+
+
+def _dataframe_content_hash(df):
+    """
+    Calcula o hash do conteúdo de um DataFrame (valores, índice, nomes e tipos das colunas).
+
+    Parâmetros:
+    -----------
+    df : pd.DataFrame
+        DataFrame cujo conteúdo identifica o resultado em cache.
+
+    Retorno:
+    --------
+    str
+        Hash hexadecimal (BLAKE2b de 16 bytes) do conteúdo.
+    """
+    hasher = hashlib.blake2b(digest_size= 16)
+    hasher.update(repr((_METRICS_CACHE_VERSION, [str(column) for column in df.columns],
+                        [str(dtype) for dtype in df.dtypes])).encode())
+    # Hash vetorizado das linhas (valores e índice) em vez de serializar o DataFrame inteiro
+    hasher.update(pd.util.hash_pandas_object(df, index= True).to_numpy().tobytes())
+
+    return hasher.hexdigest()
+
+
+def _load_or_compute(cache_dir, cache_name, df, compute_func):
+    """
+    Retorna o resultado de `compute_func(df)` a partir do cache em disco, calculando-o e salvando-o apenas quando
+    não há arquivo para o conteúdo de `df`.
+
+    Parâmetros:
+    -----------
+    cache_dir : str ou None
+        Diretório do cache (criado se não existir). Se None, o resultado é sempre calculado.
+
+    cache_name : str
+        Prefixo do arquivo em cache, que identifica o tipo de resultado.
+
+    df : pd.DataFrame
+        DataFrame de entrada; o hash do seu conteúdo compõe o nome do arquivo.
+
+    compute_func : callable
+        Função que recebe `df` e retorna o resultado (serializável com pickle).
+
+    Retorno:
+    --------
+    object
+        O resultado de `compute_func(df)`.
+    """
+    if cache_dir is None:
+        return compute_func(df)
+
+    cache_path = os.path.join(cache_dir, f"{cache_name}_{_dataframe_content_hash(df)}.pkl")
+    if os.path.exists(cache_path):
+        return pd.read_pickle(cache_path)
+
+    result = compute_func(df)
+
+    # Escrita em arquivo temporário seguida de troca atômica: uma execução interrompida não deixa cache corrompido
+    os.makedirs(cache_dir, exist_ok= True)
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    pd.to_pickle(result, temporary_path)
+    os.replace(temporary_path, cache_path)
+
+    return result
+
+
+def _sorted_quantile(sorted_values, n_valid, quantile):
+    """
+    Calcula um quantil de cada linha de uma matriz já ordenada, com a interpolação linear do `np.percentile`
+    (a mesma usada pelo `quantile` do pandas), considerando apenas os `n_valid` primeiros valores de cada linha.
+
+    Parâmetros:
+    -----------
+    sorted_values : np.ndarray
+        Matriz (variáveis x observações) ordenada ao longo das linhas, com os valores ausentes ao final.
+
+    n_valid : np.ndarray
+        Quantidade de valores não ausentes de cada linha.
+
+    quantile : float
+        Quantil desejado, entre 0 e 1.
+
+    Retorno:
+    --------
+    np.ndarray
+        O quantil de cada linha (NaN para linhas sem valores).
+    """
+    rows = np.arange(sorted_values.shape[0])
+
+    # Posição virtual do quantil e pesos da interpolação entre os vizinhos, como no np.percentile
+    virtual_index = (n_valid - 1) * quantile
+    previous_index = np.floor(virtual_index)
+    gamma = virtual_index - previous_index
+    previous_index = np.clip(previous_index.astype(int), 0, None)
+    next_index = np.clip(np.minimum(previous_index + 1, n_valid - 1), 0, None)
+
+    previous_value = sorted_values[rows, previous_index]
+    next_value = sorted_values[rows, next_index]
+    difference = next_value - previous_value
+    quantile_values = np.where(gamma >= 0.5, next_value - difference * (1 - gamma), previous_value + difference * gamma)
+
+    return np.where(n_valid > 0, quantile_values, np.nan)
+
+
+def _compute_continuous_variables_metrics(numeric_vars_df):
+    n_vars, n_rows = numeric_vars_df.shape[1], numeric_vars_df.shape[0]
+    n_valid = numeric_vars_df.count().to_numpy()
+    rows = np.arange(n_vars)
+
+    # Uma única ordenação por variável (valores ausentes ao final) fornece mínimo, máximo, mediana, quartis e moda
+    sorted_values = np.full((n_vars, max(n_rows, 1)), np.nan)
+    for i in range(n_vars):
+        sorted_values[i, :n_rows] = numeric_vars_df.iloc[:, i].to_numpy(dtype= float, na_value= np.nan)
+    sorted_values.sort(axis= 1)
+
+    # Mediana como no np.median: elemento central ou média dos dois elementos centrais
+    lower_middle = sorted_values[rows, np.clip((n_valid - 1) // 2, 0, None)]
+    upper_middle = sorted_values[rows, np.clip(n_valid // 2, 0, None)]
+    median_values = np.where(n_valid % 2 == 1, upper_middle, (lower_middle + upper_middle) / 2)
+
+    # Moda: a primeira das sequências de valores repetidos mais longas, ou seja, o menor valor em caso de empate
+    mode_values = np.full(n_vars, np.nan)
+    for i in range(n_vars):
+        valid_values = sorted_values[i, :n_valid[i]]
+        if valid_values.size:
+            run_starts = np.flatnonzero(np.r_[True, valid_values[1:] != valid_values[:-1]])
+            run_lengths = np.diff(np.r_[run_starts, valid_values.size])
+            mode_values[i] = valid_values[run_starts[np.argmax(run_lengths)]]
+
+    metrics_df = pd.DataFrame({
+        'minimum': sorted_values[:, 0],
+        'maximum': sorted_values[rows, np.clip(n_valid - 1, 0, None)],
+        'mean': numeric_vars_df.mean().to_numpy(dtype= float, na_value= np.nan),
+        'median': np.where(n_valid > 0, median_values, np.nan),
+        'mode': mode_values,
+        'first_quartile': _sorted_quantile(sorted_values, n_valid, 0.25),
+        'third_quartile': _sorted_quantile(sorted_values, n_valid, 0.75)
+    }, index= numeric_vars_df.columns)
+
+    # Calcula intervalo interquartil e "fences" para detecção de outliers
+    interquartile_range = metrics_df['third_quartile'] - metrics_df['first_quartile']
+    metrics_df['lower_fence'] = np.maximum(metrics_df['first_quartile'] - (1.5 * interquartile_range), metrics_df['minimum'])
+    metrics_df['upper_fence'] = np.minimum(metrics_df['third_quartile'] + (1.5 * interquartile_range), metrics_df['maximum'])
+
+    return metrics_df
+
+
+def continuous_variables_metrics(numeric_vars_df, cache_dir= None):
+    """
+    Calcula as métricas descritivas de todas as variáveis contínuas de um DataFrame de uma só vez, com cache
+    opcional em disco indexado pelo conteúdo dos dados.
+
+    Parâmetros:
+    -----------
+    numeric_vars_df : pd.DataFrame
+        DataFrame contendo as variáveis numéricas contínuas.
+
+    cache_dir : str, opcional
+        Diretório do cache das métricas. Se informado, as métricas de um DataFrame com o mesmo conteúdo (valores,
+        índice, nomes e tipos das colunas) são lidas do disco em vez de recalculadas. Se None (padrão), as métricas
+        são sempre calculadas.
+
+    Retorno:
+    --------
+    metrics_df : pd.DataFrame
+        DataFrame com uma linha por variável e as colunas:
+        - 'minimum': valor mínimo
+        - 'maximum': valor máximo
+        - 'mean': valor médio
+        - 'median': valor mediano
+        - 'mode': valor modal (se houver mais de um, retorna o menor)
+        - 'first_quartile': primeiro quartil (25º percentil)
+        - 'third_quartile': terceiro quartil (75º percentil)
+        - 'lower_fence': limite inferior para detecção de outliers
+        - 'upper_fence': limite superior para detecção de outliers
+
+    Notas:
+    ------
+    - Os valores de cada variável são ordenados uma única vez; mínimo, máximo, mediana, quartis e moda são lidos da
+      matriz ordenada, com os mesmos resultados das reduções do pandas coluna a coluna.
+    - O hash do conteúdo percorre os dados uma vez (vetorizado) e é mais barato que a ordenação.
+    - Os arquivos em cache não expiram: o diretório pode ser apagado a qualquer momento para liberar espaço.
+
+    Exemplos de uso:
+    ----------------
+    >>> metrics_df = continuous_variables_metrics(df[['LotArea', 'GrLivArea']], cache_dir= '.eda_cache')
+    >>> metrics_df.loc['LotArea', 'upper_fence']
+    """
+    return _load_or_compute(cache_dir, 'continuous_metrics', numeric_vars_df, _compute_continuous_variables_metrics)
@@ -0,0 +1,499 @@
+import numpy as np
+import pandas as pd
+import scipy.stats as sts
+
+
+def _combine_moments(moments_a, moments_b):
+    """
+    Combina os momentos centrais de dois conjuntos de dados (fórmulas de Chan e Pébay).
+
+    Parâmetros:
+    -----------
+    moments_a, moments_b : tuple
+        Tuplas (n, média, M2, M3, M4), em que Mk é a soma das k-ésimas potências dos desvios em relação à média.
+
+    Retorno:
+    --------
+    tuple
+        Momentos do conjunto de dados combinado, no mesmo formato.
+    """
+    n_a, mean_a, m2_a, m3_a, m4_a = moments_a
+    n_b, mean_b, m2_b, m3_b, m4_b = moments_b
+    if n_a == 0:
+        return moments_b
+    if n_b == 0:
+        return moments_a
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+    m3 = (m3_a + m3_b + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+          + 3 * delta * (n_a * m2_b - n_b * m2_a) / n)
+    m4 = (m4_a + m4_b + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+          + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) / n ** 2
+          + 4 * delta * (n_a * m3_b - n_b * m3_a) / n)
+    return n, mean, m2, m3, m4
+
+
+def _chunk_moments(values):
+    # Momentos centrais de um bloco, calculados de forma vetorizada em relação à média do próprio bloco
+    n = len(values)
+    if n == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    mean = values.mean()
+    deviations = values - mean
+    squared = deviations ** 2
+    return n, mean, squared.sum(), (squared * deviations).sum(), (squared ** 2).sum()
+
+
+class _HyperLogLog:
+    """
+    Estimador HyperLogLog do número de valores distintos, com registros mergeáveis.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, hashes):
+        # Os primeiros bits do hash escolhem o registro; o restante define a posição do primeiro bit 1
+        suffix_bits = 64 - self.precision
+        indices = (hashes >> np.uint64(suffix_bits)).astype(np.int64)
+        suffixes = hashes & np.uint64((1 << suffix_bits) - 1)
+        bit_lengths = np.zeros(len(hashes), dtype=np.int64)
+        nonzero = suffixes > 0
+        bit_lengths[nonzero] = np.floor(np.log2(suffixes[nonzero].astype(np.float64))).astype(np.int64) + 1
+        ranks = (suffix_bits - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indices, ranks)
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m ** 2 / np.sum(2.0 ** -self.registers.astype(np.float64))
+        empty_registers = np.count_nonzero(self.registers == 0)
+        # Correção para cardinalidades pequenas (contagem linear)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            estimate = m * np.log(m / empty_registers)
+        return int(round(estimate))
+
+
+class _QuantileSketch:
+    """
+    Sketch de quantis no estilo KLL: cada nível guarda valores com peso 2^nível e, ao exceder a
+    capacidade, é ordenado e compactado (metade dos valores sobe para o nível seguinte). Enquanto
+    nenhum nível é compactado, os valores são guardados integralmente e os quantis são exatos.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._compactions = 0
+
+    @property
+    def is_exact(self):
+        return len(self.levels) == 1
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self.capacity:
+                values = np.sort(self.levels[level])
+                if len(values) % 2:
+                    values, remainder = values[:-1], values[-1:]
+                else:
+                    remainder = np.empty(0, dtype=np.float64)
+                # Alterna o deslocamento para que os erros das compactações se compensem
+                promoted = values[self._compactions % 2::2]
+                self._compactions += 1
+                self.levels[level] = remainder
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def weighted_values(self):
+        # Valores ordenados e seus pesos
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values_in_level), 2.0 ** level)
+                                  for level, values_in_level in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantiles(self, q):
+        values, weights = self.weighted_values()
+        if len(values) == 0:
+            return np.full(np.shape(q), np.nan)
+        # Posição de cada valor na amostra ordenada (o centro do seu peso), com interpolação linear
+        # entre posições, como o np.percentile; com pesos unitários, o resultado é idêntico
+        positions = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp(np.asarray(q) * (weights.sum() - 1), positions, values)
+
+
+class _ColumnStatistics:
+    """
+    Estatísticas acumuladas de uma coluna: contagens, momentos, valores distintos e quantis.
+    """
+
+    def __init__(self, exact_distinct_limit, quantile_capacity):
+        self.n_rows = 0
+        self.na_count = 0
+        self.zero_count = 0
+        self.is_numeric = True
+        self.moments = (0, 0.0, 0.0, 0.0, 0.0)
+        self.exact_distinct_limit = exact_distinct_limit
+        self.distinct_values = set()
+        self.distinct_sketch = None
+        self.quantile_sketch = _QuantileSketch(quantile_capacity)
+
+    def update(self, series):
+        self.n_rows += len(series)
+        na_mask = series.isna()
+        self.na_count += int(na_mask.sum())
+
+        # Apenas colunas int64/float64 em todos os blocos são tratadas como numéricas, como no caminho em memória
+        if self.is_numeric and series.dtype in (np.int64, np.float64):
+            values = series.to_numpy(dtype=np.float64)[~na_mask.to_numpy()]
+            self.zero_count += int(np.count_nonzero(values == 0))
+            self.moments = _combine_moments(self.moments, _chunk_moments(values))
+            self.quantile_sketch.update(values)
+        else:
+            self.is_numeric = False
+
+        self._update_distinct(series[~na_mask])
+
+    def _update_distinct(self, values):
+        if self.distinct_sketch is None:
+            self.distinct_values.update(pd.unique(values))
+            if len(self.distinct_values) <= self.exact_distinct_limit:
+                return
+            # Acima do limite, os valores distintos passam a ser estimados pelo HyperLogLog
+            self.distinct_sketch = _HyperLogLog()
+            self.distinct_sketch.update(pd.util.hash_array(np.array(list(self.distinct_values), dtype=object)))
+            self.distinct_values = set()
+        else:
+            self.distinct_sketch.update(pd.util.hash_array(pd.unique(values).astype(object)))
+
+    def merge(self, other):
+        self.n_rows += other.n_rows
+        self.na_count += other.na_count
+        self.zero_count += other.zero_count
+        self.is_numeric = self.is_numeric and other.is_numeric
+        self.moments = _combine_moments(self.moments, other.moments)
+        self.quantile_sketch.merge(other.quantile_sketch)
+
+        if self.distinct_sketch is None and other.distinct_sketch is None:
+            self._update_distinct(pd.Series(list(other.distinct_values), dtype=object))
+            return
+        if self.distinct_sketch is None:
+            self.distinct_sketch = _HyperLogLog()
+            self.distinct_sketch.update(pd.util.hash_array(np.array(list(self.distinct_values), dtype=object)))
+            self.distinct_values = set()
+        if other.distinct_sketch is None:
+            self.distinct_sketch.update(pd.util.hash_array(np.array(list(other.distinct_values), dtype=object)))
+        else:
+            self.distinct_sketch.merge(other.distinct_sketch)
+
+    def distinct_count(self):
+        # Como len(x.unique()), os valores faltantes contam como um valor distinto
+        count = len(self.distinct_values) if self.distinct_sketch is None else self.distinct_sketch.estimate()
+        return count + (self.na_count > 0)
+
+
+class StreamingStatistics:
+    """
+    Motor de estatísticas descritivas incremental, que consome um conjunto de dados em blocos (ex.: arquivos
+    CSV ou Parquet maiores que a memória) e acumula sketches mergeáveis por coluna:
+
+    - contagens de linhas, valores faltantes e valores zerados;
+    - média, variância, assimetria e curtose (momentos centrais combinados pelas fórmulas de Chan e Pébay);
+    - número de valores distintos (exato até `exact_distinct_limit`, estimado por HyperLogLog acima disso);
+    - quantis aproximados (sketch no estilo KLL, exato enquanto a coluna couber em `quantile_capacity` valores).
+
+    As estatísticas de blocos processados separadamente (ex.: em processos diferentes) podem ser combinadas com
+    `merge`. Os métodos de saída reproduzem as tabelas de `print_missing_values_in_dataframe`,
+    `print_zero_values_in_dataframe` e `descriptive_statistics_continuous_variables`.
+
+    Parâmetros:
+    -----------
+    exact_distinct_limit : int, opcional
+        Número máximo de valores distintos guardados por coluna para a contagem exata (padrão é 100.000).
+
+    quantile_capacity : int, opcional
+        Número de valores por nível do sketch de quantis (padrão é 65.536).
+
+    Exemplos de uso:
+    ----------------
+    >>> stats = StreamingStatistics()
+    >>> for chunk in pd.read_csv('churn.csv', chunksize=100_000):
+    ...     stats.update(chunk)
+    >>> stats.print_missing_values()
+    >>> stats.descriptive_statistics(['CreditScore', 'Age', 'Balance'])
+    """
+
+    def __init__(self, exact_distinct_limit=100_000, quantile_capacity=65_536):
+        self.exact_distinct_limit = exact_distinct_limit
+        self.quantile_capacity = quantile_capacity
+        self.columns = {}
+        self.n_rows = 0
+
+    def update(self, chunk):
+        """
+        Acumula as estatísticas de um bloco de linhas.
+
+        Parâmetros:
+        -----------
+        chunk : pd.DataFrame
+            Bloco do conjunto de dados, com as mesmas colunas dos demais blocos.
+
+        Retorno:
+        --------
+        StreamingStatistics
+            A própria instância, para encadeamento.
+        """
+        self.n_rows += len(chunk)
+        for column in chunk.columns:
+            if column not in self.columns:
+                self.columns[column] = _ColumnStatistics(self.exact_distinct_limit, self.quantile_capacity)
+            self.columns[column].update(chunk[column])
+        return self
+
+    def merge(self, other):
+        """
+        Combina as estatísticas acumuladas por outra instância (ex.: de outro processo ou de outro arquivo).
+
+        Parâmetros:
+        -----------
+        other : StreamingStatistics
+            Estatísticas de outra parte do mesmo conjunto de dados.
+
+        Retorno:
+        --------
+        StreamingStatistics
+            A própria instância, para encadeamento.
+        """
+        self.n_rows += other.n_rows
+        for column, column_stats in other.columns.items():
+            if column not in self.columns:
+                self.columns[column] = _ColumnStatistics(self.exact_distinct_limit, self.quantile_capacity)
+            self.columns[column].merge(column_stats)
+        return self
+
+    def missing_values(self):
+        """
+        Retorna o número e a porcentagem de valores faltantes das variáveis que possuem valores faltantes.
+
+        Retorno:
+        --------
+        pd.DataFrame
+            DataFrame indexado pelo nome da variável, com as colunas 'Faltantes' e 'Porcentagem'.
+        """
+        counts = pd.Series({column: stats.na_count for column, stats in self.columns.items()}, dtype=np.int64)
+        counts = counts[counts > 0]
+        return pd.DataFrame({'Faltantes': counts, 'Porcentagem': counts / self.n_rows * 100})
+
+    def zero_values(self):
+        """
+        Retorna o número e a porcentagem de valores zerados das variáveis numéricas que possuem valores zerados.
+
+        Retorno:
+        --------
+        pd.DataFrame
+            DataFrame indexado pelo nome da variável, com as colunas 'Zerados' e 'Porcentagem'.
+        """
+        counts = pd.Series({column: stats.zero_count for column, stats in self.columns.items() if stats.is_numeric},
+                           dtype=np.int64)
+        counts = counts[counts > 0]
+        return pd.DataFrame({'Zerados': counts, 'Porcentagem': counts / self.n_rows * 100})
+
+    def print_missing_values(self):
+        """
+        Exibe o número e a porcentagem de valores faltantes em cada variável, como `print_missing_values_in_dataframe`.
+
+        Retorno:
+        --------
+        None
+            A função não retorna nenhum valor. Ela exibe as informações sobre valores faltantes diretamente na saída.
+        """
+        missing_values = self.missing_values()
+        if len(missing_values) == 0:
+            print("O dataframe não possui valores faltantes")
+        else:
+            for variable, row in missing_values.iterrows():
+                print(f"'{variable}' possui {int(row['Faltantes'])} registros faltantes ({row['Porcentagem']:.2f}%)")
+
+        return None
+
+    def print_zero_values(self):
+        """
+        Exibe o número e a porcentagem de valores zerados em cada variável numérica, como
+        `print_zero_values_in_dataframe`.
+
+        Retorno:
+        --------
+        None
+            A função não retorna nenhum valor. Ela exibe as informações sobre valores zerados diretamente na saída.
+        """
+        zero_values = self.zero_values()
+        if len(zero_values) == 0:
+            print("O dataframe não possui valores faltantes")
+        else:
+            for variable, row in zero_values.iterrows():
+                print(f"'{variable}' possui {int(row['Zerados'])} registros zerados ({row['Porcentagem']:.2f}%)")
+
+        return None
+
+    def quantiles(self, column, q):
+        """
+        Retorna quantis (aproximados) de uma variável numérica.
+
+        Parâmetros:
+        -----------
+        column : str
+            Nome da variável.
+
+        q : float ou array-like
+            Quantil(is) entre 0 e 1.
+
+        Retorno:
+        --------
+        float ou np.ndarray
+            Quantil(is) da variável, com interpolação linear (exatos enquanto o sketch não foi compactado).
+        """
+        return self.columns[column].quantile_sketch.quantiles(q)
+
+    def descriptive_statistics(self, columns=None):
+        """
+        Calcula as mesmas estatísticas descritivas de `descriptive_statistics_continuous_variables`, a partir
+        das estatísticas acumuladas.
+
+        A variância, a assimetria e a curtose usam as mesmas correções do pandas. O teste de normalidade de
+        Kolmogorov-Smirnov é exato enquanto o sketch de quantis guarda todos os valores; depois disso, usa a
+        distribuição empírica aproximada pelo sketch.
+
+        Parâmetros:
+        -----------
+        columns : list, opcional
+            Variáveis numéricas analisadas (padrão: todas as variáveis numéricas).
+
+        Retorno:
+        --------
+        pd.DataFrame
+            DataFrame contendo as estatísticas descritivas para cada variável numérica, incluindo valores únicos,
+            desvio padrão, variância, assimetria, curtose e p-valor do teste de normalidade de Kolmogorov-Smirnov.
+        """
+        if columns is None:
+            columns = [column for column, stats in self.columns.items() if stats.is_numeric]
+
+        rows = {}
+        for column in columns:
+            stats = self.columns[column]
+            n, mean, m2, m3, m4 = stats.moments
+            variance = m2 / (n - 1) if n > 1 else np.nan
+
+            # Assimetria e curtose com as correções de viés do pandas (Series.skew e Series.kurtosis)
+            skewness = np.nan
+            if n > 2:
+                skewness = 0.0 if m2 == 0 else (m3 / n) / (m2 / n) ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+            kurtosis = np.nan
+            if n > 3:
+                kurtosis = 0.0 if m2 == 0 else (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                                                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+
+            rows[column] = {
+                'Valores Únicos': stats.distinct_count(),
+                'Desv. Padrão': np.sqrt(variance),
+                'Variância': variance,
+                'Assimetria': skewness,
+                'Curtose': kurtosis,
+                'Normalidade (p-value)': self._kolmogorov_pvalue(stats),
+            }
+
+        stats_df = pd.DataFrame.from_dict(rows, orient='index')
+
+        # Arredonda os valores para melhor apresentação
+        cols_to_round = ['Valores Únicos', 'Desv. Padrão', 'Variância', 'Assimetria', 'Curtose']
+        stats_df[cols_to_round] = stats_df[cols_to_round].round(3)
+
+        return stats_df
+
+    @staticmethod
+    def _kolmogorov_pvalue(stats):
+        # Teste de Kolmogorov-Smirnov dos valores padronizados (desvio padrão populacional, como o StandardScaler)
+        # Como no caminho em memória, o kstest de uma variável com valores faltantes resulta em NaN
+        n, mean, m2, _, _ = stats.moments
+        if n == 0 or m2 == 0 or stats.na_count > 0:
+            return np.nan
+        scale = np.sqrt(m2 / n)
+        sketch = stats.quantile_sketch
+        if sketch.is_exact:
+            values = sketch.levels[0]
+            return sts.kstest((values - values.mean()) / values.std(), 'norm').pvalue
+
+        values, weights = sketch.weighted_values()
+        cdf = sts.norm.cdf((values - mean) / scale)
+        cumulative = np.cumsum(weights) / weights.sum()
+        statistic = max(np.max(cumulative - cdf), np.max(cdf - (cumulative - weights / weights.sum())))
+        return sts.kstwo.sf(statistic, n)
+
+
+def streaming_statistics_from_file(path, chunk_size=100_000, columns=None, file_format=None, **kwargs):
+    """
+    Calcula as estatísticas de um arquivo CSV ou Parquet lendo-o em blocos, com memória limitada pelo tamanho do bloco.
+
+    Parâmetros:
+    -----------
+    path : str
+        Caminho do arquivo.
+
+    chunk_size : int, opcional
+        Número de linhas por bloco (padrão é 100.000).
+
+    columns : list, opcional
+        Colunas lidas do arquivo (padrão: todas).
+
+    file_format : str, opcional
+        'csv' ou 'parquet' (padrão: inferido pela extensão do arquivo).
+
+    **kwargs
+        Parâmetros repassados ao `StreamingStatistics` (ex.: `exact_distinct_limit`, `quantile_capacity`).
+
+    Retorno:
+    --------
+    StreamingStatistics
+        Estatísticas acumuladas de todo o arquivo.
+
+    Erros:
+    -------
+    ValueError
+        É levantado se o formato do arquivo não for suportado.
+    """
+    file_format = file_format or path.rsplit('.', 1)[-1].lower()
+    stats = StreamingStatistics(**kwargs)
+
+    if file_format == 'csv':
+        for chunk in pd.read_csv(path, chunksize=chunk_size, usecols=columns):
+            stats.update(chunk)
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            stats.update(record_batch.to_pandas())
+    else:
+        raise ValueError(f"Unsupported file format: '{file_format}'")
+
+    return stats